@@ -26,11 +26,14 @@
 
 set -u
 
-INPUT=$(cat)
+IFS= read -r -d '' INPUT || true
 
-# Extract tool_input.command. JSON shape:
+# Extract tool_input.command with a bash regex (no grep/sed forks). JSON shape:
 #   {"tool_input": {"command": "...", "description": "..."}, ...}
-COMMAND=$(echo "$INPUT" | grep -o '"command"[[:space:]]*:[[:space:]]*"[^"]*"' | head -1 | sed 's/.*"command"[[:space:]]*:[[:space:]]*"\([^"]*\)".*/\1/')
+COMMAND=""
+if [[ $INPUT =~ \"command\"[[:space:]]*:[[:space:]]*\"([^\"]*)\" ]]; then
+    COMMAND="${BASH_REMATCH[1]}"
+fi
 
 if [ -z "$COMMAND" ]; then
     exit 0
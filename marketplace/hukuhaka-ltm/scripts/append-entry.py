@@ -2,7 +2,9 @@
 """Append a new entry to the LTM log directory (L3 / raw timeline).
 
 Universal guardrails enforced here:
-  1. Every entry is timestamped (ISO 8601 UTC + local-day filename).
+  1. Every entry is timestamped (ISO 8601 UTC + local-day filename), and
+     filed under its month shard log/YYYY/MM/ (flat log/ in a store not
+     yet migrated — see distill.py migrate-log).
   2. Every entry has a stable id (filename slug + short hash).
   3. Every entry carries tier: l3. The `distilled-into` field is absent at
      creation (3-state pointer semantics — see distill.py cmd_reproject:
@@ -21,51 +23,20 @@ Project-declared shape (handled via flags, not hard-coded):
                   declared in ltm-append/SKILL.md — see CLAUDE.md L3 policy)
 
 Body source priority: stdin (if non-empty) > --title-only stub.
+
+The write itself (rendering, atomic write, index updates) lives in
+ltm_append.py, which the Stop hook imports to write a whole turn's
+entries in one process.
 """
 from __future__ import annotations
 
 import argparse
 import datetime as dt
-import hashlib
-import re
 import sys
 from pathlib import Path
 
-
-SLUG_RE = re.compile(r"[^a-z0-9]+")
-
-
-def slugify(text: str, max_len: int = 50) -> str:
-    text = text.lower().strip()
-    slug = SLUG_RE.sub("-", text).strip("-")
-    return slug[:max_len] or "entry"
-
-
-def make_id(slug: str, ts_iso: str) -> str:
-    """Stable short id: slug + 6-char hash of slug+timestamp."""
-    h = hashlib.sha256(f"{slug}|{ts_iso}".encode()).hexdigest()[:6]
-    return f"{slug}-{h}"
-
-
-def build_frontmatter(
-    *,
-    entry_id: str,
-    timestamp_iso: str,
-    kind: str | None,
-    supersedes: list[str],
-    autonomous: bool,
-) -> str:
-    lines = ["---", f"id: {entry_id}", f"timestamp: {timestamp_iso}"]
-    if kind:
-        lines.append(f"kind: {kind}")
-    lines.append("tier: l3")
-    if autonomous:
-        lines.append("autonomous: true")
-    if supersedes:
-        sup_yaml = ", ".join(supersedes)
-        lines.append(f"supersedes: [{sup_yaml}]")
-    lines.append("---")
-    return "\n".join(lines)
+from distill import entry_path, find_log_dir
+from ltm_append import append_entries, render_entry
 
 
 def main() -> int:
@@ -91,53 +62,31 @@ def main() -> int:
         print("append-entry: provide --title or --slug", file=sys.stderr)
         return 1
 
-    slug = args.slug or slugify(args.title)
-    now = dt.datetime.now(dt.timezone.utc)
-    ts_iso = now.strftime("%Y-%m-%dT%H:%M:%SZ")
-    day = now.strftime("%Y-%m-%d")
-
-    entry_id = make_id(slug, ts_iso)
-    supersedes = [s.strip() for s in args.supersedes.split(",") if s.strip()]
-
     body_stdin = ""
     if not sys.stdin.isatty():
         body_stdin = sys.stdin.read().strip()
 
-    body_parts: list[str] = []
-    if args.title:
-        body_parts.append(f"# {args.title}")
-    if body_stdin:
-        body_parts.append(body_stdin)
-    if not body_parts:
-        body_parts.append(f"# {slug}\n\n(no body provided)")
-    body = "\n\n".join(body_parts)
-
-    frontmatter = build_frontmatter(
-        entry_id=entry_id,
-        timestamp_iso=ts_iso,
-        kind=args.kind,
-        supersedes=supersedes,
-        autonomous=args.autonomous,
-    )
-    full = f"{frontmatter}\n\n{body}\n"
-
-    log_dir = Path(args.target_dir) / "log"
-    out_path = log_dir / f"{day}-{slug}.md"
+    spec = {
+        "title": args.title,
+        "slug": args.slug,
+        "kind": args.kind,
+        "body": body_stdin,
+        "supersedes": [s.strip() for s in args.supersedes.split(",") if s.strip()],
+        "autonomous": args.autonomous,
+    }
+    target = Path(args.target_dir)
 
     if args.dry_run:
-        print(f"[dry-run] would write: {out_path}")
+        name, _, full = render_entry(spec, dt.datetime.now(dt.timezone.utc))
+        print(f"[dry-run] would write: {entry_path(find_log_dir(target), name)}")
         print("---")
         print(full)
         return 0
 
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # Avoid silent overwrite — if the path already exists (rare slug
-    # collision within the same day), append a short disambiguator.
-    if out_path.exists():
-        out_path = log_dir / f"{day}-{slug}-{entry_id.split('-')[-1]}.md"
-
-    out_path.write_text(full, encoding="utf-8")
+    (out_path,) = append_entries(target, [spec])
+    if out_path is None:
+        print("append-entry: could not write the entry", file=sys.stderr)
+        return 1
     print(str(out_path))
     return 0
 
@@ -17,7 +17,7 @@ v0.4.0 split-of-responsibility:
 
 Operations:
 
-  reproject
+  reproject [--full]
       Walk all L2 cards in .claude/ltm/index/; build the truth map of
       {L3 id -> [card filenames]} from each card's `evidence:` list; sync
       every L3 entry's `distilled-into` field:
@@ -28,7 +28,30 @@ Operations:
       Also drops legacy `distilled: true|false` boolean field (one-shot
       migration for entries written by v0.1.x). Idempotent.
       Reports orphan citations to stderr (L2 evidence id with no matching
-      L3 file).
+      L3 file). Incremental via .reproject-manifest.json — only cards and
+      entries changed since the last run are read; `--full` re-reads all.
+      Archived entries count as existing; their distilled-into is kept in
+      archive/index.json, and one that loses every citation is restored.
+
+  migrate-log --to sharded|flat [--dry-run]
+      Move every L3 entry between the flat layout (log/<date>-<slug>.md)
+      and month shards (log/YYYY/MM/<date>-<slug>.md). Reversible; ids,
+      contents and mtimes are untouched, and the reproject manifest and
+      recall indexes are re-keyed rather than rebuilt. New entries go to
+      shards unless the store is still flat.
+
+  archive [--older-than DAYS] [--dry-run]
+      Pack L3 entries that some card cites and whose timestamp is older
+      than DAYS (default 180) into month archives, archive/YYYY-MM.l3.gz,
+      one gzip member per entry, indexed by id in archive/index.json.
+      log/ — and so every scan of it — keeps only the active window.
+
+  restore <id>...
+      Move archived entries back into log/.
+
+  show <id>
+      Print one L3 entry, from log/ or, inflating just its member, from
+      the archive. Evidence drill-down for ids not found under log/.
 
   pin scan
       Dump current pinned.md state as JSON:
@@ -63,25 +86,19 @@ L3 frontmatter schema (v0.2.0+):
 from __future__ import annotations
 
 import argparse
+import datetime as dt
+import gzip
+import io
 import json
+import os
 import re
 import sys
+import zlib
 from collections import defaultdict
 from pathlib import Path
 
 
-def parse_frontmatter(text: str) -> tuple[dict, str]:
-    """Return (frontmatter_dict, body). Naive — handles flat YAML only.
-
-    Recognised value shapes: scalar, `[a, b, c]` list (empty -> []).
-    """
-    if not text.startswith("---\n"):
-        return {}, text
-    end = text.find("\n---\n", 4)
-    if end == -1:
-        return {}, text
-    raw = text[4:end]
-    body = text[end + 5 :]
+def _parse_frontmatter_block(raw: str) -> dict:
     fm: dict = {}
     for line in raw.splitlines():
         line = line.rstrip()
@@ -95,10 +112,64 @@ def parse_frontmatter(text: str) -> tuple[dict, str]:
             fm[key] = [v.strip() for v in inner.split(",") if v.strip()] if inner else []
         else:
             fm[key] = value
-    return fm, body
+    return fm
 
 
-def write_with_frontmatter(path: Path, fm: dict, body: str) -> None:
+def parse_frontmatter(text: str) -> tuple[dict, str]:
+    """Return (frontmatter_dict, body). Naive — handles flat YAML only.
+
+    Recognised value shapes: scalar, `[a, b, c]` list (empty -> []).
+    """
+    if not text.startswith("---\n"):
+        return {}, text
+    end = text.find("\n---\n", 4)
+    if end == -1:
+        return {}, text
+    return _parse_frontmatter_block(text[4:end]), text[end + 5 :]
+
+
+# read_header() reads in chunks of this size and gives up on the bounded
+# path after HEADER_MAX_BYTES (a card with a very long evidence list) —
+# those files fall back to a whole-file read.
+HEADER_CHUNK = 512
+HEADER_MAX_BYTES = 16384
+
+
+def read_header(path: Path, body_bytes: int = 0) -> tuple[dict, str]:
+    """Return (frontmatter_dict, first `body_bytes` of the body) without
+    reading the rest of the file. Same parse as parse_frontmatter().
+
+    For callers that only need metadata (reproject, the metadata index):
+    an entry's body is usually most of its bytes, and none of them are
+    needed to learn its id or distilled-into.
+    """
+    with open(path, "rb", buffering=0) as f:
+        buf = f.read(HEADER_CHUNK)
+        if not buf.startswith(b"---\n"):
+            if len(buf) < body_bytes:
+                buf += f.read(body_bytes - len(buf))
+            return {}, buf[:body_bytes].decode("utf-8", errors="ignore")
+        end = buf.find(b"\n---\n", 4)
+        while end == -1 and len(buf) < HEADER_MAX_BYTES:
+            chunk = f.read(HEADER_CHUNK)
+            if not chunk:
+                break
+            # the delimiter may straddle the chunk boundary
+            end = (buf + chunk).find(b"\n---\n", max(4, len(buf) - 4))
+            buf += chunk
+        if end == -1 and len(buf) >= HEADER_MAX_BYTES:
+            buf += f.read()  # oversized frontmatter: whole file after all
+            end = buf.find(b"\n---\n", 4)
+        if end == -1:
+            return {}, buf[:body_bytes].decode("utf-8", errors="ignore")
+        body = buf[end + 5 :]
+        if len(body) < body_bytes:
+            body += f.read(body_bytes - len(body))
+    raw = buf[4:end].decode("utf-8", errors="ignore")
+    return _parse_frontmatter_block(raw), body[:body_bytes].decode("utf-8", errors="ignore")
+
+
+def render_with_frontmatter(fm: dict, body: str) -> str:
     lines = ["---"]
     for k, v in fm.items():
         if isinstance(v, list):
@@ -106,7 +177,11 @@ def write_with_frontmatter(path: Path, fm: dict, body: str) -> None:
         else:
             lines.append(f"{k}: {v}")
     lines.append("---")
-    path.write_text("\n".join(lines) + "\n\n" + body.lstrip("\n"), encoding="utf-8")
+    return "\n".join(lines) + "\n\n" + body.lstrip("\n")
+
+
+def write_with_frontmatter(path: Path, fm: dict, body: str) -> None:
+    path.write_text(render_with_frontmatter(fm, body), encoding="utf-8")
 
 
 def find_log_dir(target_dir: Path) -> Path:
@@ -117,92 +192,277 @@ def find_index_dir(target_dir: Path) -> Path:
     return target_dir / "index"
 
 
-def iter_log_entries(log_dir: Path):
+# L3 layout. Flat (stores written before sharding): log/<date>-<slug>.md.
+# Sharded: log/YYYY/MM/<date>-<slug>.md, so no one directory grows past a
+# month of entries. Readers accept both, and a half-migrated mix; writers
+# shard unless the store is still flat (see `migrate-log`).
+YEAR_RE = re.compile(r"^\d{4}$")
+MONTH_RE = re.compile(r"^\d{2}$")
+DATED_NAME_RE = re.compile(r"^(\d{4})-(\d{2})-\d{2}-.+\.md$")
+
+
+def _shard_dirs(log_dir: Path) -> list[Path]:
+    """log/YYYY/MM directories, oldest first."""
+    out: list[Path] = []
+    for year in sorted(p for p in log_dir.iterdir() if p.is_dir() and YEAR_RE.match(p.name)):
+        out.extend(sorted(p for p in year.iterdir() if p.is_dir() and MONTH_RE.match(p.name)))
+    return out
+
+
+def is_flat_store(log_dir: Path) -> bool:
+    """True when log/ still holds dated entries at its top level (unmigrated).
+    Undated names do not count: `migrate-log --to sharded` leaves them in
+    place, and they must not pin later writes to the flat layout."""
+    try:
+        with os.scandir(log_dir) as it:
+            return any(DATED_NAME_RE.match(e.name) and e.is_file() for e in it)
+    except OSError:
+        return False
+
+
+def entry_path(log_dir: Path, filename: str) -> Path:
+    """Where a new entry named `<date>-<slug>.md` belongs in this store."""
+    m = DATED_NAME_RE.match(filename)
+    if m is None or is_flat_store(log_dir):
+        return log_dir / filename
+    return log_dir / m.group(1) / m.group(2) / filename
+
+
+def log_files(log_dir: Path) -> list[Path]:
+    """Every L3 entry file, oldest first (by filename, across layouts)."""
     if not log_dir.is_dir():
-        return
-    for path in sorted(log_dir.glob("*.md")):
-        text = path.read_text(encoding="utf-8", errors="ignore")
-        fm, _ = parse_frontmatter(text)
-        yield path, fm
+        return []
+    files = list(log_dir.glob("*.md"))
+    for shard in _shard_dirs(log_dir):
+        files.extend(shard.glob("*.md"))
+    return sorted(files, key=lambda p: (p.name, p.as_posix()))
+
+
+def recent_log_files(log_dir: Path, n: int) -> list[Path]:
+    """The newest `n` entries, oldest first. Walks month shards newest-first
+    and stops once it has `n`, instead of listing the whole store."""
+    if n <= 0 or not log_dir.is_dir():
+        return []
+    files = list(log_dir.glob("*.md"))
+    found = 0
+    for shard in reversed(_shard_dirs(log_dir)):
+        batch = list(shard.glob("*.md"))
+        files.extend(batch)
+        found += len(batch)
+        if found >= n:
+            break
+    return sorted(files, key=lambda p: (p.name, p.as_posix()))[-n:]
 
 
 # ---------------------------------------------------------------------------
 # reproject
 # ---------------------------------------------------------------------------
 
-def _reproject_internal(target_dir: Path) -> dict:
+# Reproject manifest (gitignored, machine-local like .meta-state): what the
+# last reproject saw, keyed by file with its (mtime_ns, size) stamp, so the
+# next run re-reads only files whose stamp moved.
+#   {"version": 1,
+#    "cards":   {"<card>.md": {"stamp": [mtime_ns, size], "evidence": [ids]}},
+#    "entries": {"<entry>.md": {"stamp": [...], "id": str,
+#                               "into": [...] | "<scalar>" | null (absent),
+#                               "legacy": bool}}}
+MANIFEST_FILE = ".reproject-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _stamp(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_manifest(target_dir: Path) -> dict | None:
+    try:
+        data = json.loads((target_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return None
+    if not isinstance(data.get("cards"), dict) or not isinstance(data.get("entries"), dict):
+        return None
+    return data
+
+
+def _save_manifest(target_dir: Path, cards: dict, entries: dict) -> None:
+    path = target_dir / MANIFEST_FILE
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "cards": cards, "entries": entries},
+                       sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+    except OSError:
+        pass  # next run simply falls back to a full pass
+
+
+def _entry_record(path: Path, fm: dict) -> dict:
+    return {
+        "stamp": _stamp(path),
+        "id": fm.get("id") or re.sub(r"^\d{4}-\d{2}-\d{2}-", "", path.stem),
+        "into": fm.get("distilled-into"),
+        "legacy": "distilled" in fm,
+    }
+
+
+def _reproject_internal(target_dir: Path, full: bool = False) -> dict:
     """Reproject L3 distilled-into from L2 evidence. Return result dict.
 
     Idempotent. Migrates legacy `distilled: true|false` boolean by dropping
     it whenever the entry is rewritten. Overwrites scalar `distilled-into`
     values (v0.1.x shape) with lists.
+
+    Incremental by default: only cards and entries whose (mtime, size)
+    changed since the manifest are read, and only entries that changed or
+    whose citing cards changed are re-checked. `full` (or a missing /
+    unreadable manifest) reads everything; against an existing manifest it
+    also reports how many records had drifted from disk.
     """
     index_dir = find_index_dir(target_dir)
     log_dir = find_log_dir(target_dir)
+    manifest = None if full else _load_manifest(target_dir)
+    old_cards: dict = (manifest or {}).get("cards", {})
+    old_entries: dict = (manifest or {}).get("entries", {})
+    # --full verification: records whose stamp did not move but whose content
+    # did — exactly what an incremental pass would have missed
+    previous = _load_manifest(target_dir) if full else None
+    drift = 0
 
-    # 1. Build the truth table: L3 id -> [card filenames] (with index/ prefix)
-    citations: dict[str, list[str]] = defaultdict(list)
-    cards_scanned = 0
+    # 1. Cards: re-read only changed ones; the citation delta is every L3 id
+    #    an added, changed or removed card cites (before or after).
+    cards: dict[str, dict] = {}
+    delta_ids: set[str] = set()
+    cards_read = 0
     if index_dir.is_dir():
         for card_path in sorted(index_dir.glob("*.md")):
             if card_path.name == ".gitkeep":
                 continue
-            cards_scanned += 1
-            fm, _ = parse_frontmatter(card_path.read_text(encoding="utf-8"))
-            for eid in (fm.get("evidence") or []):
-                citations[eid].append(f"index/{card_path.name}")
+            stamp = _stamp(card_path)
+            rec = old_cards.get(card_path.name)
+            if rec is None or rec.get("stamp") != stamp:
+                fm, _ = read_header(card_path)
+                cards_read += 1
+                evidence = list(fm.get("evidence") or [])
+                old_ev = (rec or {}).get("evidence", [])
+                prev = (previous or {}).get("cards", {}).get(card_path.name)
+                if prev and prev.get("stamp") == stamp and prev.get("evidence") != evidence:
+                    drift += 1
+                if manifest is None or sorted(old_ev) != sorted(evidence):
+                    delta_ids.update(old_ev)
+                    delta_ids.update(evidence)
+                rec = {"stamp": stamp, "evidence": evidence}
+            cards[card_path.name] = rec
+    for name, rec in old_cards.items():
+        if name not in cards:
+            delta_ids.update(rec.get("evidence", []))
+
+    # Truth table: L3 id -> [card filenames] (with index/ prefix)
+    citations: dict[str, list[str]] = defaultdict(list)
+    for name, rec in cards.items():
+        for eid in rec.get("evidence", []):
+            citations[eid].append(f"index/{name}")
 
-    # 2. Sync each L3 entry's distilled-into; collect existing ids for orphan check.
-    existing_l3_ids: set[str] = set()
+    # 1b. Archived entries have no file to rewrite: their distilled-into
+    #     lives in archive/index.json. One that lost every citation goes
+    #     back to log/ as `distilled-into: []` for the next cycle to see.
+    archived = load_archive_index(target_dir)
+    archived_touched = 0
+    uncited: list[str] = []
+    for eid, arec in archived.items():
+        new_val = sorted(citations.get(eid, []))
+        if arec.get("into") != new_val:
+            arec["into"] = new_val
+            archived_touched += 1
+            if not new_val:
+                uncited.append(eid)
+    restored = _restore_archived(target_dir, archived, uncited) if uncited else []
+    if archived_touched and not restored:
+        _save_archive_index(target_dir, archived)
+
+    # 2. Entries: re-read changed ones; re-check those plus every entry whose
+    #    id is in the citation delta. Checks read the frontmatter only; the
+    #    body is read just for entries that get rewritten.
+    entries: dict[str, dict] = {}
     touched = 0
-    entries_scanned = 0
-    if log_dir.is_dir():
-        for path, fm in iter_log_entries(log_dir):
-            entries_scanned += 1
-            entry_id = fm.get("id") or re.sub(r"^\d{4}-\d{2}-\d{2}-", "", path.stem)
-            existing_l3_ids.add(entry_id)
-            new_val = sorted(citations.get(entry_id, []))
-            current = fm.get("distilled-into")
-            had_legacy_bool = "distilled" in fm
-
-            # Rewrite when: value changed, current isn't a list, or legacy
-            # boolean field is present (migration). The isinstance guard
-            # catches the v0.1.x scalar -> v0.2.x list schema shift.
-            needs_rewrite = (
-                current != new_val
-                or not isinstance(current, list)
-                or had_legacy_bool
-            )
-            if needs_rewrite:
-                # Re-read body for round-trip (iter_log_entries gave fm only).
-                _, body = parse_frontmatter(path.read_text(encoding="utf-8", errors="ignore"))
-                new_fm = {k: v for k, v in fm.items() if k != "distilled"}
-                # Also drop legacy distilled-into scalar pointer to ensure list shape
-                if not isinstance(new_fm.get("distilled-into"), list):
-                    new_fm.pop("distilled-into", None)
-                new_fm["distilled-into"] = new_val
-                write_with_frontmatter(path, new_fm, body)
-                touched += 1
+    entries_read = 0
+    for path in log_files(log_dir):
+        key = path.relative_to(log_dir).as_posix()
+        rec = old_entries.get(key)
+        opened = False
+        if rec is None or rec.get("stamp") != _stamp(path):
+            fm, _ = read_header(path)
+            entries_read += 1
+            opened = True
+            rec = _entry_record(path, fm)
+            prev = (previous or {}).get("entries", {}).get(key)
+            if prev and prev.get("stamp") == rec["stamp"] and prev != rec:
+                drift += 1
+        elif rec["id"] not in delta_ids:
+            entries[key] = rec
+            continue
+
+        new_val = sorted(citations.get(rec["id"], []))
+        current = rec.get("into")
+        # Rewrite when: value changed, current isn't a list, or legacy
+        # boolean field is present (migration). The isinstance guard
+        # catches the v0.1.x scalar -> v0.2.x list schema shift.
+        needs_rewrite = current != new_val or not isinstance(current, list) or rec.get("legacy")
+        if needs_rewrite:
+            text = path.read_text(encoding="utf-8", errors="ignore")
+            if not opened:
+                entries_read += 1
+            fm, body = parse_frontmatter(text)
+            new_fm = {k: v for k, v in fm.items() if k != "distilled"}
+            # Also drop legacy distilled-into scalar pointer to ensure list shape
+            if not isinstance(new_fm.get("distilled-into"), list):
+                new_fm.pop("distilled-into", None)
+            new_fm["distilled-into"] = new_val
+            write_with_frontmatter(path, new_fm, body)
+            touched += 1
+            rec = _entry_record(path, new_fm)
+        entries[key] = rec
 
     # 3. Orphan detection: card cites an L3 id that no longer exists.
+    existing_l3_ids = {rec["id"] for rec in entries.values()} | archived.keys()
     orphans: list[dict] = []
-    for cited_id, cards in citations.items():
+    for cited_id, cited_by in citations.items():
         if cited_id not in existing_l3_ids:
-            for c in cards:
+            for c in cited_by:
                 orphans.append({"card": c, "missing_id": cited_id})
 
+    _save_manifest(target_dir, cards, entries)
+    import ltm_index  # lazy: both index modules import this one
+    import ltm_search
+    if cards_read or entries_read or not (target_dir / ltm_index.INDEX_FILE).is_file():
+        ltm_index.refresh(target_dir)  # metadata index follows the rewritten distilled-into
+    if cards_read or entries_read or not (target_dir / ltm_search.DB_FILE).is_file():
+        ltm_search.refresh(target_dir)
     result = {
+        "mode": "incremental" if manifest is not None else "full",
         "reprojected": touched,
-        "cards_scanned": cards_scanned,
-        "entries_scanned": entries_scanned,
+        "cards_scanned": len(cards),
+        "entries_scanned": len(entries),
+        "cards_read": cards_read,
+        "entries_read": entries_read,
     }
+    if archived or restored:
+        result["archived_scanned"] = len(archived)
+        result["archived_reprojected"] = archived_touched
+        result["restored"] = len(restored)
+    if previous is not None:
+        result["manifest_drift"] = drift
     if orphans:
         result["orphans"] = orphans
     return result
 
 
-def cmd_reproject(target_dir: Path) -> int:
-    result = _reproject_internal(target_dir)
+def cmd_reproject(target_dir: Path, full: bool = False) -> int:
+    result = _reproject_internal(target_dir, full)
     for o in result.get("orphans", []):
         print(
             f"reproject: orphan — card {o['card']} cites missing L3 id {o['missing_id']}",
@@ -348,6 +608,416 @@ def cmd_pin_apply(args, target_dir: Path) -> int:
     return 1
 
 
+# ---------------------------------------------------------------------------
+# migrate-log — flat <-> sharded L3 layout
+# ---------------------------------------------------------------------------
+
+def _migration_plan(log_dir: Path, to: str) -> tuple[dict[Path, Path], list[str]]:
+    """({old path: new path}, [skipped names]) for moving every entry into
+    the `to` layout. Undated names cannot be sharded and stay flat."""
+    moves: dict[Path, Path] = {}
+    skipped: list[str] = []
+    for path in log_files(log_dir):
+        if to == "sharded":
+            m = DATED_NAME_RE.match(path.name)
+            if m is None:
+                if path.parent == log_dir:
+                    skipped.append(path.name)
+                continue
+            dest = log_dir / m.group(1) / m.group(2) / path.name
+        else:
+            dest = log_dir / path.name
+        if dest == path:
+            continue
+        if dest.exists() or dest in moves.values():
+            skipped.append(path.relative_to(log_dir).as_posix())
+            continue
+        moves[path] = dest
+    return moves, skipped
+
+
+def _rename_manifest_entries(target_dir: Path, log_dir: Path, moves: dict[Path, Path]) -> None:
+    manifest = _load_manifest(target_dir)
+    if manifest is None:
+        return
+    entries = manifest["entries"]
+    for old, new in moves.items():
+        rec = entries.pop(old.relative_to(log_dir).as_posix(), None)
+        if rec is not None:
+            entries[new.relative_to(log_dir).as_posix()] = rec
+    _save_manifest(target_dir, manifest["cards"], entries)
+
+
+def cmd_migrate_log(target_dir: Path, to: str, dry_run: bool = False) -> int:
+    """Move every L3 entry into the flat or the month-sharded layout.
+
+    Reversible: `--to flat` undoes `--to sharded`. Entry ids and contents
+    are untouched, and os.replace keeps mtimes, so the reproject manifest
+    and both recall indexes are re-keyed in place instead of re-read.
+    Refuses to overwrite: a name already present at its destination is
+    reported under `skipped` and left where it is."""
+    log_dir = find_log_dir(target_dir)
+    if not log_dir.is_dir():
+        print(json.dumps({"error": "no-log-dir", "path": str(log_dir)}))
+        return 1
+    moves, skipped = _migration_plan(log_dir, to)
+    result = {"layout": to, "moved": len(moves), "skipped": skipped}
+    if dry_run:
+        result["dry_run"] = True
+        print(json.dumps(result))
+        return 0
+
+    done: dict[Path, Path] = {}
+    try:
+        for old, new in moves.items():
+            new.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(old, new)
+            done[old] = new
+    finally:
+        # re-key whatever moved, even if a later move failed
+        _rename_manifest_entries(target_dir, log_dir, done)
+        import ltm_index  # lazy: both index modules import this one
+        import ltm_search
+        rel = {o.relative_to(target_dir).as_posix(): n.relative_to(target_dir).as_posix()
+               for o, n in done.items()}
+        ltm_index.rename_paths(target_dir, rel)
+        ltm_search.rename_paths(target_dir, rel)
+    if to == "flat":
+        _prune_shards(log_dir)
+    print(json.dumps(result))
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# archive — cold tier for distilled L3 entries
+# ---------------------------------------------------------------------------
+
+# Cold store (committed, like log/): archive/YYYY-MM.l3.gz holds one gzip
+# member per entry, appended in turn — still one valid gzip stream, so
+# `zcat archive/2026-01.l3.gz` reads the whole month. Each member carries
+# the entry's file name in its gzip header. archive/index.json maps ids to
+# members, so a lookup seeks to one member and inflates only that:
+#   {"version": 1,
+#    "entries": {"<id>": {"archive": "2026-01.l3.gz", "offset": int,
+#                         "length": int, "name": "<date>-<slug>.md",
+#                         "timestamp": str, "kind": str | null,
+#                         "title": str, "into": [...]}}}
+# `into` is the live distilled-into: reproject updates it here instead of
+# rewriting the compressed member, and read_archived() applies it. A
+# missing index is rebuilt from the members.
+ARCHIVE_SUFFIX = ".l3.gz"
+ARCHIVE_INDEX = "index.json"
+ARCHIVE_VERSION = 1
+ARCHIVE_AFTER_DAYS = 180
+
+
+def find_archive_dir(target_dir: Path) -> Path:
+    return target_dir / "archive"
+
+
+def _entry_id(fm: dict, name: str) -> str:
+    return fm.get("id") or re.sub(r"^\d{4}-\d{2}-\d{2}-", "", Path(name).stem)
+
+
+def _archive_record(archive: str, offset: int, length: int, name: str, text: str) -> dict:
+    fm, body = parse_frontmatter(text)
+    into = fm.get("distilled-into")
+    title = next((ln[2:].strip() for ln in body.splitlines() if ln.startswith("# ")), "")
+    return {"archive": archive, "offset": offset, "length": length, "name": name,
+            "timestamp": fm.get("timestamp") or name[:10], "kind": fm.get("kind"),
+            "title": title, "into": into if isinstance(into, list) else []}
+
+
+def _compress_member(name: str, raw: bytes) -> bytes:
+    buf = io.BytesIO()
+    with gzip.GzipFile(filename=name, mode="wb", fileobj=buf, mtime=0) as gz:
+        gz.write(raw)
+    return buf.getvalue()
+
+
+def _archive_members(path: Path):
+    """(offset, length, file name, text) for each complete member."""
+    data = path.read_bytes()
+    offset = 0
+    while offset < len(data):
+        d = zlib.decompressobj(wbits=31)
+        raw = d.decompress(data[offset:])
+        if not d.eof:
+            break  # torn tail of an interrupted append
+        length = len(data) - offset - len(d.unused_data)
+        name = ""
+        if data[offset + 3] & 0x08 and not data[offset + 3] & 0x04:  # FNAME, no FEXTRA
+            end = data.index(b"\0", offset + 10)
+            name = data[offset + 10:end].decode("latin-1")
+        yield offset, length, name, raw.decode("utf-8", errors="ignore")
+        offset += length
+
+
+def _rebuild_archive_index(target_dir: Path) -> dict[str, dict]:
+    records: dict[str, dict] = {}
+    for path in sorted(find_archive_dir(target_dir).glob("*" + ARCHIVE_SUFFIX)):
+        for offset, length, name, text in _archive_members(path):
+            fm, _ = parse_frontmatter(text)
+            records[_entry_id(fm, name)] = _archive_record(path.name, offset, length, name, text)
+    return records
+
+
+def load_archive_index(target_dir: Path) -> dict[str, dict]:
+    """{id: record} for every archived entry; {} when nothing is archived."""
+    archive_dir = find_archive_dir(target_dir)
+    try:
+        data = json.loads((archive_dir / ARCHIVE_INDEX).read_text(encoding="utf-8"))
+        if data.get("version") == ARCHIVE_VERSION and isinstance(data.get("entries"), dict):
+            return data["entries"]
+    except (OSError, json.JSONDecodeError, AttributeError):
+        pass
+    if not archive_dir.is_dir():
+        return {}
+    records = _rebuild_archive_index(target_dir)
+    if records:
+        try:
+            _save_archive_index(target_dir, records)
+        except OSError:
+            pass  # rebuilt again next time
+    return records
+
+
+def _save_archive_index(target_dir: Path, records: dict[str, dict]) -> None:
+    # one line per entry, so an archive run reads as a plain diff in git
+    rows = ",\n".join(f"  {json.dumps(k)}: {json.dumps(v, sort_keys=True)}"
+                      for k, v in sorted(records.items()))
+    path = find_archive_dir(target_dir) / ARCHIVE_INDEX
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(f'{{"version": {ARCHIVE_VERSION}, "entries": {{\n{rows}\n}}}}\n',
+                   encoding="utf-8")
+    tmp.replace(path)
+
+
+def _member_bytes(target_dir: Path, rec: dict) -> bytes:
+    with open(find_archive_dir(target_dir) / rec["archive"], "rb") as f:
+        f.seek(rec["offset"])
+        return gzip.decompress(f.read(rec["length"]))
+
+
+def read_archived(target_dir: Path, rec: dict) -> str:
+    """One archived entry's text, with its current distilled-into."""
+    text = _member_bytes(target_dir, rec).decode("utf-8", errors="ignore")
+    fm, body = parse_frontmatter(text)
+    if fm.get("distilled-into") == rec["into"] and "distilled" not in fm:
+        return text
+    fm.pop("distilled", None)
+    fm["distilled-into"] = rec["into"]
+    return render_with_frontmatter(fm, body)
+
+
+def archived_record(target_dir: Path, entry_id: str) -> dict | None:
+    """One id's archive record. The index is written one entry per line,
+    so this parses that line instead of every record."""
+    try:
+        text = (find_archive_dir(target_dir) / ARCHIVE_INDEX).read_text(encoding="utf-8")
+        needle = f"\n  {json.dumps(entry_id)}: "
+        at = text.find(needle)
+        if at != -1:
+            line = text[at + len(needle):text.find("\n", at + 1)]
+            return json.loads(line.rstrip(","))
+    except (OSError, json.JSONDecodeError):
+        pass
+    # reformatted, missing or unreadable index: the full parse decides
+    return load_archive_index(target_dir).get(entry_id)
+
+
+def find_entry(target_dir: Path, entry_id: str) -> tuple[str, str] | None:
+    """(location, text) of the L3 entry with this id — log/ first, then the
+    archive. Hot lookups go through the metadata index when there is one."""
+    import ltm_index  # lazy: ltm_index imports this module
+    try:
+        index_text = (target_dir / ltm_index.INDEX_FILE).read_text(encoding="utf-8")
+    except OSError:
+        index_text = None
+    if index_text is None:
+        candidates = log_files(find_log_dir(target_dir))
+    elif f'"id": {json.dumps(entry_id)}' in index_text:  # skip the parse for cold ids
+        candidates = [target_dir / k for k, r in (ltm_index.load_index(target_dir) or {}).items()
+                      if r.get("tier") == "l3" and r.get("id") == entry_id]
+    else:
+        candidates = []
+    for path in candidates:
+        try:
+            fm, _ = read_header(path)
+            if _entry_id(fm, path.name) == entry_id:
+                return str(path), path.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            continue
+    rec = archived_record(target_dir, entry_id)
+    if rec is None:
+        return None
+    where = f"{find_archive_dir(target_dir) / rec['archive']}#{rec['offset']}"
+    return where, read_archived(target_dir, rec)
+
+
+def _rewrite_archive(target_dir: Path, records: dict[str, dict], name: str) -> None:
+    """Compact one month archive down to the members `records` still lists."""
+    src = find_archive_dir(target_dir) / name
+    keep = sorted((r for r in records.values() if r["archive"] == name),
+                  key=lambda r: r["offset"])
+    if not keep:
+        src.unlink(missing_ok=True)
+        return
+    data = src.read_bytes()
+    tmp = src.with_name(f".{name}.tmp")
+    with open(tmp, "wb") as f:
+        for r in keep:
+            blob = data[r["offset"]:r["offset"] + r["length"]]
+            r["offset"] = f.tell()
+            f.write(blob)
+    os.replace(tmp, src)
+
+
+def _restore_archived(target_dir: Path, records: dict[str, dict], ids: list[str]) -> list[Path]:
+    """Move archived entries back into log/. A name already taken in log/
+    keeps the archived copy. Updates `records` and saves the index."""
+    log_dir = find_log_dir(target_dir)
+    restored: list[Path] = []
+    emptied: set[str] = set()
+    for eid in ids:
+        rec = records.get(eid)
+        if rec is None:
+            continue
+        path = entry_path(log_dir, rec["name"])
+        if path.exists():
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(read_archived(target_dir, rec), encoding="utf-8")
+        restored.append(path)
+        emptied.add(rec["archive"])
+        del records[eid]
+    for name in sorted(emptied):
+        _rewrite_archive(target_dir, records, name)
+    if restored:
+        _save_archive_index(target_dir, records)
+    return restored
+
+
+def _prune_shards(log_dir: Path) -> None:
+    for shard in reversed(_shard_dirs(log_dir)):
+        for d in (shard, shard.parent):
+            try:
+                d.rmdir()  # only succeeds once empty
+            except OSError:
+                pass
+
+
+def _drop_manifest_entries(target_dir: Path, log_dir: Path, paths: list[Path]) -> None:
+    manifest = _load_manifest(target_dir)
+    if manifest is None:
+        return
+    entries = manifest["entries"]
+    for path in paths:
+        entries.pop(path.relative_to(log_dir).as_posix(), None)
+    _save_manifest(target_dir, manifest["cards"], entries)
+
+
+def _refresh_recall_indexes(target_dir: Path) -> None:
+    import ltm_index  # lazy: both index modules import this one
+    import ltm_search
+    ltm_index.refresh(target_dir)
+    ltm_search.refresh(target_dir)
+
+
+def cmd_archive(target_dir: Path, older_than: int, dry_run: bool = False) -> int:
+    """Pack cited L3 entries older than `older_than` days into month archives.
+
+    Runs reproject first, so "cited" means cited by the cards as they are
+    now. Uncited entries (absent / []) stay in log/ for the next distill
+    cycle. An id that is already archived with identical bytes (an
+    interrupted earlier run) just loses its log/ copy; with different bytes
+    it is reported under `skipped` and left alone."""
+    import ltm_index  # lazy: ltm_index imports this module
+    log_dir = find_log_dir(target_dir)
+    if not log_dir.is_dir():
+        print(json.dumps({"error": "no-log-dir", "path": str(log_dir)}))
+        return 1
+    before = (dt.date.today() - dt.timedelta(days=older_than)).isoformat()
+    _reproject_internal(target_dir)
+    records = ltm_index.load_index(target_dir) or ltm_index.refresh(target_dir)
+    plan: dict[str, list[tuple[Path, str]]] = defaultdict(list)
+    for key, r in sorted(records.items(), key=lambda kr: (kr[1].get("timestamp") or "", kr[0])):
+        ts = r.get("timestamp") or ""
+        if r.get("tier") == "l3" and r.get("distilled") == "cited" \
+                and re.match(r"\d{4}-\d{2}-\d{2}", ts) and ts[:10] < before:
+            plan[ts[:7]].append((target_dir / key, r["id"]))
+    result: dict = {"before": before, "months": sorted(plan),
+                    "archived": sum(len(v) for v in plan.values()), "skipped": []}
+    if dry_run:
+        result["dry_run"] = True
+        print(json.dumps(result))
+        return 0
+
+    archive_dir = find_archive_dir(target_dir)
+    archive_dir.mkdir(exist_ok=True)
+    archived = load_archive_index(target_dir)
+    done: list[Path] = []
+    try:
+        for month, items in sorted(plan.items()):
+            name = f"{month}{ARCHIVE_SUFFIX}"
+            # bytes past the last indexed member are a torn or unindexed
+            # append from an interrupted run (whose entries are still in log/)
+            end = max((r["offset"] + r["length"] for r in archived.values()
+                       if r["archive"] == name), default=0)
+            with open(archive_dir / name, "ab") as f:
+                f.truncate(end)
+                f.seek(end)
+                for path, eid in items:
+                    raw = path.read_bytes()
+                    prev = archived.get(eid)
+                    if prev is not None:
+                        if _member_bytes(target_dir, prev) == raw:
+                            done.append(path)
+                        else:
+                            result["skipped"].append(path.relative_to(log_dir).as_posix())
+                        continue
+                    blob = _compress_member(path.name, raw)
+                    offset = f.tell()
+                    f.write(blob)
+                    archived[eid] = _archive_record(name, offset, len(blob), path.name,
+                                                    raw.decode("utf-8", errors="ignore"))
+                    done.append(path)
+                f.flush()
+                os.fsync(f.fileno())
+    finally:
+        # index before unlink: every entry stays reachable from one tier
+        if done:
+            _save_archive_index(target_dir, archived)
+    for path in done:
+        path.unlink()
+    result["archived"] = len(done)
+    _prune_shards(log_dir)
+    _drop_manifest_entries(target_dir, log_dir, done)
+    _refresh_recall_indexes(target_dir)
+    print(json.dumps(result))
+    return 0
+
+
+def cmd_restore(target_dir: Path, ids: list[str]) -> int:
+    """Move archived entries back into log/ (reverses `archive`)."""
+    archived = load_archive_index(target_dir)
+    missing = [eid for eid in ids if eid not in archived]
+    restored = _restore_archived(target_dir, archived, [e for e in ids if e in archived])
+    if restored:
+        _refresh_recall_indexes(target_dir)
+    print(json.dumps({"restored": [str(p) for p in restored], "not_archived": missing}))
+    return 1 if missing else 0
+
+
+def cmd_show(target_dir: Path, entry_id: str) -> int:
+    found = find_entry(target_dir, entry_id)
+    if found is None:
+        print(json.dumps({"error": "no-such-entry", "id": entry_id}))
+        return 1
+    sys.stdout.write(found[1])
+    return 0
+
+
 # ---------------------------------------------------------------------------
 # main
 # ---------------------------------------------------------------------------
@@ -359,10 +1029,41 @@ def main() -> int:
     p.add_argument("--target-dir", default=".claude/ltm", help="LTM root directory")
     sub = p.add_subparsers(dest="cmd", required=True)
 
-    sub.add_parser(
+    reproject_p = sub.add_parser(
         "reproject",
         help="sync L3 distilled-into from L2 evidence (idempotent, migration-safe)",
     )
+    reproject_p.add_argument(
+        "--full",
+        action="store_true",
+        help="re-read every card and entry, ignoring the manifest (verification)",
+    )
+
+    migrate_p = sub.add_parser(
+        "migrate-log",
+        help="move L3 entries between flat log/ and month shards log/YYYY/MM/",
+    )
+    migrate_p.add_argument("--to", required=True, choices=["sharded", "flat"])
+    migrate_p.add_argument("--dry-run", action="store_true", help="report moves only")
+
+    archive_p = sub.add_parser(
+        "archive",
+        help="pack cited L3 entries older than N days into archive/YYYY-MM.l3.gz",
+    )
+    archive_p.add_argument(
+        "--older-than",
+        type=int,
+        default=ARCHIVE_AFTER_DAYS,
+        metavar="DAYS",
+        help=f"age threshold by entry timestamp (default {ARCHIVE_AFTER_DAYS})",
+    )
+    archive_p.add_argument("--dry-run", action="store_true", help="report what would move")
+
+    restore_p = sub.add_parser("restore", help="move archived entries back into log/")
+    restore_p.add_argument("ids", nargs="+", metavar="ID")
+
+    show_p = sub.add_parser("show", help="print one L3 entry by id, hot or archived")
+    show_p.add_argument("id")
 
     pin_p = sub.add_parser("pin", help="L1 pinned.md operations")
     pin_sub = pin_p.add_subparsers(dest="pin_cmd", required=True)
@@ -386,7 +1087,15 @@ def main() -> int:
     target = Path(args.target_dir)
 
     if args.cmd == "reproject":
-        return cmd_reproject(target)
+        return cmd_reproject(target, args.full)
+    if args.cmd == "migrate-log":
+        return cmd_migrate_log(target, args.to, args.dry_run)
+    if args.cmd == "archive":
+        return cmd_archive(target, args.older_than, args.dry_run)
+    if args.cmd == "restore":
+        return cmd_restore(target, args.ids)
+    if args.cmd == "show":
+        return cmd_show(target, args.id)
     if args.cmd == "pin":
         if args.pin_cmd == "scan":
             return cmd_pin_scan(target)
@@ -0,0 +1,43 @@
+#!/usr/bin/env bash
+# hook-dispatch.sh — single entry point for this plugin's per-tool-call hooks.
+# Wired by hooks/hooks.json (pre-edit) and the ltm-append skill frontmatter
+# (pre-bash) as `hook-dispatch.sh <route>`.
+#
+# Per-tool-call hooks run on every agent action, so the dispatcher reads the
+# event JSON with a shell builtin and rejects payloads that cannot match with
+# a glob — no subprocess. Only a possible match is handed on (stdin = the
+# same event JSON) to the real nudge script, which re-checks exactly.
+#
+# Routes:
+#   pre-edit   PreToolUse Edit|Write|MultiEdit → overwrite-nudge.sh, only when
+#              the payload mentions .claude…ltm (L1/L2 nudge scope).
+#   pre-bash   PreToolUse Bash → append-entry-nudge.sh, only when the payload
+#              mentions append-entry.py.
+#
+# Always exits 0 — the nudges never block.
+set -u
+
+IFS= read -r -d '' IN || true
+case "${BASH_SOURCE[0]}" in  # parameter expansion, not $(dirname): no fork
+    */*) HERE="${BASH_SOURCE[0]%/*}" ;;
+    *) HERE=. ;;
+esac
+
+case "${1:-}" in
+    pre-edit)
+        case "$IN" in
+            *.claude*ltm*) ;;
+            *) exit 0 ;;
+        esac
+        exec bash "$HERE/overwrite-nudge.sh" <<<"$IN"
+        ;;
+    pre-bash)
+        case "$IN" in
+            *append-entry.py*) ;;
+            *) exit 0 ;;
+        esac
+        exec bash "$HERE/append-entry-nudge.sh" <<<"$IN"
+        ;;
+esac
+
+exit 0
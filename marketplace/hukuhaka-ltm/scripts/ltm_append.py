@@ -0,0 +1,148 @@
+"""L3 append — the write path shared by append-entry.py and the Stop hook.
+
+append_entries() writes any number of entries in one process:
+
+  - every entry is rendered first (timestamp, id, frontmatter, body), then
+    each file is written to a temp name and os.replace()d into place, so a
+    reader never sees a half-written entry and an existing file is never
+    overwritten (a same-day slug collision gets the id hash appended; an
+    id already on disk is re-rolled)
+  - the metadata index (ltm_index.py) and the full-text index
+    (ltm_search.py) are updated once for the whole batch
+
+Entry spec (dict):
+
+    title        one-line summary; becomes the body's H1 (optional if slug)
+    slug         kebab-case file/id stem (default: slugify(title))
+    kind         freeform kind string (optional)
+    body         markdown body below the H1 (optional)
+    supersedes   [entry ids]
+    autonomous   bool — Stop-hook closure-signal path
+
+Library module — the CLI is append-entry.py.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import os
+import re
+from pathlib import Path
+
+import ltm_index
+import ltm_search
+from distill import entry_path, find_log_dir, read_header
+
+
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(text: str, max_len: int = 50) -> str:
+    text = text.lower().strip()
+    slug = SLUG_RE.sub("-", text).strip("-")
+    return slug[:max_len] or "entry"
+
+
+def make_id(slug: str, ts_iso: str) -> str:
+    """Stable short id: slug + 6-char hash of slug+timestamp."""
+    h = hashlib.sha256(f"{slug}|{ts_iso}".encode()).hexdigest()[:6]
+    return f"{slug}-{h}"
+
+
+def build_frontmatter(
+    *,
+    entry_id: str,
+    timestamp_iso: str,
+    kind: str | None,
+    supersedes: list[str],
+    autonomous: bool,
+) -> str:
+    lines = ["---", f"id: {entry_id}", f"timestamp: {timestamp_iso}"]
+    if kind:
+        lines.append(f"kind: {kind}")
+    lines.append("tier: l3")
+    if autonomous:
+        lines.append("autonomous: true")
+    if supersedes:
+        sup_yaml = ", ".join(supersedes)
+        lines.append(f"supersedes: [{sup_yaml}]")
+    lines.append("---")
+    return "\n".join(lines)
+
+
+def render_entry(spec: dict, now: dt.datetime, taken: set[str] = frozenset()) -> tuple[str, str, str]:
+    """(file name, entry id, file text) for one spec. `taken` holds ids
+    already used in this batch: two same-slug entries written in the same
+    second would otherwise share an id."""
+    title = spec.get("title") or None
+    slug = spec.get("slug") or slugify(title or "")
+    ts_iso = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    entry_id = make_id(slug, ts_iso)
+    n = 1
+    while entry_id in taken:
+        n += 1
+        entry_id = make_id(slug, f"{ts_iso}#{n}")
+
+    body_parts: list[str] = []
+    if title:
+        body_parts.append(f"# {title}")
+    body = (spec.get("body") or "").strip()
+    if body:
+        body_parts.append(body)
+    if not body_parts:
+        body_parts.append(f"# {slug}\n\n(no body provided)")
+
+    frontmatter = build_frontmatter(
+        entry_id=entry_id,
+        timestamp_iso=ts_iso,
+        kind=spec.get("kind") or None,
+        supersedes=list(spec.get("supersedes") or []),
+        autonomous=bool(spec.get("autonomous")),
+    )
+    text = f"{frontmatter}\n\n" + "\n\n".join(body_parts) + "\n"
+    return f"{now.strftime('%Y-%m-%d')}-{slug}.md", entry_id, text
+
+
+def _write_new(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def append_entries(target_dir: Path, specs: list[dict]) -> list[Path | None]:
+    """Write one L3 entry per spec; returns each entry's path, or None for
+    a spec that could not be written (the rest of the batch still is)."""
+    now = dt.datetime.now(dt.timezone.utc)
+    log_dir = find_log_dir(target_dir)
+    taken: set[str] = set()
+    out: list[Path | None] = []
+    for spec in specs:
+        while True:
+            name, entry_id, text = render_entry(spec, now, taken)
+            taken.add(entry_id)
+            path = entry_path(log_dir, name)
+            if not path.exists():
+                break
+            # Same slug, same second, earlier process: the id is taken.
+            if read_header(path)[0].get("id") == entry_id:
+                continue
+            # Avoid silent overwrite — if the path already exists (rare slug
+            # collision within the same day), append a short disambiguator.
+            path = path.with_name(f"{path.stem}-{entry_id.split('-')[-1]}.md")
+            if not path.exists():
+                break
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_new(path, text)
+        except OSError:
+            out.append(None)
+            continue
+        out.append(path)
+    written = [p for p in out if p is not None]
+    if written:
+        ltm_index.update_paths(target_dir, written)
+        ltm_search.update_paths(target_dir, written)
+    return out
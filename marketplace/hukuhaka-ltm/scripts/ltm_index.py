@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""LTM metadata index — one JSON file instead of a frontmatter read per file.
+
+Keeps the filterable metadata of every L2 card and L3 entry under log/ in
+`.claude/ltm/.ltm-index.json`, so recall can select files before reading
+any of them. Building a record reads the frontmatter and the first
+LEAD_BYTES of the body (distill.read_header), never the whole entry.
+Maintained by the writers, and checked by the reader:
+
+  - ltm_append.py     adds the entries it just wrote (update_paths) — for
+                      append-entry.py and the Stop hook alike
+  - distill.py        refreshes after reproject rewrites `distilled-into`
+  - refresh           stat()s every file and re-reads only those whose
+                      (mtime_ns, size) stamp moved — picks up hand edits and
+                      card writes; a missing index is built this way
+  - query             refreshes before answering, so entries that arrived
+                      without a writer (git pull, hand-written) are listed
+                      and deleted ones are not
+
+Record (keyed by path relative to the LTM root, e.g. `log/2026/05/<file>.md`):
+
+    tier          l3 | l2
+    id            L3 `id` (filename slug fallback) / L2 card stem
+    timestamp     L3 `timestamp` (filename date if missing) / L2 `last-updated`
+    kind          L3 `kind` (L2: null)
+    autonomous    bool
+    supersedes    [ids]
+    distilled     L3 only: "absent" | "uncited" ([]) | "cited" ([paths])
+                  (legacy `distilled: true` counts as cited)
+    distilled_into [paths]
+    evidence      L2 only: [L3 ids]
+    title         first `# ` heading of the body (L2: `topic`)
+    summary       L2 `summary`; L3 first prose line of the body (≤160 chars)
+
+Usage:
+    python3 ltm_index.py [--target-dir D] refresh
+    python3 ltm_index.py [--target-dir D] query [--tier l2|l3] [--kind K]
+        [--since DATE] [--until DATE] [--undistilled | --cited] [--current]
+        [--autonomous] [--limit N] [--paths | --json]
+
+query prints matches oldest → newest (the newest N with --limit), one per
+line: `path<TAB>timestamp<TAB>kind<TAB>distilled<TAB>title`.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from distill import find_index_dir, find_log_dir, log_files, read_header, recent_log_files
+
+INDEX_FILE = ".ltm-index.json"
+INDEX_VERSION = 1
+SUMMARY_CHARS = 160
+LEAD_BYTES = 1024  # body prefix read for the title and first prose line
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+# ---------------------------------------------------------------------------
+# records
+# ---------------------------------------------------------------------------
+
+def _stamp(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _title_and_lead(body: str) -> tuple[str, str]:
+    title = ""
+    lead = ""
+    for line in body.splitlines():
+        s = line.strip()
+        if not s:
+            continue
+        if s.startswith("# ") and not title:
+            title = s[2:].strip()
+        elif not s.startswith("#") and not lead:
+            lead = s[:SUMMARY_CHARS]
+        if title and lead:
+            break
+    return title, lead
+
+
+def _as_list(value) -> list[str]:
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
+def build_record(root: Path, path: Path) -> dict | None:
+    try:
+        stamp = _stamp(path)
+        fm, body = read_header(path, LEAD_BYTES)
+    except OSError:
+        return None
+    title, lead = _title_and_lead(body)
+    rec: dict = {"stamp": stamp, "autonomous": fm.get("autonomous") == "true",
+                 "supersedes": _as_list(fm.get("supersedes"))}
+    if path.parent == find_index_dir(root):
+        rec.update(tier="l2", id=path.stem, timestamp=fm.get("last-updated", ""),
+                   kind=None, title=fm.get("topic") or title or path.stem,
+                   summary=fm.get("summary", "") or lead,
+                   evidence=_as_list(fm.get("evidence")))
+        return rec
+    ts = fm.get("timestamp") or ""
+    into = fm.get("distilled-into")
+    if into is None:
+        distilled = "cited" if fm.get("distilled") == "true" else "absent"
+    else:
+        distilled = "cited" if _as_list(into) else "uncited"
+    rec.update(tier="l3",
+               id=fm.get("id") or re.sub(r"^\d{4}-\d{2}-\d{2}-", "", path.stem),
+               timestamp=ts if DATE_RE.match(ts) else path.name[:10],
+               kind=fm.get("kind"), distilled=distilled,
+               distilled_into=_as_list(into), title=title or path.stem, summary=lead)
+    return rec
+
+
+def _all_files(root: Path) -> list[Path]:
+    index_dir = find_index_dir(root)
+    cards = sorted(index_dir.glob("*.md")) if index_dir.is_dir() else []
+    return cards + log_files(find_log_dir(root))
+
+
+# ---------------------------------------------------------------------------
+# index file
+# ---------------------------------------------------------------------------
+
+def load_index(root: Path) -> dict[str, dict] | None:
+    try:
+        data = json.loads((root / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    records = data.get("records")
+    return records if isinstance(records, dict) else None
+
+
+def save_index(root: Path, records: dict[str, dict]) -> None:
+    path = root / INDEX_FILE
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "records": records},
+                                  sort_keys=True) + "\n", encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass  # the index is derived state; the next refresh rebuilds it
+
+
+def refresh(root: Path, old: dict[str, dict] | None = None) -> dict[str, dict]:
+    """Bring the index in line with disk, re-reading only restamped files.
+    `old` is the index when the caller has already loaded it."""
+    old = (load_index(root) if old is None else old) or {}
+    records: dict[str, dict] = {}
+    dirty = False
+    for path in _all_files(root):
+        key = path.relative_to(root).as_posix()
+        rec = old.get(key)
+        try:
+            fresh = rec is not None and rec.get("stamp") == _stamp(path)
+        except OSError:
+            continue
+        if not fresh:
+            rec = build_record(root, path)
+            if rec is None:
+                continue
+            dirty = True
+        records[key] = rec
+    if dirty or records.keys() != old.keys():
+        save_index(root, records)
+    return records
+
+
+def update_paths(root: Path, paths: list[Path]) -> None:
+    """Index just-written files. Best-effort: a failure never fails the
+    caller's write, and a missing index is built in full instead."""
+    try:
+        records = load_index(root)
+        if records is None:
+            refresh(root)
+            return
+        for path in paths:
+            rec = build_record(root, path)
+            if rec is not None:
+                records[path.relative_to(root).as_posix()] = rec
+        save_index(root, records)
+    except (OSError, ValueError):
+        pass
+
+
+def rename_paths(root: Path, renames: dict[str, str]) -> None:
+    """Re-key records for moved files ({old key: new key}, relative to the
+    LTM root). A move keeps mtime and size, so nothing is re-read."""
+    records = load_index(root)
+    if records is None or not renames:
+        return
+    for old, new in renames.items():
+        rec = records.pop(old, None)
+        if rec is not None:
+            records[new] = rec
+    save_index(root, records)
+
+
+# ---------------------------------------------------------------------------
+# query
+# ---------------------------------------------------------------------------
+
+def query(records: dict[str, dict], *, tier=None, kind=None, since=None, until=None,
+          undistilled=False, cited=False, current=False, autonomous=False,
+          limit=None) -> list[tuple[str, dict]]:
+    superseded = {s for r in records.values() for s in r.get("supersedes", [])} if current else set()
+    out: list[tuple[str, dict]] = []
+    for key, r in records.items():
+        if tier and r["tier"] != tier:
+            continue
+        if kind and r.get("kind") != kind:
+            continue
+        ts = r.get("timestamp") or ""
+        if since and ts[: len(since)] < since:
+            continue
+        if until and ts[: len(until)] > until:
+            continue
+        if undistilled and r.get("distilled") not in ("absent", "uncited"):
+            continue
+        if cited and r.get("distilled") != "cited":
+            continue
+        if current and r["id"] in superseded:
+            continue
+        if autonomous and not r.get("autonomous"):
+            continue
+        out.append((key, r))
+    out.sort(key=lambda kr: (kr[1].get("timestamp") or "", kr[0]))
+    if limit is not None:
+        out = out[-limit:] if limit > 0 else []
+    return out
+
+
+def _recency_only(args) -> bool:
+    return (args.tier == "l3" and args.limit is not None and not any(
+        (args.kind, args.since, args.until, args.undistilled, args.cited,
+         args.current, args.autonomous)))
+
+
+def cmd_query(args, root: Path) -> int:
+    records = load_index(root)
+    if records is None and _recency_only(args):
+        # no index yet: the newest month shards answer "newest N" without
+        # reading — or listing — the rest of the store
+        records = {}
+        for path in recent_log_files(find_log_dir(root), args.limit):
+            rec = build_record(root, path)
+            if rec is not None:
+                records[path.relative_to(root).as_posix()] = rec
+    else:
+        # the writers keep the index current, but not every entry comes
+        # through one (git pull, hand-written, hand-deleted): one stat per
+        # file, re-reading only what moved
+        records = refresh(root, records)
+    rows = query(records, tier=args.tier, kind=args.kind, since=args.since, until=args.until,
+                 undistilled=args.undistilled, cited=args.cited, current=args.current,
+                 autonomous=args.autonomous, limit=args.limit)
+    for key, r in rows:
+        path = root / key
+        if args.json:
+            print(json.dumps({"path": str(path), **{k: v for k, v in r.items() if k != "stamp"}}))
+        elif args.paths:
+            print(path)
+        else:
+            print("\t".join([str(path), r.get("timestamp") or "", r.get("kind") or "-",
+                             r.get("distilled", r["tier"]), r.get("title", "")]))
+    return 0
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    p.add_argument("--target-dir", default=".claude/ltm", help="LTM root directory")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("refresh", help="re-index files changed since the last refresh")
+    q = sub.add_parser("query", help="filter entries/cards by metadata")
+    q.add_argument("--tier", choices=["l2", "l3"])
+    q.add_argument("--kind")
+    q.add_argument("--since", help="ISO date/time prefix, inclusive")
+    q.add_argument("--until", help="ISO date/time prefix, inclusive")
+    state = q.add_mutually_exclusive_group()
+    state.add_argument("--undistilled", action="store_true",
+                       help="L3 entries no card cites (distilled-into absent or [])")
+    state.add_argument("--cited", action="store_true", help="L3 entries some card cites")
+    q.add_argument("--current", action="store_true", help="drop superseded ids")
+    q.add_argument("--autonomous", action="store_true", help="only autonomous: true")
+    q.add_argument("--limit", type=int, help="newest N matches")
+    out = q.add_mutually_exclusive_group()
+    out.add_argument("--paths", action="store_true", help="print paths only")
+    out.add_argument("--json", action="store_true", help="one JSON record per line")
+    args = p.parse_args()
+
+    root = Path(args.target_dir)
+    if not root.is_dir():
+        print(f"ltm_index: no LTM directory at {root}", file=sys.stderr)
+        return 0
+    if args.cmd == "refresh":
+        records = refresh(root)
+        print(json.dumps({"indexed": len(records)}))
+        return 0
+    return cmd_query(args, root)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
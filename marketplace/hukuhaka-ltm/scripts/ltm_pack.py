@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""SessionStart payload packer — what session-start-inject.sh injects.
+
+The payload has three sources: the previous session's auto-record digest,
+pinned.md (L1) and the using-hukuhaka-ltm SKILL.md. When they fit in the
+budget they are emitted verbatim, joined by `---` rules. When they do not,
+each source is split into items instead of being dropped whole:
+
+    digest   one item per `- [kind] title → path` line
+    pinned   one item per list item (`-`, `*`, `+` or `1.`, continuation
+             lines included) and per prose paragraph outside a list; `#`
+             headings travel with the first item kept below them
+    skill    one item per `## ` section; the H1 and intro travel with them
+
+and items are ranked by priority, then recency:
+
+    digest lines         3   newest DIGEST_TOP, newest (last appended) first
+                         1.25 older ones — the archive has them all
+    pinned `## Core`     2   file order (also bullets before any heading)
+    pinned other         1.5 file order (`## Promotion log`: 0.5, newest first)
+    skill sections       1   document order
+
+Items are taken greedily in rank order — one that does not fit is skipped
+and smaller ones below it still get their chance — then rendered in their
+original order. Nothing is cut mid-item. A closing note lists what was
+left out and where to read it.
+
+Budget is in characters of the combined text, before the
+`<hukuhaka-ltm-context>` wrapper, as before.
+
+Usage:
+    python3 ltm_pack.py --budget N [--digest F] [--digest-archive F]
+                        [--pinned F] [--skill F] [--format claude|cursor|generic]
+
+Prints the hook's JSON (nothing if there is nothing to inject).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+SEP = "\n\n---\n\n"
+DIGEST_TOP = 20
+DIGEST_WEIGHT = 3.0
+DIGEST_OLD_WEIGHT = 1.25
+CORE_WEIGHT = 2.0
+PINNED_WEIGHT = 1.5
+PROMOTION_WEIGHT = 0.5
+SKILL_WEIGHT = 1.0
+LIST_ITEM = re.compile(r"(?:[-*+]|\d+[.)])\s")
+
+
+@dataclass
+class Item:
+    group: int            # index into Source.groups
+    lines: list[str]
+    score: float
+    label: str            # first line / section heading
+    kept: bool = False
+
+
+@dataclass
+class Source:
+    name: str
+    head: list[str] = field(default_factory=list)     # emitted if anything is
+    groups: list[list[str]] = field(default_factory=list)  # per-group lead text
+    items: list[Item] = field(default_factory=list)
+
+    def render(self) -> str:
+        kept = [i for i in self.items if i.kept]
+        if not kept:
+            return ""
+        lines = list(self.head)
+        opened: set[int] = set()
+        for item in kept:
+            if item.group not in opened:
+                opened.add(item.group)
+                lines.extend(self.groups[item.group])
+            lines.extend(item.lines)
+        return "\n".join(lines).strip("\n")
+
+
+# ---------------------------------------------------------------------------
+# sources
+# ---------------------------------------------------------------------------
+
+def read(path: str | None) -> str:
+    if not path:
+        return ""
+    try:
+        return Path(path).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+def strip_frontmatter(text: str) -> str:
+    """The body below the YAML frontmatter."""
+    lines = text.splitlines()
+    fences = [n for n, line in enumerate(lines) if line == "---"]
+    if len(fences) < 2:
+        return ""
+    return "\n".join(lines[fences[1] + 1:])
+
+
+def digest_section(text: str) -> tuple[str, Source]:
+    lines = [line for line in text.splitlines() if line.strip()]
+    full = (f"## Auto-recorded since last session ({len(lines)} entries)\n\n"
+            f"Review via `/ltm:distill`.\n\n" + "\n".join(lines)) if lines else ""
+    src = Source("digest", head=full.split("\n")[:4], groups=[[]])
+    for n, line in enumerate(lines):
+        age = len(lines) - n - 1
+        weight = DIGEST_WEIGHT if age < DIGEST_TOP else DIGEST_OLD_WEIGHT
+        src.items.append(Item(0, [line], weight + (n + 1) / (len(lines) + 1) / 4, line))
+    return full, src
+
+
+def pinned_section(text: str) -> tuple[str, Source]:
+    src = Source("pinned")
+    lines = text.rstrip("\n").split("\n") if text.strip() else []
+    heading = ""
+    lead: list[str] = []          # text since the section heading, before an item
+    current: Item | None = None
+    in_list = False               # current is a list item, not a paragraph
+    open_item = False             # the next prose line continues current
+    blanks: list[str] = []        # held until we know what they separate
+    order = 0
+    for line in lines:
+        if not line.strip() and current is not None:
+            blanks.append(line)
+            # a blank line ends a paragraph; prose after a list item stays
+            # with the item
+            open_item = in_list
+            continue
+        if line.startswith("## "):
+            heading = line[3:].strip().lower()
+            current = None
+            open_item = False
+            lead = blanks + [line]
+            blanks = []
+            src.groups.append(lead)
+            continue
+        if current is None and (not line.strip() or line.startswith("# ")):
+            (lead if src.groups else src.head).append(line)
+            continue
+        starts_item = LIST_ITEM.match(line) is not None
+        if starts_item or not open_item:
+            # a list item, or prose no list item claims: its own item, so a
+            # pinned.md without `- ` bullets still packs piece by piece
+            if not src.groups:
+                lead = []
+                src.groups.append(lead)
+            order += 1
+            if heading in ("", "core"):
+                score = CORE_WEIGHT + 1 / (order + 1)
+            elif heading.startswith("promotion log"):
+                score = PROMOTION_WEIGHT + order / (len(lines) + 1)
+            else:
+                score = PINNED_WEIGHT + 1 / (order + 1)
+            current = Item(len(src.groups) - 1, blanks + [line], score, line)
+            in_list = starts_item
+            open_item = True
+            blanks = []
+            src.items.append(current)
+            continue
+        # continuation, or prose after a list item: keep it with the item
+        current.lines.extend(blanks + [line])
+        blanks = []
+    return text.rstrip("\n") if text.strip() else "", src
+
+
+def skill_section(text: str) -> tuple[str, Source]:
+    body = text.rstrip("\n")
+    src = Source("skill", groups=[[]])
+    sections: list[list[str]] = []
+    for line in body.split("\n") if body else []:
+        if line.startswith("## "):
+            sections.append([line])
+        elif sections:
+            sections[-1].append(line)
+        else:
+            src.head.append(line)
+    for n, sec in enumerate(sections):
+        src.items.append(Item(0, sec, SKILL_WEIGHT + 1 / (n + 2), sec[0][3:].strip()))
+    return body, src
+
+
+# ---------------------------------------------------------------------------
+# packing
+# ---------------------------------------------------------------------------
+
+def combine(parts: list[str]) -> str:
+    return SEP.join(p for p in parts if p)
+
+
+def omission_note(sources: list[Source], digest_archive: str | None) -> str:
+    notes: list[str] = []
+    for src in sources:
+        dropped = [i for i in src.items if not i.kept]
+        if not dropped:
+            continue
+        if src.name == "digest":
+            where = f" — full list in `{digest_archive}`" if digest_archive else ""
+            notes.append(f"- {len(dropped)} of {len(src.items)} digest entries{where}")
+        elif src.name == "pinned":
+            notes.append(f"- {len(dropped)} of {len(src.items)} pinned items"
+                         f" — read `.claude/ltm/pinned.md`")
+        else:
+            names = ", ".join(i.label for i in dropped)
+            notes.append(f"- skill sections: {names}"
+                         f" — activate the using-hukuhaka-ltm skill for the full map")
+    if not notes:
+        return ""
+    return "## Omitted to fit the session-start budget\n\n" + "\n".join(notes)
+
+
+def pack(sources: list[Source], budget: int, digest_archive: str | None) -> str:
+    ranked = sorted((i for s in sources for i in s.items), key=lambda i: -i.score)
+
+    def render() -> str:
+        return combine([s.render() for s in sources] + [omission_note(sources, digest_archive)])
+
+    for item in ranked:
+        item.kept = True
+        if len(render()) > budget:
+            item.kept = False
+    # the note grows as items drop out; give back the lowest-ranked keeps
+    # until body and note fit together
+    for item in reversed(ranked):
+        if len(render()) <= budget:
+            break
+        item.kept = False
+    text = render()
+    return text if len(text) <= budget else ""
+
+
+def build(args) -> str:
+    digest_full, digest = digest_section(read(args.digest))
+    pinned_full, pinned = pinned_section(read(args.pinned))
+    skill_full, skill = skill_section(strip_frontmatter(read(args.skill)))
+    combined = combine([digest_full, pinned_full, skill_full])
+    if len(combined) <= args.budget:
+        return combined
+    return pack([digest, pinned, skill], args.budget, args.digest_archive)
+
+
+def emit(combined: str, fmt: str) -> str:
+    escaped = json.dumps(f"<hukuhaka-ltm-context>\n{combined}\n</hukuhaka-ltm-context>",
+                         ensure_ascii=False)
+    # Cursor uses additional_context, Claude Code uses
+    # hookSpecificOutput.additionalContext. Emit only one to avoid double
+    # injection.
+    if fmt == "claude":
+        return ('{\n  "hookSpecificOutput": {\n    "hookEventName": "SessionStart",\n'
+                f'    "additionalContext": {escaped}\n  }}\n}}')
+    return f'{{\n  "additional_context": {escaped}\n}}'
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    p.add_argument("--budget", type=int, required=True, help="characters, before wrapping")
+    p.add_argument("--digest", help="pending digest file")
+    p.add_argument("--digest-archive", help="where the digest is archived (named in the note)")
+    p.add_argument("--pinned", help="pinned.md")
+    p.add_argument("--skill", help="using-hukuhaka-ltm SKILL.md")
+    p.add_argument("--format", choices=["claude", "cursor", "generic"], default="generic")
+    args = p.parse_args()
+
+    combined = build(args)
+    if combined:
+        print(emit(combined, args.format))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
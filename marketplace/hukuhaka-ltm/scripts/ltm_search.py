@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""LTM full-text search — BM25 over L2 cards and L3 entries.
+
+Recall used to read the newest N logs and hope the relevant ones were among
+them. This keeps a local inverted index so recall can ask for the handful of
+files that actually match the question, whatever their age.
+
+Index: `.claude/ltm/.ltm-search.db` (stdlib sqlite3 — a query touches only
+the postings of its own terms, so lookup cost does not grow with the
+corpus the way loading a JSON index would).
+
+    docs      (id, key, tier, entry_id, mtime_ns, size, len)
+    postings  (term, doc, tf)      primary key (term, doc)
+
+Indexed text: L2 `topic`, `summary`, `context` and body; L3 body (title
+included) for entries under log/ — archived ones are left out. Tokens are
+lower-cased `\\w+` runs of 2+ characters, minus a short stopword list.
+
+Maintained like the metadata index (ltm_index.py): ltm_append.py adds the
+entries it wrote; distill.py reproject refreshes; `refresh` re-tokenizes only
+files whose (mtime_ns, size) stamp moved and drops deleted ones.
+
+Scoring: Okapi BM25, k1 = 1.2, b = 0.75,
+    idf(t) = ln(1 + (N - df + 0.5) / (df + 0.5))
+
+Usage:
+    python3 ltm_search.py [--target-dir D] refresh
+    python3 ltm_search.py [--target-dir D] query "words ..." [-k 8]
+                          [--tier l2|l3] [--json]
+
+query prints the top k, best first:
+`score<TAB>path<TAB>id<TAB>snippet`. Hits whose file no longer exists are
+skipped.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+from distill import find_index_dir, find_log_dir, log_files, parse_frontmatter
+
+DB_FILE = ".ltm-search.db"
+SCHEMA_VERSION = 1
+K1 = 1.2
+B = 0.75
+SNIPPET_CHARS = 160
+TOKEN_RE = re.compile(r"\w{2,}")
+STOPWORDS = frozenset(
+    "the and for are was were with that this from into not but you your our "
+    "its has have had can will would should could than then them they their "
+    "there what when where which who why how all any via per out use used".split()
+)
+
+
+# ---------------------------------------------------------------------------
+# text
+# ---------------------------------------------------------------------------
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def doc_text(root: Path, path: Path) -> tuple[str, str, str] | None:
+    """(tier, entry id, searchable text) for one card or entry."""
+    try:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    fm, body = parse_frontmatter(text)
+    if path.parent == find_index_dir(root):
+        fields = [fm.get("topic", ""), fm.get("summary", ""), fm.get("context", ""), body]
+        return "l2", path.stem, "\n".join(f for f in fields if isinstance(f, str))
+    entry_id = fm.get("id") or re.sub(r"^\d{4}-\d{2}-\d{2}-", "", path.stem)
+    return "l3", entry_id, body
+
+
+def snippet(root: Path, path: Path, terms: set[str]) -> str:
+    """First indexed line mentioning a query term (else the first line)."""
+    parsed = doc_text(root, path)
+    first = ""
+    for line in (parsed[2] if parsed else "").splitlines():
+        s = line.strip().lstrip("#").strip()
+        if not s:
+            continue
+        first = first or s
+        if terms.intersection(tokenize(s)):
+            return s[:SNIPPET_CHARS]
+    return first[:SNIPPET_CHARS]
+
+
+# ---------------------------------------------------------------------------
+# index
+# ---------------------------------------------------------------------------
+
+def connect(root: Path) -> sqlite3.Connection:
+    """Open (and if needed create or rebuild) the index database."""
+    db = sqlite3.connect(root / DB_FILE)
+    if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        db.executescript(
+            """
+            DROP TABLE IF EXISTS postings;
+            DROP TABLE IF EXISTS docs;
+            CREATE TABLE docs (id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL,
+                               tier TEXT, entry_id TEXT, mtime_ns INTEGER,
+                               size INTEGER, len INTEGER);
+            CREATE TABLE postings (term TEXT NOT NULL, doc INTEGER NOT NULL,
+                                   tf INTEGER NOT NULL, PRIMARY KEY (term, doc))
+                                   WITHOUT ROWID;
+            CREATE INDEX postings_doc ON postings (doc);
+            """
+        )
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        db.commit()
+    return db
+
+
+def _all_files(root: Path) -> list[Path]:
+    index_dir = find_index_dir(root)
+    cards = sorted(index_dir.glob("*.md")) if index_dir.is_dir() else []
+    return cards + log_files(find_log_dir(root))
+
+
+def _remove(db: sqlite3.Connection, key: str) -> None:
+    row = db.execute("SELECT id FROM docs WHERE key = ?", (key,)).fetchone()
+    if row:
+        db.execute("DELETE FROM postings WHERE doc = ?", row)
+        db.execute("DELETE FROM docs WHERE id = ?", row)
+
+
+def _index_file(db: sqlite3.Connection, root: Path, path: Path) -> None:
+    key = path.relative_to(root).as_posix()
+    _remove(db, key)
+    parsed = doc_text(root, path)
+    if parsed is None:
+        return
+    tier, entry_id, text = parsed
+    st = path.stat()
+    tf = Counter(tokenize(text))
+    cur = db.execute(
+        "INSERT INTO docs (key, tier, entry_id, mtime_ns, size, len) VALUES (?, ?, ?, ?, ?, ?)",
+        (key, tier, entry_id, st.st_mtime_ns, st.st_size, sum(tf.values())),
+    )
+    db.executemany("INSERT INTO postings (term, doc, tf) VALUES (?, ?, ?)",
+                   [(t, cur.lastrowid, n) for t, n in tf.items()])
+
+
+def refresh(root: Path) -> int:
+    """Re-tokenize restamped files, drop deleted ones. Returns docs indexed."""
+    db = connect(root)
+    try:
+        known = {key: (m, s) for key, m, s in db.execute("SELECT key, mtime_ns, size FROM docs")}
+        seen: set[str] = set()
+        for path in _all_files(root):
+            key = path.relative_to(root).as_posix()
+            seen.add(key)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if known.get(key) != (st.st_mtime_ns, st.st_size):
+                _index_file(db, root, path)
+        for key in known.keys() - seen:
+            _remove(db, key)
+        db.commit()
+        return len(seen)
+    finally:
+        db.close()
+
+
+def update_paths(root: Path, paths: list[Path]) -> None:
+    """Index just-written files. Best-effort, like ltm_index.update_paths."""
+    try:
+        if not (root / DB_FILE).is_file():
+            refresh(root)
+            return
+        db = connect(root)
+        try:
+            for path in paths:
+                _index_file(db, root, path)
+            db.commit()
+        finally:
+            db.close()
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def rename_paths(root: Path, renames: dict[str, str]) -> None:
+    """Re-key docs for moved files ({old key: new key}); no re-tokenizing."""
+    if not renames or not (root / DB_FILE).is_file():
+        return
+    try:
+        db = connect(root)
+        try:
+            db.executemany("UPDATE docs SET key = ? WHERE key = ?",
+                           [(new, old) for old, new in renames.items()])
+            db.commit()
+        finally:
+            db.close()
+    except sqlite3.Error:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# query
+# ---------------------------------------------------------------------------
+
+def search(root: Path, text: str, k: int = 8, tier: str | None = None) -> list[dict]:
+    terms = list(dict.fromkeys(tokenize(text)))
+    if not terms:
+        return []
+    db = connect(root)
+    try:
+        n_docs, avg_len = db.execute("SELECT COUNT(*), AVG(len) FROM docs").fetchone()
+        if not n_docs:
+            return []
+        avg_len = avg_len or 1.0
+        scores: dict[int, float] = {}
+        for term in terms:
+            rows = db.execute(
+                "SELECT p.doc, p.tf, d.len FROM postings p JOIN docs d ON d.id = p.doc "
+                "WHERE p.term = ?" + (" AND d.tier = ?" if tier else ""),
+                (term, tier) if tier else (term,),
+            ).fetchall()
+            if not rows:
+                continue
+            df = db.execute("SELECT COUNT(*) FROM postings WHERE term = ?", (term,)).fetchone()[0]
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc, tf, length in rows:
+                norm = tf + K1 * (1 - B + B * length / avg_len)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (K1 + 1) / norm
+        out: list[dict] = []
+        for doc, score in sorted(scores.items(), key=lambda ds: (-ds[1], ds[0])):
+            if len(out) >= k:
+                break
+            key, doc_tier, entry_id = db.execute(
+                "SELECT key, tier, entry_id FROM docs WHERE id = ?", (doc,)).fetchone()
+            path = root / key
+            if not path.is_file():
+                continue  # deleted since the last refresh; the next one drops it
+            out.append({"score": round(score, 3), "path": str(path), "tier": doc_tier,
+                        "id": entry_id, "snippet": snippet(root, path, set(terms))})
+        return out
+    finally:
+        db.close()
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    p.add_argument("--target-dir", default=".claude/ltm", help="LTM root directory")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("refresh", help="re-index files changed since the last refresh")
+    q = sub.add_parser("query", help="top-k cards/entries for free text")
+    q.add_argument("text", nargs="+")
+    q.add_argument("-k", type=int, default=8, help="results to return (default 8)")
+    q.add_argument("--tier", choices=["l2", "l3"])
+    q.add_argument("--json", action="store_true", help="one JSON result per line")
+    args = p.parse_args()
+
+    root = Path(args.target_dir)
+    if not root.is_dir():
+        print(f"ltm_search: no LTM directory at {root}", file=sys.stderr)
+        return 0
+    if args.cmd == "refresh":
+        print(json.dumps({"indexed": refresh(root)}))
+        return 0
+    if not (root / DB_FILE).is_file():
+        refresh(root)
+    for r in search(root, " ".join(args.text), args.k, args.tier):
+        if args.json:
+            print(json.dumps(r))
+        else:
+            print(f"{r['score']:.3f}\t{r['path']}\t{r['id']}\t{r['snippet']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,12 +22,15 @@
 
 set -u
 
-# Read full stdin (hook input JSON)
-INPUT=$(cat)
+# Read full stdin (hook input JSON) with a builtin — no subprocess.
+IFS= read -r -d '' INPUT || true
 
-# Extract file_path with grep+sed (no jq dependency).
+# Extract file_path with a bash regex (no jq dependency, no grep/sed forks).
 # JSON shape: {"tool_input": {"file_path": "...", ...}, ...}
-FILE_PATH=$(echo "$INPUT" | grep -o '"file_path"[[:space:]]*:[[:space:]]*"[^"]*"' | head -1 | sed 's/.*"file_path"[[:space:]]*:[[:space:]]*"\([^"]*\)".*/\1/')
+FILE_PATH=""
+if [[ $INPUT =~ \"file_path\"[[:space:]]*:[[:space:]]*\"([^\"]*)\" ]]; then
+    FILE_PATH="${BASH_REMATCH[1]}"
+fi
 
 if [ -z "$FILE_PATH" ]; then
     exit 0
@@ -11,11 +11,23 @@
 # additional_context for Cursor). Per plugin-guide:agents-and-hooks.md
 # the SessionStart hook payload is added to Claude's context.
 #
-# Size guard: total injected payload is capped at ~3000 chars. If the
-# combined content exceeds the cap, SKILL.md is dropped first (it can be
-# re-loaded on demand by activating the skill via its description),
-# then pinned.md, then digest. Digest has highest priority because it
-# surfaces work the user has not seen yet.
+# Size guard: the combined content is capped at PAYLOAD_BUDGET chars.
+# Assembly and packing live in ltm_pack.py: under the cap the three
+# sections go in verbatim; over it, digest lines, pinned bullets and skill
+# sections are ranked (digest first — it surfaces work the user has not
+# seen yet — then pinned Core, then the skill map, which can be re-loaded
+# on demand) and packed whole, never cut, with a closing note naming what
+# was left out and where to find it.
+#
+# Payload cache: pinned.md and SKILL.md rarely change between sessions, so
+# the escaped, budget-fitted JSON is kept in .claude/ltm/.session-start-cache
+# (machine-local, gitignored like .meta-state) and replayed while no digest
+# is pending. Line 1 of the cache is the key (output shape, budget, input
+# paths) and the inputs' checksums; the rest is the JSON exactly as
+# emitted. Freshness is `-nt` against each input, a bash builtin, so a warm
+# start is one stat per input and one read. An input that only looks newer
+# (touch, git checkout) but checksums the same re-stamps the cache instead
+# of rebuilding it.
 #
 # Reads stdin (hook input JSON) but does not parse it — cwd is taken from
 # $CLAUDE_PROJECT_DIR per Claude Code's hook contract.
@@ -31,9 +43,11 @@ PINNED_FILE="${LTM_DIR}/pinned.md"
 DIGEST_RAW="${LTM_DIR}/.session-digest"
 DIGEST_PENDING="${LTM_DIR}/.session-digest.pending"
 DIGEST_ARCHIVE_DIR="${LTM_DIR}/.session-digest-archive"
+CACHE_FILE="${LTM_DIR}/.session-start-cache"
 
 PLUGIN_ROOT="${CLAUDE_PLUGIN_ROOT:-}"
 SKILL_FILE="${PLUGIN_ROOT}/skills/using-hukuhaka-ltm/SKILL.md"
+PACKER="${BASH_SOURCE[0]%/*}/ltm_pack.py"
 
 # Silent exit if LTM not bootstrapped in this project.
 if [ ! -f "$RULES_FILE" ]; then
@@ -52,84 +66,83 @@ if [ -f "$DIGEST_RAW" ]; then
     fi
 fi
 
-# --- Build section 1: digest from previous session ---
-digest_section=""
-if [ -f "$DIGEST_PENDING" ]; then
-    digest_body=$(cat "$DIGEST_PENDING" 2>/dev/null || echo "")
-    if [ -n "$digest_body" ]; then
-        line_count=$(printf "%s" "$digest_body" | grep -c . || echo 0)
-        digest_section=$(printf "## Auto-recorded since last session (%s entries)\n\nReview via \`/ltm:distill\`.\n\n%s\n" "$line_count" "$digest_body")
-    fi
-    mkdir -p "$DIGEST_ARCHIVE_DIR" 2>/dev/null
-    ts=$(date -u +"%Y%m%dT%H%M%SZ")
-    mv "$DIGEST_PENDING" "${DIGEST_ARCHIVE_DIR}/${ts}.md" 2>/dev/null || rm -f "$DIGEST_PENDING"
-fi
-
-# --- Build section 2: pinned (L1) ---
-pinned_section=""
-if [ -f "$PINNED_FILE" ]; then
-    pinned_section=$(cat "$PINNED_FILE")
-fi
-
-# --- Build section 3: skill map ---
-skill_section=""
-if [ -n "$PLUGIN_ROOT" ] && [ -f "$SKILL_FILE" ]; then
-    # Strip YAML frontmatter (everything between the first two --- lines)
-    skill_section=$(awk 'BEGIN{fm=0} /^---$/{fm++; next} fm>=2{print}' "$SKILL_FILE")
+# --- Payload cache ---
+# Cursor uses additional_context, Claude Code uses hookSpecificOutput.additionalContext.
+if [ -n "${CURSOR_PLUGIN_ROOT:-}" ]; then
+    out_format=cursor
+elif [ -n "${CLAUDE_PLUGIN_ROOT:-}" ]; then
+    out_format=claude
+else
+    out_format=generic
 fi
+cache_inputs=("${BASH_SOURCE[0]}" "$PACKER")
+[ -f "$PINNED_FILE" ] && cache_inputs+=("$PINNED_FILE")
+[ -n "$PLUGIN_ROOT" ] && [ -f "$SKILL_FILE" ] && cache_inputs+=("$SKILL_FILE")
+cache_key="v1 ${out_format} ${PAYLOAD_BUDGET} ${cache_inputs[*]}"
+
+cache_newer_than_inputs() {
+    local f
+    for f in "${cache_inputs[@]}"; do
+        [ "$CACHE_FILE" -nt "$f" ] || return 1
+    done
+}
 
-# --- Assemble with size guard ---
-sep=$'\n\n---\n\n'
-combined=""
-[ -n "$digest_section" ] && combined+="$digest_section"
-[ -n "$pinned_section" ] && combined+="${combined:+$sep}$pinned_section"
-[ -n "$skill_section" ] && combined+="${combined:+$sep}$skill_section"
+cache_sums() {
+    cksum "${cache_inputs[@]}" 2>/dev/null | awk '{printf "%s%s:%s", sep, $1, $2; sep = " "}'
+}
 
-if [ ${#combined} -gt $PAYLOAD_BUDGET ]; then
-    # Drop SKILL.md first
-    combined=""
-    [ -n "$digest_section" ] && combined+="$digest_section"
-    [ -n "$pinned_section" ] && combined+="${combined:+$sep}$pinned_section"
-fi
-if [ ${#combined} -gt $PAYLOAD_BUDGET ]; then
-    # Drop pinned next; keep digest only
-    combined="$digest_section"
-fi
-if [ ${#combined} -gt $PAYLOAD_BUDGET ]; then
-    # Final truncation
-    combined="${combined:0:$PAYLOAD_BUDGET}"
+# A pending digest is new content every time — build from scratch then.
+if [ ! -f "$DIGEST_PENDING" ] && [ -f "$CACHE_FILE" ]; then
+    {
+        IFS= read -r cache_head
+        if [ "${cache_head%%$'\t'*}" = "$cache_key" ]; then
+            if cache_newer_than_inputs; then
+                exec cat
+            fi
+            sums=$(cache_sums)
+            if [ -n "$sums" ] && [ "${cache_head#*$'\t'}" = "$sums" ]; then
+                touch "$CACHE_FILE" 2>/dev/null
+                exec cat
+            fi
+        fi
+    } < "$CACHE_FILE"
 fi
 
-if [ -z "$combined" ]; then
-    exit 0
+# --- Pack digest, pinned (L1) and skill map ---
+pack_args=(--budget "$PAYLOAD_BUDGET" --format "$out_format")
+has_digest=""
+if [ -s "$DIGEST_PENDING" ]; then
+    has_digest=1
+    ts=$(date -u +"%Y%m%dT%H%M%SZ")
+    pack_args+=(--digest "$DIGEST_PENDING"
+                --digest-archive ".claude/ltm/.session-digest-archive/${ts}.md")
 fi
+[ -f "$PINNED_FILE" ] && pack_args+=(--pinned "$PINNED_FILE")
+[ -n "$PLUGIN_ROOT" ] && [ -f "$SKILL_FILE" ] && pack_args+=(--skill "$SKILL_FILE")
 
-# Wrap in an LTM banner for clarity in the context window.
-wrapped="<hukuhaka-ltm-context>
-${combined}
-</hukuhaka-ltm-context>"
-
-# --- JSON-escape the payload (bash parameter expansion only — fast) ---
-escape_for_json() {
-    local s="$1"
-    s="${s//\\/\\\\}"
-    s="${s//\"/\\\"}"
-    s="${s//$'\n'/\\n}"
-    s="${s//$'\r'/\\r}"
-    s="${s//$'\t'/\\t}"
-    printf '%s' "$s"
-}
+packed=""
+payload=$(python3 "$PACKER" "${pack_args[@]}" 2>/dev/null) && packed=1
+[ -n "$payload" ] && printf '%s\n' "$payload"
 
-escaped=$(escape_for_json "$wrapped")
+# Archive the digest only once it has been surfaced; after a failed pack it
+# stays pending for the next session start.
+if [ -n "$packed" ] && [ -f "$DIGEST_PENDING" ]; then
+    mkdir -p "$DIGEST_ARCHIVE_DIR" 2>/dev/null
+    ts=${ts:-$(date -u +"%Y%m%dT%H%M%SZ")}
+    mv "$DIGEST_PENDING" "${DIGEST_ARCHIVE_DIR}/${ts}.md" 2>/dev/null || rm -f "$DIGEST_PENDING"
+fi
 
-# Cursor uses additional_context, Claude Code uses hookSpecificOutput.additionalContext.
-# Emit only one to avoid double injection.
-if [ -n "${CURSOR_PLUGIN_ROOT:-}" ]; then
-    printf '{\n  "additional_context": "%s"\n}\n' "$escaped"
-elif [ -n "${CLAUDE_PLUGIN_ROOT:-}" ]; then
-    printf '{\n  "hookSpecificOutput": {\n    "hookEventName": "SessionStart",\n    "additionalContext": "%s"\n  }\n}\n' "$escaped"
-else
-    printf '{\n  "additional_context": "%s"\n}\n' "$escaped"
+# Cache only the digest-free payload (an empty one too: nothing to inject
+# is also worth not recomputing). Written aside and renamed into place so
+# a concurrent session start never reads half a cache. A failed pack is
+# never cached.
+if [ -n "$packed" ] && [ -z "$has_digest" ]; then
+    cache_tmp="${CACHE_FILE}.$$"
+    {
+        printf '%s\t%s\n' "$cache_key" "$(cache_sums)"
+        [ -n "$payload" ] && printf '%s\n' "$payload"
+    } > "$cache_tmp" 2>/dev/null && mv -f "$cache_tmp" "$CACHE_FILE" 2>/dev/null
+    rm -f "$cache_tmp" 2>/dev/null
 fi
 
 exit 0
@@ -10,10 +10,11 @@ Contract (documented in using-hukuhaka-ltm/SKILL.md):
     </ltm-record>
 
 `kind` and `title` attributes are required; `supersedes` is optional.
-Multiple blocks per turn are allowed. The hook calls append-entry.py
---autonomous for each match and accumulates the resulting file paths
-to .claude/ltm/.session-digest for the next session's SessionStart inject
-to surface.
+Multiple blocks per turn are allowed, up to $LTM_MAX_RECORDS_PER_TURN
+(default 5). The hook writes every match in this one process through
+ltm_append.append_entries() — one batch, one index update — and appends
+the resulting file paths to .claude/ltm/.session-digest in a single write
+for the next session's SessionStart inject to surface.
 
 This hook is the *autonomy mechanism for L3*. The IRON-LAW in
 ltm-append/SKILL.md still governs manual user-driven appends; that path
@@ -26,7 +27,6 @@ from __future__ import annotations
 import json
 import os
 import re
-import subprocess
 import sys
 from pathlib import Path
 
@@ -41,8 +41,70 @@ def parse_attrs(attr_str: str) -> dict[str, str]:
     return dict(ATTR_RE.findall(attr_str))
 
 
-MAX_MARKERS_PER_TURN = 5
-PER_APPEND_TIMEOUT_S = 5
+# Cap on <ltm-record> blocks written per turn. Appends are in-process now,
+# so the cap guards against an overloaded reply flooding L3, not against
+# hook latency; override with LTM_MAX_RECORDS_PER_TURN (0 = no cap).
+DEFAULT_MAX_RECORDS_PER_TURN = 5
+
+
+def max_records_per_turn() -> int | None:
+    raw = os.environ.get("LTM_MAX_RECORDS_PER_TURN", "").strip()
+    try:
+        cap = int(raw) if raw else DEFAULT_MAX_RECORDS_PER_TURN
+    except ValueError:
+        cap = DEFAULT_MAX_RECORDS_PER_TURN
+    return cap if cap > 0 else None
+
+
+# Transcripts grow by a record per message/tool call and reach tens of MB
+# in long sessions; the last assistant text is almost always within the
+# final few records, so the file is read backwards in blocks of this size.
+TAIL_BLOCK_BYTES = 64 * 1024
+
+
+def iter_lines_reversed(path: str, block_size: int = TAIL_BLOCK_BYTES):
+    """Yield the lines of a file as bytes, last line first, reading
+    backwards from EOF one block at a time. A line longer than a block
+    (a large tool result) is reassembled across reads."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial: list[bytes] = []  # pieces of the line being assembled, last first
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            cut = block.rfind(b"\n")
+            if cut == -1:
+                partial.append(block)
+                continue
+            partial.append(block[cut + 1 :])
+            yield b"".join(reversed(partial))
+            lines = block[:cut].split(b"\n")
+            partial = [lines.pop(0)]  # may continue in the previous block
+            yield from reversed(lines)
+        yield b"".join(reversed(partial))
+
+
+def _assistant_text(raw: bytes) -> tuple[str | None, str]:
+    try:
+        obj = json.loads(raw.decode("utf-8", errors="ignore"))
+    except Exception:
+        return None, ""
+    if not isinstance(obj, dict) or obj.get("type") != "assistant":
+        return None, ""
+    msg = obj.get("message", {})
+    content = msg.get("content", [])
+    text_parts: list[str] = []
+    if isinstance(content, list):
+        for part in content:
+            if isinstance(part, dict) and part.get("type") == "text":
+                text_parts.append(part.get("text", ""))
+    elif isinstance(content, str):
+        text_parts.append(content)
+    if text_parts:
+        return "\n".join(text_parts), obj.get("uuid", "")
+    return None, ""
 
 
 def find_last_assistant_text(transcript_path: str) -> tuple[str | None, str]:
@@ -52,33 +114,20 @@ def find_last_assistant_text(transcript_path: str) -> tuple[str | None, str]:
     session (once per turn, plus on stop_hook_active continuations).
     Cursoring on the message uuid prevents the same `<ltm-record>` block
     from being re-written on each fire.
+
+    Reads from EOF backwards and stops at the first match, so the cost
+    follows the size of the last turn, not of the whole transcript.
     """
     try:
-        with open(transcript_path, encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
+        for raw in iter_lines_reversed(transcript_path):
+            # cheap pre-filter: skip tool results / user records unparsed
+            if b'"assistant"' not in raw:
+                continue
+            text, uuid = _assistant_text(raw.strip())
+            if text is not None:
+                return text, uuid
     except OSError:
-        return None, ""
-    for line in reversed(lines):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-        except Exception:
-            continue
-        if obj.get("type") != "assistant":
-            continue
-        msg = obj.get("message", {})
-        content = msg.get("content", [])
-        text_parts: list[str] = []
-        if isinstance(content, list):
-            for part in content:
-                if isinstance(part, dict) and part.get("type") == "text":
-                    text_parts.append(part.get("text", ""))
-        elif isinstance(content, str):
-            text_parts.append(content)
-        if text_parts:
-            return "\n".join(text_parts), obj.get("uuid", "")
+        pass
     return None, ""
 
 
@@ -101,10 +150,6 @@ def main() -> int:
     if not plugin_root:
         return 0
 
-    append_helper = Path(plugin_root) / "scripts" / "append-entry.py"
-    if not append_helper.is_file():
-        return 0
-
     ltm_dir = Path(project_dir) / ".claude" / "ltm"
     if not (ltm_dir / "CLAUDE.md").is_file():
         return 0  # LTM not bootstrapped in this project
@@ -128,12 +173,10 @@ def main() -> int:
     if not matches:
         return 0
 
-    # Cap markers per turn — protects against a single overloaded reply
-    # stalling the Stop hook past Claude Code's hook timeout budget.
-    matches = matches[:MAX_MARKERS_PER_TURN]
+    matches = matches[: max_records_per_turn()]
 
     digest_path = ltm_dir / ".session-digest"
-    written: list[tuple[str, str, str]] = []
+    specs: list[dict] = []
     for attr_str, body in matches:
         attrs = parse_attrs(attr_str)
         kind = attrs.get("kind", "auto-record").strip() or "auto-record"
@@ -146,32 +189,27 @@ def main() -> int:
         body_text = body.strip()
         if not body_text:
             continue
-        cmd = [
-            "python3",
-            str(append_helper),
-            "--kind", kind,
-            "--title", title,
-            "--autonomous",
-            "--target-dir", str(ltm_dir),
-        ]
-        if supersedes:
-            cmd.extend(["--supersedes", supersedes])
+        specs.append({
+            "kind": kind,
+            "title": title,
+            "body": body_text,
+            "supersedes": [s.strip() for s in supersedes.split(",") if s.strip()],
+            "autonomous": True,
+        })
+
+    written: list[tuple[str, str, str]] = []
+    if specs:
+        # imported only on turns that record something: the plain turn
+        # end stays free of the index modules' import cost
+        sys.path.insert(0, str(Path(plugin_root) / "scripts"))
         try:
-            result = subprocess.run(
-                cmd,
-                input=body_text,
-                capture_output=True,
-                text=True,
-                cwd=project_dir,
-                check=False,
-                timeout=PER_APPEND_TIMEOUT_S,
-            )
+            from ltm_append import append_entries
+            paths = append_entries(ltm_dir, specs)
         except Exception:
-            continue
-        if result.returncode == 0:
-            path = result.stdout.strip()
-            if path:
-                written.append((kind, title, path))
+            paths = []
+        for spec, path in zip(specs, paths):
+            if path is not None:
+                written.append((spec["kind"], spec["title"], str(path)))
 
     if written:
         try:
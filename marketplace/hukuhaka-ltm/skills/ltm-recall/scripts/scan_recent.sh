@@ -5,6 +5,10 @@
 # Resolves log dir via $CLAUDE_PROJECT_DIR (Claude Code sets this to the
 # project root); falls back to current working dir.
 #
+# Answers from the metadata index (scripts/ltm_index.py) when python3 is
+# available — the query re-stats the store first, so it still reflects
+# disk, but re-reads only changed files; otherwise greps the log files.
+#
 # Output: one absolute file path per line, oldest → newest within the
 # returned set. Empty output is normal when LTM has not been bootstrapped.
 
@@ -13,11 +17,35 @@ set -e
 N="${1:-30}"
 KIND="${2:-}"
 
-LOG_DIR="${CLAUDE_PROJECT_DIR:-.}/.claude/ltm/log"
+LTM_DIR="${CLAUDE_PROJECT_DIR:-.}/.claude/ltm"
+LOG_DIR="$LTM_DIR/log"
 [ -d "$LOG_DIR" ] || { echo "no LTM log dir at $LOG_DIR" >&2; exit 0; }
 
-if [ -n "$KIND" ]; then
-    grep -l "^kind: $KIND$" "$LOG_DIR"/*.md 2>/dev/null | sort | tail -"$N"
-else
-    ls -1 "$LOG_DIR"/*.md 2>/dev/null | sort | tail -"$N"
+INDEX="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)/scripts/ltm_index.py"
+if command -v python3 >/dev/null 2>&1 && [ -f "$INDEX" ]; then
+    exec python3 "$INDEX" --target-dir "$LTM_DIR" query --tier l3 --limit "$N" \
+        ${KIND:+--kind "$KIND"} --paths
 fi
+
+# Fallback: flat entries plus month shards (log/YYYY/MM/), newest shard
+# first, stopping once N entries are collected. Sorted by file name, so a
+# half-migrated store still comes out in date order.
+pick() {
+    if [ -n "$KIND" ]; then
+        xargs -r grep -l "^kind: $KIND$" 2>/dev/null || true
+    else
+        cat
+    fi
+}
+
+{
+    ls -1 "$LOG_DIR"/*.md 2>/dev/null | pick
+    found=0
+    for month in $(ls -1d "$LOG_DIR"/[0-9][0-9][0-9][0-9]/[0-9][0-9] 2>/dev/null | sort -r); do
+        batch=$(ls -1 "$month"/*.md 2>/dev/null | pick)
+        [ -n "$batch" ] || continue
+        printf '%s\n' "$batch"
+        found=$((found + $(printf '%s\n' "$batch" | wc -l)))
+        [ "$found" -ge "$N" ] && break
+    done
+} | awk -F/ '{ print $NF "\t" $0 }' | sort | cut -f2- | tail -n "$N"
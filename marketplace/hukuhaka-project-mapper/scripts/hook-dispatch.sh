@@ -0,0 +1,34 @@
+#!/usr/bin/env bash
+# hook-dispatch.sh — single entry point for this plugin's per-tool-call hooks.
+# Wired by hooks/hooks.json as `hook-dispatch.sh <route>`.
+#
+# Per-tool-call hooks run on every agent action, so the dispatcher reads the
+# event JSON with a shell builtin and rejects payloads that cannot match with
+# a glob — no Python start, no subprocess. Only a possible match is handed on
+# (stdin = the same event JSON) to the real handler, which re-checks exactly.
+#
+# Routes:
+#   post-bash   PostToolUse Bash → scripts/sync/sync_cost.py, only when the
+#               payload mentions preflight.sh or record-sync/record_sync
+#               (sync_cost.py's own invocation regexes are stricter).
+#
+# Always exits 0 on a filtered-out payload; otherwise the handler's exit code.
+set -u
+
+IFS= read -r -d '' IN || true
+case "${BASH_SOURCE[0]}" in  # parameter expansion, not $(dirname): no fork
+    */*) HERE="${BASH_SOURCE[0]%/*}" ;;
+    *) HERE=. ;;
+esac
+
+case "${1:-}" in
+    post-bash)
+        case "$IN" in
+            *preflight.sh*|*record-sync.*|*record_sync.*) ;;
+            *) exit 0 ;;
+        esac
+        exec python3 "$HERE/sync/sync_cost.py" <<<"$IN"
+        ;;
+esac
+
+exit 0
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Build a compact, budgeted summary of the .claude/ docs without an LLM.
+
+Extracts what the summarizer agent used to compress by hand: the section
+outline of each doc, every `[name](path)` / `file:symbol` entry point, the
+most-referenced components, stack and pattern names, backlog counts and the
+latest changelog items. The result is cached in `.sync/summary.md` under a
+key made of the source docs' content hashes and the budget, so an unchanged
+doc set is served from the cache and only a changed one is rebuilt.
+
+Over budget (~tokens = bytes / 4), detail is dropped in a fixed order until
+the summary fits: doc outline, components beyond 5, changelog items beyond 3,
+entry-point descriptions.
+
+Usage:
+    python3 build-summary.py [target_dir] [--budget N] [--refresh]
+                             (defaults: .claude, N=1500)
+"""
+import argparse
+import hashlib
+import re
+import sys
+from pathlib import Path
+
+
+VERSION = 1
+DOCS = ("map.md", "design.md", "backlog.md", "changelog.md")
+CACHE_FILE = "summary.md"
+HEADER_RE = re.compile(r"^##\s+(.+?)\s*$")
+ITEM_RE = re.compile(r"^[-*]\s+")
+REF_RE = re.compile(r"^\s*(?:[-*]\s+)?\[([^\]]+)\]\(([^)\s]+(?:\(\))?)\)\s*:?\s*(.*)$")
+PLACEHOLDER_RE = re.compile(r"^\(To be filled")
+DESC_WORDS = 10
+
+
+def split_sections(text: str) -> tuple[list[str], dict[str, list[str]]]:
+    """Return (preamble lines, dict of section_name -> body lines)."""
+    preamble: list[str] = []
+    sections: dict[str, list[str]] = {}
+    current: str | None = None
+    for line in text.splitlines():
+        m = HEADER_RE.match(line)
+        if m:
+            current = m.group(1).strip()
+            sections[current] = []
+        elif current is None:
+            preamble.append(line)
+        else:
+            sections[current].append(line)
+    return preamble, sections
+
+
+def refs(body: list[str]) -> list[tuple[str, str, str, list[str]]]:
+    """(name, target, description, deps) for each reference line."""
+    out = []
+    for line in body:
+        m = REF_RE.match(line)
+        if not m:
+            continue
+        desc, _, deps = m.group(3).partition(" -> ")
+        out.append((m.group(1), m.group(2), desc.strip(),
+                    [d.strip() for d in deps.split(",") if d.strip()]))
+    return out
+
+
+def items(body: list[str]) -> list[str]:
+    return [ITEM_RE.sub("", l).strip() for l in body
+            if ITEM_RE.match(l) and not PLACEHOLDER_RE.match(ITEM_RE.sub("", l))]
+
+
+def shorten(desc: str, words: int = DESC_WORDS) -> str:
+    parts = desc.split()
+    return " ".join(parts[:words]) + (" …" if len(parts) > words else "")
+
+
+def overview(preamble: list[str], body: list[str] | None = None) -> str:
+    """First prose line of a doc: preamble paragraph, else section body."""
+    for line in preamble + (body or []):
+        s = line.strip()
+        if s and not s.startswith(("#", ">", "-", "*", "|")) and not PLACEHOLDER_RE.match(s):
+            return s
+    return ""
+
+
+# ─── extraction ──────────────────────────────────────────────────────
+
+def extract(docs: dict[str, str]) -> dict:
+    parsed = {name: split_sections(text) for name, text in docs.items()}
+    empty: tuple[list[str], dict[str, list[str]]] = ([], {})
+    map_pre, map_sec = parsed.get("map.md", empty)
+    des_pre, des_sec = parsed.get("design.md", empty)
+    _, back_sec = parsed.get("backlog.md", empty)
+    _, log_sec = parsed.get("changelog.md", empty)
+
+    entry_points = refs(map_sec.get("Entry Points", []))
+    components = refs(map_sec.get("Components", []))
+    # rank components by how many documented items name them in `-> deps`
+    named = [d for _, _, _, deps in entry_points + components for d in deps]
+    order = {c[0]: i for i, c in enumerate(components)}
+    ranked = sorted(components, key=lambda c: (-named.count(c[0]), order[c[0]]))
+
+    patterns = [r[0] for r in refs(des_sec.get("Patterns", []))]
+    if not patterns:
+        patterns = [i.split(":", 1)[0].split(" — ", 1)[0].strip("*` ")
+                    for i in items(des_sec.get("Patterns", []))]
+    stack = [i.split(":", 1)[0].split(" — ", 1)[0].strip("*` ")
+             for i in items(des_sec.get("Stack", []))]
+    planned = back_sec.get("Planned", [])
+    return {
+        "overview": [o for o in (overview(map_pre), overview(des_pre, des_sec.get("Stack")))
+                     if o and not o.startswith("(")],
+        "entry_points": entry_points,
+        "components": ranked,
+        "stack": stack,
+        "patterns": patterns,
+        "outline": [(name, list(sec)) for name, (_, sec) in parsed.items() if sec],
+        "state": {
+            "Entry points": len(entry_points),
+            "Components": len(components),
+            "TODOs": len(items(back_sec.get("Discovered TODOs", []))),
+            "Planned": len(items(planned)),
+            "In progress": len(items(back_sec.get("In Progress", []))),
+        },
+        "recent": items(log_sec.get("Recent", [])),
+    }
+
+
+# ─── rendering ───────────────────────────────────────────────────────
+
+# Successive detail levels, tried in order until the summary fits the budget.
+LEVELS = [
+    {"outline": True, "components": 10, "recent": 5, "descriptions": True},
+    {"outline": False, "components": 10, "recent": 5, "descriptions": True},
+    {"outline": False, "components": 5, "recent": 5, "descriptions": True},
+    {"outline": False, "components": 5, "recent": 3, "descriptions": True},
+    {"outline": False, "components": 5, "recent": 3, "descriptions": False},
+]
+
+
+def ref_line(name: str, target: str, desc: str, with_desc: bool) -> str:
+    line = f"- [{name}]({target})"
+    return line + (f": {shorten(desc)}" if with_desc and desc else "")
+
+
+def render(info: dict, level: dict) -> str:
+    out = ["# Project Summary", ""]
+    if info["overview"]:
+        out += ["## Overview", *info["overview"], ""]
+    if info["entry_points"]:
+        out.append("## Entry Points")
+        out += [ref_line(n, t, d, level["descriptions"]) for n, t, d, _ in info["entry_points"]]
+        out.append("")
+    if info["stack"] or info["patterns"]:
+        out.append("## Architecture")
+        if info["stack"]:
+            out.append("Stack: " + ", ".join(info["stack"]))
+        if info["patterns"]:
+            out.append("Patterns: " + ", ".join(info["patterns"]))
+        out.append("")
+    comps = info["components"]
+    if comps:
+        shown = comps[: level["components"]]
+        out.append(f"## Components ({len(shown)} of {len(comps)}, most referenced first)")
+        out += [ref_line(n, t, d, True) for n, t, d, _ in shown]
+        out.append("")
+    if level["outline"] and info["outline"]:
+        out.append("## Docs Outline")
+        out += [f"- {name}: " + " · ".join(secs) for name, secs in info["outline"]]
+        out.append("")
+    out.append("## Current State")
+    out.append(" | ".join(f"{k}: {v}" for k, v in info["state"].items()))
+    out.append("")
+    if info["recent"]:
+        out.append("## Recent Changes")
+        out += [f"- {r}" for r in info["recent"][: level["recent"]]]
+        out.append("")
+    return "\n".join(out).rstrip() + "\n"
+
+
+def build(docs: dict[str, str], budget: int) -> str:
+    info = extract(docs)
+    text = ""
+    for level in LEVELS:
+        text = render(info, level)
+        if len(text.encode("utf-8")) // 4 <= budget:
+            return text
+    # still over at the sparsest level: cut whole lines at the budget
+    kept: list[str] = []
+    size = 0
+    for line in text.splitlines():
+        size += len(line.encode("utf-8")) + 1
+        if size // 4 > budget:
+            kept.append("… (truncated to budget)")
+            break
+        kept.append(line)
+    return "\n".join(kept) + "\n"
+
+
+# ─── cache ───────────────────────────────────────────────────────────
+
+def cache_key(docs: dict[str, str], budget: int) -> str:
+    h = hashlib.sha256(f"v{VERSION} budget={budget}".encode("utf-8"))
+    for name in DOCS:
+        digest = hashlib.sha256(docs[name].encode("utf-8")).hexdigest() if name in docs else "-"
+        h.update(f"\n{name} {digest}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("target_dir", nargs="?", default=".claude")
+    parser.add_argument("--budget", type=int, default=1500, help="~token cap (bytes / 4)")
+    parser.add_argument("--refresh", action="store_true", help="ignore the cache")
+    args = parser.parse_args()
+    if args.budget < 1:
+        parser.error("--budget must be a positive integer (~tokens)")
+
+    target = Path(args.target_dir)
+    docs = {name: (target / name).read_text(encoding="utf-8")
+            for name in DOCS if (target / name).is_file()}
+    if "map.md" not in docs and "design.md" not in docs:
+        print(f"build-summary: no map.md or design.md in {target}", file=sys.stderr)
+        return 1
+
+    key = cache_key(docs, args.budget)
+    marker = f"<!-- build-summary v{VERSION} key={key} -->"
+    cache = target / ".sync" / CACHE_FILE
+    if not args.refresh and cache.is_file():
+        cached = cache.read_text(encoding="utf-8")
+        head, _, body = cached.partition("\n")
+        if head == marker:
+            print("build-summary: cache hit (source docs unchanged)", file=sys.stderr)
+            sys.stdout.write(body)
+            return 0
+
+    summary = build(docs, args.budget)
+    cache.parent.mkdir(exist_ok=True)
+    tmp = cache.with_suffix(".tmp")
+    tmp.write_text(marker + "\n" + summary, encoding="utf-8")
+    tmp.replace(cache)
+    print(f"build-summary: rebuilt from {len(docs)} doc(s), "
+          f"~{len(summary.encode('utf-8')) // 4} tokens -> {cache}", file=sys.stderr)
+    sys.stdout.write(summary)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
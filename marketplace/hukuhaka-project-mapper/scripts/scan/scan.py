@@ -280,4 +280,7 @@ def main(argv: list[str]) -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main(sys.argv))
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "sync"))
+    from daemon_client import forward  # warm daemon if running, else cold
+    rc = forward("scan", sys.argv)
+    sys.exit(main(sys.argv) if rc is None else rc)
@@ -13,20 +13,72 @@ the very end):
     ===== SKELETON =====            .claude/.sync/skeleton.json (from skeleton.py)
     ===== SCATTERED CLAUDE.md ===== every scan.md scatter row's CLAUDE.md, path-sorted
     ===== EXISTING DOCS =====       current .claude/map.md + design.md
+    ===== ELIDED =====              (--budget only) what was reduced, and how
 
-No size limit — the byte/approx-token size is reported to stderr for cost
-visibility only.
+Default: no size limit — the byte/approx-token size is reported to stderr
+for cost visibility only.
+
+--budget N (approx tokens, 4 bytes/token): start from a floor bundle in
+which every candidate node is kept but without its symbols list, todos are
+capped at BUDGET_TODO_CAP and every scattered CLAUDE.md is cut to its title
+and purpose line. Then spend the remaining budget on upgrades — a node's
+full symbols or a doc's full text — greedily by score, ties broken by path:
+
+    node score = 4 * entry candidate + importers (nodes whose depends_on
+                 names it) + 3 * changed since the last recorded sync
+    doc score  = 3 * dir changed since the last sync + sum of its nodes' scores
+
+Nothing is ever dropped outright (describe must see every candidate path),
+so the bundle may still exceed N; that is reported, not hidden. Every reduction is
+listed in the ELIDED section and counted on stderr.
+
+--delta (incremental runs): record_sync.py snapshots a full bundle, the
+skeleton, the merged JSON and scattered-doc hashes into .claude/.sync/base/
+at every recorded sync (snapshot_base). A delta bundle is that base bundle
+byte-for-byte (a stable, cacheable prefix) followed by:
+
+    ===== DELTA =====               skeleton nodes added / changed / removed
+                                    since the base, changed scattered
+                                    CLAUDE.md in full, changed existing docs
+    ===== DESCRIBE SCOPE =====      the only paths describe is asked about
+
+merge.py --delta reuses the base's descriptions for everything else. No
+base yet -> a normal full bundle is written (stderr says so).
+
+--compact: the SKELETON section is written in skeleton_codec's lossless
+tabular form instead of indent=2 JSON; the bytes and ~tokens saved are
+reported to stderr. Combines with --budget (whose accounting stays in JSON
+terms, so a compact budgeted bundle lands further under N); not with
+--delta, whose base must stay byte-stable.
+
+--misses: consult desc_cache.py and end the bundle with a DESCRIBE SCOPE
+listing only candidates that have no cached description (with --delta, the
+delta scope minus cache hits). merge.py fills every other candidate from the
+cache, so describe is prompted in its scoped (describe-delta) mode.
 
 Usage:
-    python3 bundle.py [project_root]   -> .claude/.sync/bundle.md
+    python3 bundle.py [project_root] [--budget N | --delta] [--compact] [--misses]
+        -> .claude/.sync/bundle.md
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import shutil
 import sys
 from pathlib import Path
 
-from changed_dirs import parse_scatter_rows
+from changed_dirs import (changed_files, commit_valid, head_exists,
+                          longest_scatter_prefix, parse_scatter_rows, read_last_commit)
+from desc_cache import cache_misses, load_cache
+from run_stats import note
+from skeleton_codec import encode as encode_compact
+
+BUDGET_TODO_CAP = 20
+DOC_HEAD_LINES = 3  # title + blank + purpose: the floor form of a scattered CLAUDE.md
+BASE_DIR = "base"   # under .claude/.sync/: the last recorded sync's bundle inputs
+EXISTING_DOCS = ("map.md", "design.md")
 
 
 def read_or_none(path: Path) -> str | None:
@@ -36,44 +88,366 @@ def read_or_none(path: Path) -> str | None:
         return None
 
 
-def main(argv: list[str]) -> int:
-    root = Path(argv[1] if len(argv) > 1 else os.getcwd()).resolve()
-    claude_dir = root / ".claude"
-    skeleton_path = claude_dir / ".sync" / "skeleton.json"
-    scan_md = claude_dir / "scan.md"
+def approx_tokens(text: str) -> int:
+    return len(text.encode("utf-8")) // 4
 
-    if not skeleton_path.is_file():
-        print(f"ERROR: {skeleton_path} not found. Run skeleton.py first (Step 2a).",
-              file=sys.stderr)
-        return 1
 
-    sections: list[str] = []
+# ─── ranking (--budget) ──────────────────────────────────────────────
+
+def recently_changed(root: Path) -> set[str]:
+    """Files changed since the last recorded sync; empty when there is no
+    usable sync state (then no node gets the recency bonus)."""
+    if not head_exists(root):
+        return set()
+    last = read_last_commit(root / ".claude")
+    if last is None or not commit_valid(root, last):
+        return set()
+    return set(changed_files(root, last))
+
+
+def score_nodes(nodes: list[dict], changed: set[str]) -> dict[str, int]:
+    importers: dict[str, int] = {}
+    for n in nodes:
+        for dep in n.get("depends_on", []):
+            importers[dep] = importers.get(dep, 0) + 1
+    return {
+        n["path"]: 4 * bool(n.get("is_entry_candidate"))
+        + importers.get(n["name"], 0)
+        + 3 * (n["path"] in changed)
+        for n in nodes
+    }
+
+
+def rendered_size(node: dict) -> int:
+    """Bytes a candidate node occupies inside the indent=2 skeleton dump,
+    where it sits 3 levels deep (6 extra spaces on every continuation line)."""
+    text = json.dumps(node, indent=2)
+    return len(text.encode("utf-8")) + 6 * text.count("\n")
+
 
-    sections.append("===== SKELETON =====")
-    sections.append((read_or_none(skeleton_path) or "").rstrip())
+def doc_head(text: str) -> tuple[str, int]:
+    """(floor form of a scattered CLAUDE.md, number of lines elided)."""
+    lines = text.rstrip().splitlines()
+    return "\n".join(lines[:DOC_HEAD_LINES]), max(0, len(lines) - DOC_HEAD_LINES)
+
+
+# ─── assembly ────────────────────────────────────────────────────────
+
+def assemble(skeleton_text: str, scatter: list[tuple[str, str | None]] | None,
+             docs: list[tuple[str, str | None]], elided: list[str] | None = None) -> str:
+    sections: list[str] = ["===== SKELETON =====", skeleton_text.rstrip()]
 
     sections.append("\n===== SCATTERED CLAUDE.md =====")
-    n_scatter = 0
-    if scan_md.is_file():
-        for rel in sorted(parse_scatter_rows(scan_md)):
-            cm = root / rel / "CLAUDE.md"
-            text = read_or_none(cm)
-            if text is None:
-                sections.append(f"\n--- {rel}/CLAUDE.md (missing) ---")
-                continue
-            sections.append(f"\n--- {rel}/CLAUDE.md ---")
-            sections.append(text.rstrip())
-            n_scatter += 1
-    else:
+    if scatter is None:
         sections.append("(no .claude/scan.md — no scattered CLAUDE.md available)")
+    for rel, text in scatter or []:
+        if text is None:
+            sections.append(f"\n--- {rel}/CLAUDE.md (missing) ---")
+            continue
+        sections.append(f"\n--- {rel}/CLAUDE.md ---")
+        sections.append(text.rstrip())
 
     sections.append("\n===== EXISTING DOCS =====")
-    for name in ("map.md", "design.md"):
-        text = read_or_none(claude_dir / name)
+    for name, text in docs:
         sections.append(f"\n--- .claude/{name} ---")
         sections.append(text.rstrip() if text else "(absent or empty)")
 
-    bundle = "\n".join(sections) + "\n"
+    if elided is not None:
+        sections.append("\n===== ELIDED =====")
+        sections.extend(elided or ["(nothing — the full bundle fit the budget)"])
+    return "\n".join(sections) + "\n"
+
+
+def budget_bundle(root: Path, skeleton: dict, scatter: list[tuple[str, str | None]] | None,
+                  docs: list[tuple[str, str | None]], budget: int,
+                  render=lambda sk: json.dumps(sk, indent=2)) -> tuple[str, list[str]]:
+    """Floor + greedy upgrades under `budget` approx tokens (see module doc).
+    Returns (bundle, elided lines)."""
+    had_scan = scatter is not None
+    scatter = scatter or []
+    cand = skeleton.get("candidates", {})
+    nodes = list(cand.get("entry_points", [])) + list(cand.get("components", []))
+    changed = recently_changed(root)
+    node_score = score_nodes(nodes, changed)
+
+    scatter_rows = {rel for rel, _ in scatter}
+    doc_score: dict[str, int] = {rel: 0 for rel in scatter_rows}
+    for n in nodes:
+        owner = longest_scatter_prefix(os.path.dirname(n["path"]), scatter_rows)
+        if owner is not None:
+            doc_score[owner] += node_score[n["path"]]
+    for f in changed:
+        owner = longest_scatter_prefix(os.path.dirname(f), scatter_rows)
+        if owner is not None:
+            doc_score[owner] += 3
+
+    # floor: nodes without symbols, capped todos, doc heads
+    full_symbols = {n["path"]: n.get("symbols", []) for n in nodes}
+    node_cost: dict[str, int] = {}
+    for n in nodes:
+        full = rendered_size(n)
+        n["symbols"] = []
+        if full_symbols[n["path"]]:
+            n["symbols_elided"] = len(full_symbols[n["path"]])
+        node_cost[n["path"]] = (full - rendered_size(n)) // 4 + 1
+    todos = skeleton.get("todos", [])
+    skeleton["todos"] = todos[:BUDGET_TODO_CAP]
+    full_docs = dict(scatter)
+    heads: dict[str, tuple[str, int]] = {
+        rel: doc_head(text) for rel, text in scatter if text is not None}
+    shown = [(rel, heads[rel][0] if rel in heads else None) for rel, _ in scatter]
+
+    def symbols_line(n: dict) -> str:
+        return f"symbols: {n['path']} ({n['symbols_elided']} elided)"
+
+    def doc_line(rel: str) -> str:
+        return f"truncated: {rel}/CLAUDE.md ({heads[rel][1]} line(s) elided)"
+
+    # The floor carries the ELIDED line of every reducible item; an upgrade
+    # removes its line, so that line's size is credited back to its cost.
+    upgrades: list[tuple[int, str, str, int]] = []  # (-score, kind, key, cost)
+    all_lines: list[str] = []
+    for n in nodes:
+        if full_symbols[n["path"]]:
+            line = symbols_line(n)
+            all_lines.append(line)
+            cost = node_cost[n["path"]] - approx_tokens(line + "\n")
+            upgrades.append((-node_score[n["path"]], "node", n["path"], cost))
+    for rel, (head, cut) in heads.items():
+        if cut:
+            line = doc_line(rel)
+            all_lines.append(line)
+            cost = approx_tokens(full_docs[rel] or "") - approx_tokens(head) \
+                - approx_tokens(line + "\n")
+            upgrades.append((-doc_score[rel], "doc", rel, cost))
+
+    floor = assemble(json.dumps(skeleton, indent=2), shown if had_scan else None, docs,
+                     all_lines + ["todos: 0000 of 0000 elided (all remain in skeleton.json)"])
+    floor_tokens = approx_tokens(floor)
+    remaining = budget - floor_tokens
+
+    by_path = {n["path"]: n for n in nodes}
+    upgraded_docs: set[str] = set()
+    for _neg, kind, key, cost in sorted(upgrades):
+        if cost > remaining:
+            continue
+        remaining -= cost
+        if kind == "node":
+            by_path[key]["symbols"] = full_symbols[key]
+            by_path[key].pop("symbols_elided")
+        else:
+            upgraded_docs.add(key)
+
+    elided: list[str] = []
+    for n in sorted(nodes, key=lambda n: n["path"]):
+        if "symbols_elided" in n:
+            elided.append(symbols_line(n))
+    for rel, (_head, cut) in sorted(heads.items()):
+        if cut and rel not in upgraded_docs:
+            elided.append(doc_line(rel))
+    if len(todos) > BUDGET_TODO_CAP:
+        elided.append(f"todos: {len(todos) - BUDGET_TODO_CAP} of {len(todos)} elided "
+                      f"(all remain in skeleton.json)")
+
+    shown = [(rel, full_docs[rel] if rel in upgraded_docs
+              else (heads[rel][0] if rel in heads else None)) for rel, _ in scatter]
+    return assemble(render(skeleton), shown if had_scan else None, docs, elided), elided
+
+
+# ─── delta (--delta) ─────────────────────────────────────────────────
+
+def _sha(text: str | None) -> str | None:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest() if text is not None else None
+
+
+def load_inputs(root: Path, skeleton_text: str | None = None,
+                scatter_rows: list[str] | None = None,
+                ) -> tuple[str, list[tuple[str, str | None]] | None,
+                           list[tuple[str, str | None]]]:
+    """(skeleton.json text, scattered docs or None without scan.md, existing docs).
+    skeleton_text / scatter_rows skip re-reading what a caller already holds."""
+    claude_dir = root / ".claude"
+    if skeleton_text is None:
+        skeleton_text = read_or_none(claude_dir / ".sync" / "skeleton.json") or ""
+    scatter: list[tuple[str, str | None]] | None = None
+    scan_md = claude_dir / "scan.md"
+    if scatter_rows is None and scan_md.is_file():
+        scatter_rows = parse_scatter_rows(scan_md)
+    if scatter_rows is not None:
+        scatter = [(rel, read_or_none(root / rel / "CLAUDE.md"))
+                   for rel in sorted(scatter_rows)]
+    docs = [(name, read_or_none(claude_dir / name)) for name in EXISTING_DOCS]
+    return skeleton_text, scatter, docs
+
+
+def snapshot_base(root: Path) -> bool:
+    """Freeze the current bundle inputs as the next delta's base. Called by
+    record_sync.py at the end of a successful sync; False if there is no
+    skeleton to snapshot (the next --delta then falls back to full)."""
+    sync_dir = root / ".claude" / ".sync"
+    if not (sync_dir / "skeleton.json").is_file():
+        return False
+    skeleton_text, scatter, docs = load_inputs(root)
+    base = sync_dir / BASE_DIR
+    base.mkdir(parents=True, exist_ok=True)
+    (base / "bundle.md").write_text(assemble(skeleton_text, scatter, docs), encoding="utf-8")
+    shutil.copyfile(sync_dir / "skeleton.json", base / "skeleton.json")
+    if (sync_dir / "merged.json").is_file():
+        shutil.copyfile(sync_dir / "merged.json", base / "merged.json")
+    manifest = {
+        "scatter": {rel: _sha(text) for rel, text in scatter or []},
+        "docs": {name: _sha(text) for name, text in docs},
+    }
+    (base / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return True
+
+
+def _nodes_by_path(skeleton: dict) -> dict[str, dict]:
+    cand = skeleton.get("candidates", {})
+    return {n["path"]: n for section in ("entry_points", "components", "directories")
+            for n in cand.get(section, [])}
+
+
+def scope_section(scope: list[str], empty: str) -> list[str]:
+    return ["\n===== DESCRIBE SCOPE ====="] + (scope or [f"(none — {empty})"])
+
+
+def delta_bundle(root: Path, skeleton_text: str, scatter: list[tuple[str, str | None]] | None,
+                 docs: list[tuple[str, str | None]],
+                 only: set[str] | None = None) -> tuple[str, list[str]] | None:
+    """(base bundle + DELTA + DESCRIBE SCOPE, scope paths), or None when
+    there is no usable base. `only` narrows the scope (--misses)."""
+    base = root / ".claude" / ".sync" / BASE_DIR
+    base_bundle = read_or_none(base / "bundle.md")
+    try:
+        base_skeleton = json.loads(read_or_none(base / "skeleton.json") or "")
+        manifest = json.loads(read_or_none(base / "manifest.json") or "")
+        skeleton = json.loads(skeleton_text)
+    except json.JSONDecodeError:
+        return None
+    if base_bundle is None:
+        return None
+
+    old, new = _nodes_by_path(base_skeleton), _nodes_by_path(skeleton)
+    added = [new[p] for p in sorted(new) if p not in old]
+    changed = [new[p] for p in sorted(new) if p in old and new[p] != old[p]]
+    removed = sorted(p for p in old if p not in new)
+    skel_delta: dict = {"added": added, "changed": changed, "removed": removed}
+    for key in ("stats", "stack", "todos"):
+        if skeleton.get(key) != base_skeleton.get(key):
+            skel_delta[key] = skeleton.get(key)
+
+    scope = {n["path"] for n in added + changed}
+    sections: list[str] = [base_bundle.rstrip(), "\n===== DELTA ====="]
+    sections.append("\n--- skeleton (vs base) ---")
+    sections.append(json.dumps(skel_delta, indent=2))
+
+    old_scatter = manifest.get("scatter", {})
+    n_docs = 0
+    for rel, text in scatter or []:
+        if old_scatter.get(rel) == _sha(text):
+            continue
+        n_docs += 1
+        if rel + "/" in new:
+            scope.add(rel + "/")
+        sections.append(f"\n--- {rel}/CLAUDE.md ({'missing' if text is None else 'changed'}) ---")
+        if text is not None:
+            sections.append(text.rstrip())
+    old_docs = manifest.get("docs", {})
+    for name, text in docs:
+        if old_docs.get(name) != _sha(text):
+            sections.append(f"\n--- .claude/{name} (changed) ---")
+            sections.append(text.rstrip() if text else "(absent or empty)")
+
+    if only is not None:
+        scope &= only
+    sections.extend(scope_section(sorted(scope),
+                                  "every candidate is unchanged or cached since the base"))
+    print(f"# bundle: delta vs base — {len(added)} added, {len(changed)} changed, "
+          f"{len(removed)} removed node(s), {n_docs} changed scattered doc(s)",
+          file=sys.stderr)
+    return "\n".join(sections) + "\n", sorted(scope)
+
+
+# ─── main ────────────────────────────────────────────────────────────
+
+def parse_budget(argv: list[str]) -> tuple[int | None, bool]:
+    """(--budget value or None when absent, ok)."""
+    if "--budget" not in argv:
+        return None, True
+    idx = argv.index("--budget")
+    try:
+        value = int(argv[idx + 1])
+    except (IndexError, ValueError):
+        return None, False
+    return (value, True) if value > 0 else (None, False)
+
+
+def run(root: Path, *, budget: int | None = None, delta: bool = False, compact: bool = False,
+        misses: bool = False, skeleton_text: str | None = None,
+        scatter_rows: list[str] | None = None) -> int:
+    """Build .claude/.sync/bundle.md. skeleton_text / scatter_rows let an
+    in-process caller (sync_pipeline.py) hand over what it already loaded."""
+    claude_dir = root / ".claude"
+    skeleton_path = claude_dir / ".sync" / "skeleton.json"
+
+    if skeleton_text is None and not skeleton_path.is_file():
+        print(f"ERROR: {skeleton_path} not found. Run skeleton.py first (Step 2a).",
+              file=sys.stderr)
+        return 1
+
+    skeleton_text, scatter, docs = load_inputs(root, skeleton_text, scatter_rows)
+    n_scatter = sum(1 for _rel, text in scatter or [] if text is not None)
+
+    miss: list[str] | None = None
+    if misses:
+        try:
+            miss = cache_misses(root, json.loads(skeleton_text), load_cache(skeleton_path.parent))
+        except json.JSONDecodeError as e:
+            print(f"ERROR: unreadable skeleton.json: {e}", file=sys.stderr)
+            return 1
+
+    elided: list[str] = []
+    built = None
+    if delta:
+        built = delta_bundle(root, skeleton_text, scatter, docs,
+                             set(miss) if miss is not None else None)
+    if delta and built is None:
+        print("# bundle: no .claude/.sync/base/ snapshot yet — writing a full bundle",
+              file=sys.stderr)
+    if built is not None:
+        bundle = built[0]
+    elif budget is None and not compact:
+        bundle = assemble(skeleton_text, scatter, docs)
+    else:
+        try:
+            skeleton = json.loads(skeleton_text)
+        except json.JSONDecodeError as e:
+            print(f"ERROR: unreadable skeleton.json: {e}", file=sys.stderr)
+            return 1
+        render = encode_compact if compact else (lambda sk: json.dumps(sk, indent=2))
+        if budget is None:
+            bundle = assemble(render(skeleton), scatter, docs)
+        else:
+            bundle, elided = budget_bundle(root, skeleton, scatter, docs, budget, render)
+        if compact:  # vs the JSON of the same (possibly budget-reduced) skeleton
+            json_size = len(json.dumps(skeleton, indent=2).encode("utf-8"))
+            section = bundle.split("\n===== SCATTERED CLAUDE.md =====", 1)[0]
+            compact_size = len(section.encode("utf-8")) - len("===== SKELETON =====\n")
+            saved = json_size - compact_size
+            print(f"# bundle: compact skeleton {compact_size} bytes vs {json_size} as JSON "
+                  f"(saved {saved} bytes, ~{saved // 4} tokens)", file=sys.stderr)
+    if miss is not None and built is None:
+        bundle += "\n".join(scope_section(miss, "every candidate has a cached description")) + "\n"
+    try:
+        total = sum(len(v) for v in json.loads(skeleton_text).get("candidates", {}).values()
+                    if isinstance(v, list))
+    except (json.JSONDecodeError, AttributeError):
+        total = None
+    if miss is not None:
+        print(f"# bundle: {len(miss)} of {total} candidate(s) are cache misses "
+              f"(describe scope)", file=sys.stderr)
+
     out_path = claude_dir / ".sync" / "bundle.md"
     out_path.write_text(bundle, encoding="utf-8")
 
@@ -81,8 +455,40 @@ def main(argv: list[str]) -> int:
     print(f"# bundle: {size} bytes (~{size // 4} tokens), "
           f"{n_scatter} scattered CLAUDE.md -> {out_path.relative_to(root)}",
           file=sys.stderr)
+    note(root, bundle_mode="delta" if built is not None else "full",
+         bundle_bytes=size, candidates=total, elided=len(elided),
+         desc_cache_misses=len(miss) if miss is not None else None)
+    if budget is not None:
+        # the size actually written: the floor estimate is taken before the
+        # final render and its ELIDED lines are known, so it can disagree
+        over = (f" — still over budget at ~{size // 4} tokens (nothing is dropped outright)"
+                if size // 4 > budget else "")
+        print(f"# bundle: budget ~{budget} tokens, {len(elided)} item(s) elided{over}",
+              file=sys.stderr)
     return 0
 
 
+def main(argv: list[str]) -> int:
+    budget, ok = parse_budget(argv)
+    if not ok:
+        print("ERROR: --budget requires a positive integer (tokens)", file=sys.stderr)
+        return 1
+    delta = "--delta" in argv[1:]
+    compact = "--compact" in argv[1:]
+    misses = "--misses" in argv[1:]
+    if delta and (budget is not None or compact):
+        print("ERROR: --delta excludes --budget and --compact", file=sys.stderr)
+        return 1
+    args = argv[1:]
+    if budget is not None:
+        idx = args.index("--budget")
+        del args[idx:idx + 2]  # the flag and its value, not every equal string
+    args = [a for a in args if not a.startswith("--")]
+    root = Path(args[0] if args else os.getcwd()).resolve()
+    return run(root, budget=budget, delta=delta, compact=compact, misses=misses)
+
+
 if __name__ == "__main__":
-    sys.exit(main(sys.argv))
+    from daemon_client import forward  # warm daemon if running, else cold
+    rc = forward("bundle", sys.argv)
+    sys.exit(main(sys.argv) if rc is None else rc)
@@ -1,7 +1,7 @@
 #!/usr/bin/env bash
 # bundle.sh — thin wrapper around bundle.py for map-sync Step 2b.
 # Assembles .claude/.sync/bundle.md from skeleton + scattered CLAUDE.md + docs.
-# Usage: bash bundle.sh [project_root]   (default root: cwd)
+# Usage: bash bundle.sh [project_root] [--budget N | --delta] [--compact] [--misses]   (default root: cwd)
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -1,7 +1,7 @@
 #!/usr/bin/env bash
 # changed-dirs.sh — thin wrapper around changed_dirs.py for map-sync Step 1.
 # Emits the scatter directories that need regeneration, one per line.
-# Usage: bash changed-dirs.sh [project_root] [--full]   (default root: cwd)
+# Usage: bash changed-dirs.sh [project_root] [--full] [--plan [--budget N]]   (default root: cwd)
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
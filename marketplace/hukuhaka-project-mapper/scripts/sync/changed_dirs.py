@@ -20,26 +20,52 @@ Mapping (2-tier; targets are always scan.md scatter rows, never re-classified):
     changed = git diff --name-only <last_synced_commit>   (committed + tracked uncommitted + deletes)
             U git ls-files --others --exclude-standard     (untracked new files)
 
+Resume (every mode except --full): .map-sync-state also keeps "dirs", a
+per-scatter-dir fingerprint of the scatter extract recorded by
+`record_sync.py --dir D` right after D's CLAUDE.md is written. Rows whose
+fingerprint still matches are dropped, so a run interrupted halfway through
+Step 1 restarts with exactly the directories it had not finished.
+
 Full-sync (emit ALL scatter rows) when:
     - --full flag
     - no state file / unreadable / no last_synced_commit
     - last_synced_commit invalid (history rewrite)
     - not a git repo / no HEAD yet (mirrors scan.py's os.walk fallback path)
 
+Scheduler mode (--plan): instead of one row per line, emit a JSON batch plan
+for Step 1. Each target is sized by its scatter_extract (file count, bytes,
+~tokens at 4 bytes/token), then targets are bin-packed first-fit-decreasing
+into batches under a token budget (default PLAN_BUDGET). A target larger than
+the budget gets a batch of its own — never split, never dropped.
+
+    {"mode": "incremental"|"full", "budget_tokens": N, "parallelism": P,
+     "targets": N, "total_tokens": N,
+     "batches": [{"batch": 1, "tokens": N,
+                  "dirs": [{"path": "d/", "files": N, "bytes": N, "tokens": N}]}]}
+
+parallelism = min(len(batches), PLAN_MAX_PARALLEL): how many describe agents
+the orchestrator should have in flight at once.
+
 Usage:
     python3 changed_dirs.py [project_root] [--full]   (default root: cwd)
+    python3 changed_dirs.py [project_root] [--full] --plan [--budget N]
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import subprocess
 import sys
 from pathlib import Path
 
+from run_stats import note, take
+
 
 STATE_FILE = ".map-sync-state"
 PLACEHOLDER_MARKER = "## Files"  # filled scatter docs always have this; placeholders never do
+PLAN_BUDGET = 40_000     # ~tokens of scatter extract per describe batch
+PLAN_MAX_PARALLEL = 4    # describe agents in flight at once
 
 
 # ─── scan.md parsing ─────────────────────────────────────────────────
@@ -111,18 +137,52 @@ def changed_files(root: Path, since: str) -> list[str]:
 
 # ─── state ───────────────────────────────────────────────────────────
 
-def read_last_commit(claude_dir: Path) -> str | None:
+def read_state(claude_dir: Path) -> dict:
+    """The whole .map-sync-state object; {} when missing or unreadable."""
     state = claude_dir / STATE_FILE
     if not state.is_file():
-        return None
+        return {}
     try:
         data = json.loads(state.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
-        return None
-    sha = data.get("last_synced_commit")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def read_last_commit(claude_dir: Path, state: dict | None = None) -> str | None:
+    sha = (read_state(claude_dir) if state is None else state).get("last_synced_commit")
     return sha if isinstance(sha, str) and sha else None
 
 
+def dir_fingerprint(root: Path, rel_dir: str, extract_fn=None) -> str:
+    """sha256 of the dir's scatter extract — exactly the describe agent's
+    input, so an unchanged fingerprint means an unchanged CLAUDE.md.
+    extract_fn(root, rel_dir) replaces skeleton.scatter_extract (a caller's
+    memoized copy)."""
+    if extract_fn is None:
+        from skeleton import scatter_extract as extract_fn  # lazy: skeleton imports this module
+    extract = extract_fn(root, rel_dir.rstrip("/"))
+    return hashlib.sha256(extract.encode("utf-8")).hexdigest()
+
+
+def drop_synced(root: Path, rows: list[str], recorded: dict | None,
+                extract_fn=None) -> tuple[list[str], list[str]]:
+    """Split rows into (still to do, already synced). A row is synced when
+    its recorded fingerprint matches the current one and its CLAUDE.md is
+    filled (a placeholder always needs generation)."""
+    if not recorded:
+        return rows, []
+    todo: list[str] = []
+    done: list[str] = []
+    for r in rows:
+        fp = recorded.get(r.rstrip("/"))
+        if fp and not is_placeholder(root, r) and fp == dir_fingerprint(root, r, extract_fn):
+            done.append(r)
+        else:
+            todo.append(r)
+    return todo, done
+
+
 # ─── mapping ─────────────────────────────────────────────────────────
 
 def longest_scatter_prefix(dirpath: str, scatter: set[str]) -> str | None:
@@ -170,6 +230,55 @@ def compute_targets(root: Path, scatter_rows: list[str], changed: list[str]) ->
     return sorted(targets)
 
 
+# ─── scheduler (--plan) ──────────────────────────────────────────────
+
+def estimate_target(root: Path, rel_dir: str, extract_fn=None) -> dict:
+    """Size one scatter target by the exact extract the describe agent will
+    receive (skeleton.scatter_extract), not by a guess from file sizes."""
+    if extract_fn is None:
+        from skeleton import scatter_extract as extract_fn  # lazy: only --plan pays the import
+    extract = extract_fn(root, rel_dir)
+    size = len(extract.encode("utf-8"))
+    files = 0
+    for line in extract.splitlines()[:3]:  # header, children, files: N
+        if line.startswith("files: "):
+            files = int(line.split(":", 1)[1])
+    return {"path": rel_dir.rstrip("/") + "/", "files": files,
+            "bytes": size, "tokens": size // 4}
+
+
+def pack_batches(sized: list[dict], budget: int) -> list[dict]:
+    """First-fit-decreasing bin packing by tokens. Deterministic: ties break
+    on path, and each batch lists its dirs path-sorted."""
+    bins: list[dict] = []
+    for t in sorted(sized, key=lambda t: (-t["tokens"], t["path"])):
+        for b in bins:
+            if b["tokens"] + t["tokens"] <= budget:
+                b["dirs"].append(t)
+                b["tokens"] += t["tokens"]
+                break
+        else:
+            bins.append({"tokens": t["tokens"], "dirs": [t]})
+    for i, b in enumerate(bins, 1):
+        b["dirs"].sort(key=lambda t: t["path"])
+        b["batch"] = i
+    return [{"batch": b["batch"], "tokens": b["tokens"], "dirs": b["dirs"]} for b in bins]
+
+
+def build_plan(root: Path, rows: list[str], mode: str, budget: int,
+               extract_fn=None) -> dict:
+    sized = [estimate_target(root, r, extract_fn) for r in rows]
+    batches = pack_batches(sized, budget)
+    return {
+        "mode": mode,
+        "budget_tokens": budget,
+        "parallelism": min(len(batches), PLAN_MAX_PARALLEL),
+        "targets": len(sized),
+        "total_tokens": sum(t["tokens"] for t in sized),
+        "batches": batches,
+    }
+
+
 # ─── main ────────────────────────────────────────────────────────────
 
 def emit(rows: list[str]) -> None:
@@ -177,9 +286,79 @@ def emit(rows: list[str]) -> None:
         print(r.rstrip("/") + "/")
 
 
+def parse_budget(argv: list[str]) -> int | None:
+    """--budget N -> N; absent -> PLAN_BUDGET; malformed -> None."""
+    if "--budget" not in argv:
+        return PLAN_BUDGET
+    idx = argv.index("--budget")
+    try:
+        value = int(argv[idx + 1])
+    except (IndexError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def resuming(root: Path) -> bool:
+    """True while an interrupted run's markers still hold (record_sync.py)."""
+    from record_sync import active_run  # lazy: record_sync imports this module
+    return active_run(root, root / ".claude") is not None
+
+
+def select_targets(root: Path, scatter_rows: list[str], full: bool,
+                   extract_fn=None) -> tuple[str, list[str], list[str]]:
+    """(mode, scatter dirs to regenerate, dirs skipped as already synced).
+    Diagnostics on stderr. Starting a new run (anything but a resume)
+    clears the run stats an aborted run may have left behind."""
+    claude_dir = root / ".claude"
+    if full or not resuming(root):
+        take(claude_dir / ".sync")
+    state = read_state(claude_dir)
+    last = read_last_commit(claude_dir, state)
+
+    # Full-sync conditions.
+    reason = None
+    if full:
+        reason = "--full flag"
+    elif not head_exists(root):
+        reason = "not a git repo / no commit yet"
+    elif last is None:
+        reason = "no last_synced_commit in .map-sync-state (first sync)"
+    elif not commit_valid(root, last):
+        reason = "last_synced_commit invalid (history rewrite)"
+
+    if reason is not None:
+        print(f"# full-sync: {reason}", file=sys.stderr)
+        mode, rows = "full", scatter_rows
+    else:
+        changed = changed_files(root, last)  # type: ignore[arg-type]
+        mode, rows = "incremental", compute_targets(root, scatter_rows, changed)
+        print(f"# incremental: {len(changed)} changed file(s) -> "
+              f"{len(rows)}/{len(scatter_rows)} scatter dir(s)", file=sys.stderr)
+
+    # Resume: rows whose extract is unchanged since their CLAUDE.md was last
+    # written are already done (e.g. by an interrupted run). --full forces all.
+    skipped: list[str] = []
+    if not full:
+        rows, skipped = drop_synced(root, rows, state.get("dirs"), extract_fn)
+        if skipped:
+            print(f"# resume: {len(skipped)} dir(s) unchanged since last scatter write, "
+                  f"skipped", file=sys.stderr)
+
+    return mode, rows, skipped
+
+
 def main(argv: list[str]) -> int:
-    args = [a for a in argv[1:] if a != "--full"]
+    budget = parse_budget(argv)
+    if budget is None:
+        print("ERROR: --budget requires a positive integer (tokens)", file=sys.stderr)
+        return 1
+    args = argv[1:]
+    if "--budget" in args:
+        idx = args.index("--budget")
+        del args[idx:idx + 2]  # the flag and its value, not every equal string
+    args = [a for a in args if not a.startswith("--")]
     full = "--full" in argv[1:]
+    plan = "--plan" in argv[1:]
     root = Path(args[0] if args else os.getcwd()).resolve()
     claude_dir = root / ".claude"
     scan_md = claude_dir / "scan.md"
@@ -192,35 +371,21 @@ def main(argv: list[str]) -> int:
     scatter_rows = parse_scatter_rows(scan_md)
     if not scatter_rows:
         # No scatter rows at all — nothing to do (map-sync handles messaging).
+        if plan:
+            print(json.dumps(build_plan(root, [], "full", budget), indent=2))
         return 0
 
-    # Full-sync conditions.
-    reason = None
-    if full:
-        reason = "--full flag"
-    elif not head_exists(root):
-        reason = "not a git repo / no commit yet"
+    mode, rows, skipped = select_targets(root, scatter_rows, full)
+    note(root, mode=mode, scatter_dirs=len(scatter_rows), scatter_targets=len(rows),
+         scatter_resumed=len(skipped))
+    if plan:
+        print(json.dumps(build_plan(root, rows, mode, budget), indent=2))
     else:
-        last = read_last_commit(claude_dir)
-        if last is None:
-            reason = "no .map-sync-state (first sync)"
-        elif not commit_valid(root, last):
-            reason = "last_synced_commit invalid (history rewrite)"
-
-    if reason is not None:
-        print(f"# full-sync: {reason}", file=sys.stderr)
-        emit(scatter_rows)
-        return 0
-
-    # Incremental path.
-    last = read_last_commit(claude_dir)
-    changed = changed_files(root, last)  # type: ignore[arg-type]
-    targets = compute_targets(root, scatter_rows, changed)
-    print(f"# incremental: {len(changed)} changed file(s) -> "
-          f"{len(targets)}/{len(scatter_rows)} scatter dir(s)", file=sys.stderr)
-    emit(targets)
+        emit(rows)
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main(sys.argv))
+    from daemon_client import forward  # warm daemon if running, else cold
+    rc = forward("changed-dirs", sys.argv)
+    sys.exit(main(sys.argv) if rc is None else rc)
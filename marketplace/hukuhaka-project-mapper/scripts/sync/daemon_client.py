@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+daemon_client.py — hand a deterministic map-sync script run to the warm
+daemon (sync_daemon.py) when one is serving this project.
+
+scan.py, skeleton.py, changed_dirs.py and bundle.py call forward() before
+doing any work. It returns the daemon's exit code after replaying the
+daemon's stdout/stderr, or None when there is no daemon to use — no socket,
+connection refused, a daemon for another root, a daemon-side failure, or
+MAP_SYNC_DAEMON=0 in the environment. On None the script runs cold exactly
+as before, so the daemon is never required.
+
+Stdlib only and cheap on the no-daemon path: one stat of the socket path.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+ENV_SWITCH = "MAP_SYNC_DAEMON"        # "0" forces cold mode
+VALUE_FLAGS = {"--budget", "--scatter"}  # flags whose next arg is not the root
+CONNECT_TIMEOUT = 0.5
+REPLY_TIMEOUT = 600
+MAX_SOCKET_PATH = 100                 # AF_UNIX path limit is ~104-108 bytes
+
+
+def project_root(argv: list[str]) -> Path:
+    """The scripts' shared convention: first positional argument, else cwd."""
+    skip = False
+    for a in argv[1:]:
+        if skip:
+            skip = False
+            continue
+        if a in VALUE_FLAGS:
+            skip = True
+            continue
+        if not a.startswith("--"):
+            return Path(a).resolve()
+    return Path(os.getcwd()).resolve()
+
+
+def socket_path(root: Path) -> Path:
+    path = root / ".claude" / ".sync" / "daemon.sock"
+    if len(str(path)) <= MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"map-sync-{digest}.sock"
+
+
+def request(path: Path, payload: dict, timeout: float = REPLY_TIMEOUT) -> dict | None:
+    """One JSON request / one JSON reply per connection; None on any failure."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(CONNECT_TIMEOUT)
+            s.connect(str(path))
+            s.settimeout(timeout)
+            s.sendall(json.dumps(payload).encode("utf-8"))
+            s.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := s.recv(65536):
+                chunks.append(chunk)
+        reply = json.loads(b"".join(chunks).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    return reply if isinstance(reply, dict) else None
+
+
+def forward(stage: str, argv: list[str]) -> int | None:
+    if os.environ.get(ENV_SWITCH) == "0":
+        return None
+    path = socket_path(project_root(argv))
+    if not path.exists():
+        return None
+    reply = request(path, {"stage": stage, "argv": argv[1:], "cwd": os.getcwd()})
+    if reply is None or reply.get("fallback") or not isinstance(reply.get("rc"), int):
+        return None
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    return reply["rc"]
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+desc_cache.py — description cache keyed by skeleton node fingerprint.
+
+A candidate whose structure has not changed gets the same description from
+the describe agent every sync, so merge.py persists every LLM-written
+description under a fingerprint of the node it describes and reuses it for
+nodes the describe agent was not asked about. bundle.py --misses narrows the
+describe agent's scope to the nodes with no cache hit.
+
+Fingerprint = sha256 over the fields a description is written from:
+    file node  path, symbols, skeleton_doc, depends_on
+    directory  path, skeleton_doc, and the dir's scattered CLAUDE.md text
+
+Cache file: .claude/.sync/desc-cache.json
+    {"version": 1, "entries": {fingerprint: {"description": str,
+                                              "include": bool (entry candidates)}}}
+
+Rewritten whole by each merge (entries for the current skeleton only), so it
+never outgrows the project. Library module — no CLI.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+CACHE_FILE = "desc-cache.json"
+CACHE_VERSION = 1
+
+
+def fingerprint(root: Path, node: dict) -> str:
+    path = node.get("path", "")
+    if path.endswith("/"):
+        try:
+            scattered = (root / path / "CLAUDE.md").read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            scattered = None
+        key = {"path": path, "skeleton_doc": node.get("skeleton_doc", ""),
+               "claude_md": scattered}
+    else:
+        key = {"path": path, "symbols": node.get("symbols", []),
+               "skeleton_doc": node.get("skeleton_doc", ""),
+               "depends_on": node.get("depends_on", [])}
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_cache(sync_dir: Path) -> dict[str, dict]:
+    """fingerprint -> entry; {} when missing, unreadable, or another version."""
+    try:
+        data = json.loads((sync_dir / CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(sync_dir: Path, entries: dict[str, dict]) -> None:
+    path = sync_dir / CACHE_FILE
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": CACHE_VERSION, "entries": entries},
+                              indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def cache_misses(root: Path, skeleton: dict, cache: dict[str, dict]) -> list[str]:
+    """Candidate paths (entry points, components, directories) with no cached
+    description, path-sorted."""
+    cand = skeleton.get("candidates", {})
+    misses: list[str] = []
+    for section in ("entry_points", "components", "directories"):
+        for node in cand.get(section, []):
+            fp = fingerprint(root, node)
+            entry = cache.get(fp)
+            if entry is None or (section == "entry_points" and "include" not in entry):
+                misses.append(node["path"])
+    return sorted(misses)
@@ -16,10 +16,23 @@ Structural validation (anti-hallucination, by construction):
     - synth prose referencing node names absent from the skeleton is FLAGGED
       to stderr (kept — prose is not rewritten silently)
 
+Description cache (desc_cache.py): every candidate describe did not return
+takes the cached description (and entry verdict) stored under its node
+fingerprint, if any; afterwards the cache is rewritten from this merge's
+LLM-sourced descriptions (describe output and cache hits — never
+descriptions reused from base under --delta, which predate the node's
+current fingerprint). Unchanged nodes therefore never need describing.
+
+Delta runs (--delta): describe was only asked about the bundle's DESCRIBE
+SCOPE, so candidates it did not return keep the description and entry
+verdict they had in .claude/.sync/base/merged.json (the last recorded
+sync). Paths it did return always win.
+
 Usage:
-    python3 merge.py [project_root] < combined.json
+    python3 merge.py [project_root] [--delta] < combined.json
       where combined.json = {"describe": {...}, "synth": {...}}
-    Output: 9-field JSON on stdout (-> writer prompt). Diagnostics on stderr.
+    Output: 9-field JSON on stdout (-> writer prompt), also saved to
+    .claude/.sync/merged.json for resume. Diagnostics on stderr.
 """
 from __future__ import annotations
 
@@ -29,24 +42,44 @@ import re
 import sys
 from pathlib import Path
 
+from desc_cache import fingerprint, load_cache, save_cache
+from run_stats import note
+from skeleton_codec import load_skeleton
+
 
 def fail(msg: str) -> int:
     print(f"ERROR: {msg}", file=sys.stderr)
     return 1
 
 
-def main(argv: list[str]) -> int:
-    root = Path(argv[1] if len(argv) > 1 else os.getcwd()).resolve()
-    skeleton_path = root / ".claude" / ".sync" / "skeleton.json"
-    if not skeleton_path.is_file():
-        return fail(f"{skeleton_path} not found. Run skeleton.py first.")
-
+def load_base_descriptions(sync_dir: Path) -> dict[str, dict]:
+    """path -> {"description", "include"} from the last recorded sync's
+    merged JSON; entry verdicts are read back from entry_points membership."""
     try:
-        skeleton = json.loads(skeleton_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as e:
-        return fail(f"unreadable skeleton.json: {e}")
+        base = json.loads((sync_dir / "base" / "merged.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    out: dict[str, dict] = {}
+    for section in ("components", "directories", "entry_points"):
+        for item in base.get(section, []):
+            if isinstance(item, dict) and "path" in item:
+                out[item["path"]] = {"description": item.get("description", ""),
+                                     "include": section == "entry_points"}
+    return out
+
+
+def run(root: Path, raw: str, delta: bool = False, skeleton: dict | None = None) -> int:
+    """Merge the combined agent JSON `raw` against the skeleton (loaded from
+    .claude/.sync/skeleton.json unless given) and print the 9-field JSON."""
+    skeleton_path = root / ".claude" / ".sync" / "skeleton.json"
+    if skeleton is None:
+        if not skeleton_path.is_file():
+            return fail(f"{skeleton_path} not found. Run skeleton.py first.")
+        try:
+            skeleton = load_skeleton(skeleton_path)  # JSON or skeleton_codec compact form
+        except (ValueError, OSError) as e:
+            return fail(f"unreadable skeleton.json: {e}")
 
-    raw = sys.stdin.read()
     try:
         combined = json.loads(raw)
     except json.JSONDecodeError as e:
@@ -75,6 +108,41 @@ def main(argv: list[str]) -> int:
                 continue
             desc_by_path[path] = item
 
+    # fallbacks for candidates describe did not return: fingerprint cache,
+    # then (--delta) the last recorded sync's merged descriptions
+    sync_dir = skeleton_path.parent
+    all_cands = {**cand_entries, **cand_comps, **cand_dirs}
+    fps = {path: fingerprint(root, c) for path, c in all_cands.items()}
+    cache = load_cache(sync_dir)
+    # what may go back into the cache: this run's describe output and cache
+    # hits, both under the fingerprint they belong to. Delta-reused base
+    # descriptions are older than the node's current fingerprint and stay out.
+    cacheable = set(desc_by_path)
+    cached = 0
+    for path in sorted(all_cands):
+        if path not in desc_by_path and fps[path] in cache:
+            desc_by_path[path] = cache[fps[path]]
+            cacheable.add(path)
+            cached += 1
+    reused = 0
+    if delta:
+        for path, item in load_base_descriptions(sync_dir).items():
+            if path not in desc_by_path and path in all_cands:
+                desc_by_path[path] = item
+                reused += 1
+
+    new_cache: dict[str, dict] = {}
+    for path in sorted(cacheable):
+        item = desc_by_path[path]
+        text = str(item.get("description", "") or "")
+        if not text:
+            continue
+        entry: dict = {"description": text}
+        if path in cand_entries:
+            entry["include"] = item.get("include") is True
+        new_cache[fps[path]] = entry
+    save_cache(sync_dir, new_cache)
+
     def node(c: dict, path: str) -> dict:
         d = desc_by_path.get(path, {})
         out = {
@@ -141,12 +209,30 @@ def main(argv: list[str]) -> int:
     if unknown:
         print(f"# merge: data_flow references {len(unknown)} name(s) not in skeleton: "
               f"{', '.join(sorted(unknown)[:5])}", file=sys.stderr)
+    if cached:
+        print(f"# merge: reused {cached} cached description(s) (unchanged nodes)",
+              file=sys.stderr)
+    if delta:
+        print(f"# merge: reused {reused} description(s) from the delta base", file=sys.stderr)
     print(f"# merge: {len(entry_points)} entry_points, {len(components)} components, "
           f"{len(directories)} directories", file=sys.stderr)
 
-    print(json.dumps(result, indent=2))
+    note(root, desc_cache_hits=cached, delta_reused=reused if delta else 0,
+         dropped_paths=len(set(dropped)))
+
+    merged = json.dumps(result, indent=2)
+    # Persisted so an interrupted run can resume at Step 3 without re-running
+    # describe/synth (see record_sync.py --status).
+    (skeleton_path.parent / "merged.json").write_text(merged + "\n", encoding="utf-8")
+    print(merged)
     return 0
 
 
+def main(argv: list[str]) -> int:
+    args = [a for a in argv[1:] if not a.startswith("--")]
+    root = Path(args[0] if args else os.getcwd()).resolve()
+    return run(root, sys.stdin.read(), delta="--delta" in argv[1:])
+
+
 if __name__ == "__main__":
     sys.exit(main(sys.argv))
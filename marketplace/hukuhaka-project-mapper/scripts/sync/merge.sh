@@ -1,7 +1,7 @@
 #!/usr/bin/env bash
 # merge.sh — thin wrapper around merge.py for map-sync Step 2 (merge).
 # Reads {"describe": ..., "synth": ...} on stdin, emits the 9-field JSON.
-# Usage: bash merge.sh [project_root] < combined.json   (default root: cwd)
+# Usage: bash merge.sh [project_root] [--delta] < combined.json   (default root: cwd)
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -1,7 +1,8 @@
 #!/usr/bin/env bash
 # record-sync.sh — thin wrapper around record_sync.py.
-# Stamps .claude/.map-sync-state with current HEAD after a map-sync run.
-# Usage: bash record-sync.sh [project_root]   (default root: cwd)
+# Stamps .claude/.map-sync-state with current HEAD after a map-sync run, or
+# records resume markers during one (--dir D ..., --step NAME, --status).
+# Usage: bash record-sync.sh [project_root] [--dir D ... | --step NAME | --status]
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
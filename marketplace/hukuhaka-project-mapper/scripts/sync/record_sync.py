@@ -1,17 +1,42 @@
 #!/usr/bin/env python3
 """
-record_sync.py — stamp the last-synced commit after a map-sync run.
+record_sync.py — stamp map-sync progress into .claude/.map-sync-state.
 
-Writes .claude/.map-sync-state with the current HEAD so the next run's
-changed_dirs.py can compute an incremental scatter set. Called at the end
-of the map-sync pipeline (after Step 4). No-op on a non-git project — the
-incremental path is git-only, so leaving no state simply keeps full-sync.
+Final stamp (no flags): writes the current HEAD as last_synced_commit so the
+next run's changed_dirs.py can compute an incremental scatter set, closes
+the in-progress run, and snapshots .claude/.sync/base/ for bundle.py
+--delta. Called at the end of the map-sync pipeline (after Step 4). No-op
+on a non-git project — the incremental path is git-only, so leaving no
+commit simply keeps full-sync.
+
+Progress markers (called during the run, so an interrupted run resumes):
+    --dir D [D ...]  after D's scatter CLAUDE.md is written: record the
+                     fingerprint of D's scatter extract under "dirs". Next
+                     run, changed_dirs.py skips D while it still matches.
+    --step NAME      after a pipeline step completes (STEPS below): record
+                     it under "run.steps" together with the HEAD it ran at.
+    --status         print {"resume": bool, "done": [...], "next": step} as
+                     JSON. Markers only count while HEAD and the working tree
+                     are unchanged.
+
+The working tree is keyed by `git status --porcelain` plus the (mtime_ns,
+size) of every path it lists, so uncommitted edits made after a crashed
+run invalidate its markers too. Files the pipeline itself writes (.claude/,
+scatter CLAUDE.md) are left out of the key.
+
+State layout:
+    {"last_synced_commit": sha, "synced_at": iso,
+     "dirs": {"a/b": fingerprint, ...},
+     "run": {"head": sha, "tree": key, "started_at": iso,
+             "steps": {"scatter": iso, ...}}}
 
 Usage:
     python3 record_sync.py [project_root]   (default root: cwd)
+    python3 record_sync.py [project_root] --dir D [D ...] | --step NAME | --status
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import subprocess
@@ -19,8 +44,12 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from bundle import snapshot_base
+from changed_dirs import STATE_FILE, dir_fingerprint, parse_scatter_rows, read_state
 
-STATE_FILE = ".map-sync-state"
+# Pipeline steps that can be skipped on resume, in pipeline order. Step 5 is
+# the final stamp itself; it closes the run instead of marking it.
+STEPS = ("scatter", "analyze", "write", "validate")
 
 
 def head_sha(root: Path) -> str | None:
@@ -37,28 +66,165 @@ def head_sha(root: Path) -> str | None:
     return sha or None
 
 
-def main(argv: list[str]) -> int:
-    root = Path(argv[1] if len(argv) > 1 else os.getcwd()).resolve()
-    claude_dir = root / ".claude"
-    if not claude_dir.is_dir():
-        print(f"record_sync: {claude_dir} does not exist; nothing recorded.", file=sys.stderr)
-        return 0
+def worktree_key(root: Path) -> str | None:
+    """Fingerprint of the uncommitted state: each dirty or untracked path
+    with its status and (mtime_ns, size). None without git."""
+    try:
+        r = subprocess.run(
+            ["git", "-C", str(root), "status", "--porcelain", "-z", "--untracked-files=all"],
+            capture_output=True, timeout=60,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if r.returncode != 0:
+        return None
+    h = hashlib.sha256()
+    fields = r.stdout.decode("utf-8", "surrogateescape").split("\0")
+    i = 0
+    while i < len(fields):
+        rec = fields[i]
+        i += 1
+        if len(rec) < 4:
+            continue
+        code, path = rec[:2], rec[3:]
+        if "R" in code or "C" in code:
+            i += 1  # the rename/copy source follows as its own field
+        if path.startswith(".claude/") or path.rsplit("/", 1)[-1] == "CLAUDE.md":
+            continue  # written by the pipeline itself
+        try:
+            st = (root / path).stat()
+            mark = f"{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            mark = "-"
+        h.update(f"{code} {path} {mark}\n".encode("utf-8", "surrogateescape"))
+    return h.hexdigest()
+
+
+def run_key(root: Path) -> dict:
+    return {"head": head_sha(root), "tree": worktree_key(root)}
+
+
+def write_state(claude_dir: Path, data: dict) -> Path:
+    state = claude_dir / STATE_FILE
+    tmp = state.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(state)  # atomic: an interrupted write never corrupts resume state
+    return state
+
+
+def same_run(run, key: dict) -> bool:
+    return isinstance(run, dict) and all(run.get(k) == v for k, v in key.items())
+
 
+def current_run(data: dict, key: dict) -> dict:
+    """The in-progress run at this HEAD and working tree, or a fresh one
+    (markers recorded against other code are stale — it has moved)."""
+    run = data.get("run")
+    if same_run(run, key):
+        run.setdefault("steps", {})
+        return run
+    return {**key, "started_at": datetime.now().isoformat(), "steps": {}}
+
+
+def record_dirs(root: Path, claude_dir: Path, dirs: list[str]) -> int:
+    if not dirs:
+        print("ERROR: --dir requires at least one directory", file=sys.stderr)
+        return 1
+    data = read_state(claude_dir)
+    recorded = data.get("dirs") if isinstance(data.get("dirs"), dict) else {}
+    for d in dirs:
+        rel = d.rstrip("/")
+        if not (root / rel).is_dir():
+            print(f"ERROR: {rel}/ is not a directory", file=sys.stderr)
+            return 1
+        recorded[rel] = dir_fingerprint(root, rel)
+    data["dirs"] = recorded
+    data["run"] = current_run(data, run_key(root))
+    write_state(claude_dir, data)
+    print(f"record_sync: {len(dirs)} scatter dir(s) marked synced")
+    return 0
+
+
+def record_step(root: Path, claude_dir: Path, step: str) -> int:
+    if step not in STEPS:
+        print(f"ERROR: unknown step '{step}' (expected one of: {', '.join(STEPS)})",
+              file=sys.stderr)
+        return 1
+    data = read_state(claude_dir)
+    run = current_run(data, run_key(root))
+    run["steps"][step] = datetime.now().isoformat()
+    data["run"] = run
+    write_state(claude_dir, data)
+    print(f"record_sync: step '{step}' done")
+    return 0
+
+
+def active_run(root: Path, claude_dir: Path) -> dict | None:
+    """The recorded run if its markers still hold for this code, else None."""
+    run = read_state(claude_dir).get("run")
+    return run if same_run(run, run_key(root)) else None
+
+
+def status(root: Path, claude_dir: Path) -> int:
+    run = active_run(root, claude_dir)
+    done: list[str] = []
+    if run is not None:
+        steps = run.get("steps") or {}
+        for step in STEPS:  # only a contiguous prefix is resumable
+            if step not in steps:
+                break
+            done.append(step)
+    nxt = next((s for s in STEPS if s not in done), "record")
+    print(json.dumps({"resume": bool(done), "done": done, "next": nxt}))
+    return 0
+
+
+def stamp(root: Path, claude_dir: Path) -> int:
     sha = head_sha(root)
     if sha is None:
         print("record_sync: not a git repo / no HEAD; state not written (stays full-sync).",
               file=sys.stderr)
         return 0
 
-    state = claude_dir / STATE_FILE
-    state.write_text(
-        json.dumps({"last_synced_commit": sha, "synced_at": datetime.now().isoformat()},
-                   indent=2) + "\n",
-        encoding="utf-8",
-    )
-    print(f"record_sync: {state.relative_to(root)} <- {sha[:12]}")
+    data = read_state(claude_dir)
+    data.pop("run", None)
+    data["last_synced_commit"] = sha
+    data["synced_at"] = datetime.now().isoformat()
+    recorded = data.get("dirs")
+    scan_md = claude_dir / "scan.md"
+    if isinstance(recorded, dict) and scan_md.is_file():
+        rows = set(parse_scatter_rows(scan_md))
+        data["dirs"] = {d: fp for d, fp in sorted(recorded.items()) if d in rows}
+    state = write_state(claude_dir, data)
+    based = " (+ delta base)" if snapshot_base(root) else ""
+    print(f"record_sync: {state.relative_to(root)} <- {sha[:12]}{based}")
     return 0
 
 
+def main(argv: list[str]) -> int:
+    args = argv[1:]
+    flag_at = next((i for i, a in enumerate(args) if a.startswith("--")), len(args))
+    positional, flags = args[:flag_at], args[flag_at:]
+    root = Path(positional[0] if positional else os.getcwd()).resolve()
+    claude_dir = root / ".claude"
+    if not claude_dir.is_dir():
+        print(f"record_sync: {claude_dir} does not exist; nothing recorded.", file=sys.stderr)
+        return 0
+
+    if not flags:
+        return stamp(root, claude_dir)
+    if flags[0] == "--dir":
+        return record_dirs(root, claude_dir, flags[1:])
+    if flags[0] == "--step":
+        if len(flags) != 2:
+            print("ERROR: --step requires exactly one step name", file=sys.stderr)
+            return 1
+        return record_step(root, claude_dir, flags[1])
+    if flags[0] == "--status":
+        return status(root, claude_dir)
+    print(f"ERROR: unknown flag {flags[0]}", file=sys.stderr)
+    return 1
+
+
 if __name__ == "__main__":
     sys.exit(main(sys.argv))
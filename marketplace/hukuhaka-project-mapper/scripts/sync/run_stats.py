@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+run_stats.py — per-run metrics noted by the map-sync step scripts.
+
+changed_dirs.py, bundle.py and merge.py each note the figures only they
+know (scatter targets, bundle size, description-cache hits) in
+.claude/.sync/run-stats.json. sync_cost.py takes the file when the run is
+stamped and folds it into that run's history.jsonl line, so the next run
+starts from an empty set; changed_dirs.py also clears it when a run starts
+fresh, so an aborted run's notes never reach the next one's line. Notes are best-effort: a failed write never fails
+the step that made it. Library module — no CLI.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+STATS_FILE = "run-stats.json"
+
+
+def _read(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def note(root: Path, **values) -> None:
+    """Merge `values` into the current run's stats (later notes win)."""
+    sync_dir = root / ".claude" / ".sync"
+    path = sync_dir / STATS_FILE
+    data = _read(path)
+    data.update(values)
+    try:
+        sync_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def note_timings(root: Path, timings: dict[str, float]) -> None:
+    """Merge per-stage seconds into "stage_timings" (stages of one run may
+    come from several processes)."""
+    path = root / ".claude" / ".sync" / STATS_FILE
+    merged = _read(path).get("stage_timings")
+    merged = merged if isinstance(merged, dict) else {}
+    merged.update({k: round(v, 3) for k, v in timings.items()})
+    note(root, stage_timings=merged)
+
+
+def take(sync_dir: Path) -> dict:
+    """Return the noted stats and clear them for the next run."""
+    path = sync_dir / STATS_FILE
+    data = _read(path)
+    try:
+        path.unlink()
+    except OSError:
+        pass
+    return data
@@ -810,14 +810,24 @@ def parse_console_scripts(root: Path) -> set[str]:
     return out
 
 
-def build_skeleton(root: Path) -> dict:
-    rels = list_files(root)
+def extract_path(root: Path, rel: str) -> dict | None:
+    text = read_text(root / rel)
+    return extract_file(rel, text) if text is not None else None
+
+
+def build_skeleton(root: Path, rels: list[str] | None = None,
+                   scatter_rows: list[str] | None = None, file_info=None) -> dict:
+    """rels / scatter_rows: the file index and scan.md scatter rows, when the
+    caller already holds them (sync_pipeline.py); otherwise computed here.
+    file_info(root, rel) replaces extract_path (e.g. the daemon's warm cache;
+    it must return a fresh dict — merge_decl_def mutates them)."""
+    if rels is None:
+        rels = list_files(root)
+    if file_info is None:
+        file_info = extract_path
     extracted: dict[str, dict] = {}
     for rel in rels:
-        text = read_text(root / rel)
-        if text is None:
-            continue
-        info = extract_file(rel, text)
+        info = file_info(root, rel)
         if info is not None:
             extracted[rel] = info
 
@@ -862,9 +872,11 @@ def build_skeleton(root: Path) -> dict:
     # directories: scan.md scatter rows first (authoritative), else top-level dirs
     directories: list[dict] = []
     scan_md = root / ".claude" / "scan.md"
-    if scan_md.is_file():
+    if scatter_rows is None and scan_md.is_file():
         from changed_dirs import parse_scatter_rows
-        for d in parse_scatter_rows(scan_md):
+        scatter_rows = parse_scatter_rows(scan_md)
+    if scatter_rows is not None:
+        for d in scatter_rows:
             n_files = sum(1 for r in rels if r.startswith(d + "/"))
             directories.append({"path": d + "/", "skeleton_doc": f"{n_files} file(s)"})
     else:
@@ -927,6 +939,21 @@ def scatter_extract(root: Path, rel_dir: str) -> str:
 
 # ─── main ────────────────────────────────────────────────────────────
 
+def write_skeleton(root: Path, skeleton: dict) -> str:
+    """Write .claude/.sync/skeleton.json and report it; returns the text
+    written (bundle.py's SKELETON section, byte for byte)."""
+    sync_dir = root / ".claude" / ".sync"
+    sync_dir.mkdir(exist_ok=True)
+    out_path = sync_dir / "skeleton.json"
+    text = json.dumps(skeleton, indent=2) + "\n"
+    out_path.write_text(text, encoding="utf-8")
+    s = skeleton["stats"]
+    print(f"# skeleton: {s['files_scanned']} files, {s['entry_candidates_found']} entry candidates, "
+          f"{s['components_found']} components, {s['todos_found']} todos -> {out_path.relative_to(root)}",
+          file=sys.stderr)
+    return text
+
+
 def main(argv: list[str]) -> int:
     args = [a for a in argv[1:] if not a.startswith("--")]
     scatter_dir = None
@@ -949,17 +976,11 @@ def main(argv: list[str]) -> int:
               file=sys.stderr)
         return 1
 
-    skeleton = build_skeleton(root)
-    sync_dir = claude_dir / ".sync"
-    sync_dir.mkdir(exist_ok=True)
-    out_path = sync_dir / "skeleton.json"
-    out_path.write_text(json.dumps(skeleton, indent=2) + "\n", encoding="utf-8")
-    s = skeleton["stats"]
-    print(f"# skeleton: {s['files_scanned']} files, {s['entry_candidates_found']} entry candidates, "
-          f"{s['components_found']} components, {s['todos_found']} todos -> {out_path.relative_to(root)}",
-          file=sys.stderr)
+    write_skeleton(root, build_skeleton(root))
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main(sys.argv))
+    from daemon_client import forward  # warm daemon if running, else cold
+    rc = forward("skeleton", sys.argv)
+    sys.exit(main(sys.argv) if rc is None else rc)
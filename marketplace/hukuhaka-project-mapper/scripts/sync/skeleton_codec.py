@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+skeleton_codec.py — dense, lossless text encoding of skeleton.json.
+
+skeleton.json is written with indent=2, and the repeated node keys plus
+indentation are a large share of bundle tokens. This codec re-encodes the
+same data as line-oriented tables for agent consumption (bundle.py
+--compact); decode() gives back a dict equal to the original, so merge.py
+can load either form (load_skeleton sniffs the header).
+
+Layout (TAB-separated fields):
+
+    # skeleton/compact v1 ...            header + legend comment lines
+    @stats  k=v ...                      v is JSON
+    @stack  item ...
+    @deps   name0  name1 ...             interned depends_on names (by position)
+    @todos                               rows: file  line  text
+    @entry_points / @components          rows grouped under '>dir' lines:
+        file  name  deps  doc  reasons  extra
+          name    blank = derived from the path (stem; parent for __init__)
+          deps    comma-separated @deps positions
+          reasons '; '-separated entry_reasons (blank = not an entry candidate)
+          extra   JSON of any other keys (blank if none)
+        <TAB>symbol                      symbol lines belong to the row above
+    @directories                         rows: path  doc
+    ={...}                               any row that does not fit its table,
+                                         verbatim as JSON
+    @json  key  {...}                    any other top-level key, verbatim
+
+Field escaping: backslash, TAB and newline as \\\\ \\t \\n; ';' as \\; inside
+list fields; a row's first field starting with a line marker ('>', '@',
+'#', '=') gets a leading backslash.
+
+Usage:
+    python3 skeleton_codec.py encode < skeleton.json > skeleton.txt
+    python3 skeleton_codec.py decode < skeleton.txt  > skeleton.json
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+HEADER = "# skeleton/compact v1"
+LEGEND = [
+    HEADER + " — lossless tabular form of skeleton.json (TAB-separated)",
+    "# node row: file  name(blank=file stem)  deps(@deps positions)  doc  "
+    "entry_reasons(blank=not entry)  extra(JSON)",
+    "# '>dir' sets the directory for the rows below; '<TAB>symbol' lines list "
+    "the symbols of the row above",
+]
+NODE_KEYS = ("name", "path", "depends_on", "skeleton_doc", "symbols")
+LINE_MARKERS = (">", "@", "#", "=")
+
+
+# ─── escaping ────────────────────────────────────────────────────────
+
+def esc(s: str, in_list: bool = False, first: bool = False) -> str:
+    out = s.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+    if in_list:
+        out = out.replace(";", "\\;")
+    if first and out[:1] in LINE_MARKERS:
+        out = "\\" + out
+    return out
+
+
+def unesc(s: str) -> str:
+    out: list[str] = []
+    i = 0
+    while i < len(s):
+        c = s[i]
+        if c == "\\" and i + 1 < len(s):
+            nxt = s[i + 1]
+            out.append({"t": "\t", "n": "\n"}.get(nxt, nxt))
+            i += 2
+            continue
+        out.append(c)
+        i += 1
+    return "".join(out)
+
+
+def split_list(s: str) -> list[str]:
+    """Split a '; '-joined escaped list field, honouring \\; escapes."""
+    if not s:
+        return []
+    items: list[str] = []
+    cur: list[str] = []
+    i = 0
+    while i < len(s):
+        if s[i] == "\\" and i + 1 < len(s):
+            cur.append(s[i:i + 2])
+            i += 2
+            continue
+        if s.startswith("; ", i):
+            items.append(unesc("".join(cur)))
+            cur = []
+            i += 2
+            continue
+        cur.append(s[i])
+        i += 1
+    items.append(unesc("".join(cur)))
+    return items
+
+
+def default_name(path: str) -> str:
+    """skeleton.py's node naming rule: file stem, parent dir for __init__."""
+    p = Path(path)
+    return p.stem if p.stem != "__init__" else p.parent.name
+
+
+# ─── encode ──────────────────────────────────────────────────────────
+
+def _regular_node(n: dict) -> bool:
+    if not all(k in n for k in NODE_KEYS):
+        return False
+    if not isinstance(n["path"], str) or not n["path"] or n["path"].endswith("/"):
+        return False
+    if not all(isinstance(s, str) for s in n["symbols"] + n["depends_on"]):
+        return False
+    has_reasons = "entry_reasons" in n
+    if has_reasons != (n.get("is_entry_candidate") is True):
+        return False
+    if has_reasons and (not n["entry_reasons"]
+                        or not all(isinstance(r, str) for r in n["entry_reasons"])):
+        return False
+    return isinstance(n["skeleton_doc"], str) and isinstance(n["name"], str)
+
+
+def encode(skeleton: dict) -> str:
+    lines: list[str] = list(LEGEND)
+    cand = skeleton.get("candidates", {})
+    node_sections = ("entry_points", "components")
+
+    deps: list[str] = []
+    dep_ix: dict[str, int] = {}
+    for section in node_sections:
+        for n in cand.get(section, []):
+            for d in n.get("depends_on", []) if isinstance(n, dict) else []:
+                if isinstance(d, str) and d not in dep_ix:
+                    dep_ix[d] = len(deps)
+                    deps.append(d)
+
+    if "stats" in skeleton:
+        lines.append("@stats\t" + "\t".join(
+            f"{esc(k)}={json.dumps(v)}" for k, v in skeleton["stats"].items()))
+    if "stack" in skeleton:
+        stack = skeleton["stack"]
+        if isinstance(stack, list) and all(isinstance(s, str) for s in stack):
+            lines.append("\t".join(["@stack"] + [esc(s) for s in stack]))
+        else:
+            lines.append(f"@json\tstack\t{json.dumps(stack)}")
+    lines.append("\t".join(["@deps"] + [esc(d) for d in deps]))
+
+    if "todos" in skeleton:
+        lines.append("@todos")
+        for t in skeleton["todos"]:
+            if (isinstance(t, dict) and set(t) == {"file", "line", "text"}
+                    and isinstance(t["file"], str) and t["file"]
+                    and isinstance(t["text"], str)
+                    and isinstance(t["line"], int) and not isinstance(t["line"], bool)):
+                lines.append(f"{esc(t['file'], first=True)}\t{t['line']}\t{esc(t['text'])}")
+            else:
+                lines.append("=" + json.dumps(t))
+
+    for section in node_sections:
+        if section not in cand:
+            continue
+        lines.append("@" + section)
+        cur_dir = None
+        for n in cand[section]:
+            if not isinstance(n, dict) or not _regular_node(n):
+                lines.append("=" + json.dumps(n))
+                cur_dir = None
+                continue
+            d, _, f = n["path"].rpartition("/")
+            if d != cur_dir:
+                lines.append(">" + esc(d))
+                cur_dir = d
+            name = "" if n["name"] == default_name(n["path"]) else esc(n["name"])
+            extra = {k: v for k, v in n.items()
+                     if k not in NODE_KEYS and k not in ("entry_reasons", "is_entry_candidate")}
+            lines.append("\t".join([
+                esc(f, first=True),
+                name,
+                ",".join(str(dep_ix[x]) for x in n["depends_on"]),
+                esc(n["skeleton_doc"]),
+                "; ".join(esc(r, in_list=True) for r in n.get("entry_reasons", [])),
+                json.dumps(extra) if extra else "",
+            ]).rstrip("\t"))
+            lines.extend("\t" + esc(s) for s in n["symbols"])
+
+    if "directories" in cand:
+        lines.append("@directories")
+        for d in cand["directories"]:
+            if (isinstance(d, dict) and set(d) == {"path", "skeleton_doc"}
+                    and isinstance(d["path"], str) and d["path"]
+                    and isinstance(d["skeleton_doc"], str)):
+                lines.append(f"{esc(d['path'], first=True)}\t{esc(d['skeleton_doc'])}")
+            else:
+                lines.append("=" + json.dumps(d))
+
+    for k in cand:
+        if k not in node_sections and k != "directories":
+            lines.append(f"@json\tcandidates.{esc(k)}\t{json.dumps(cand[k])}")
+    for k in skeleton:
+        if k not in ("stats", "stack", "todos", "candidates"):
+            lines.append(f"@json\t{esc(k)}\t{json.dumps(skeleton[k])}")
+    return "\n".join(lines) + "\n"
+
+
+# ─── decode ──────────────────────────────────────────────────────────
+
+def decode(text: str) -> dict:
+    lines = text.splitlines()
+    if not lines or not lines[0].startswith(HEADER):
+        raise ValueError("not a skeleton/compact v1 document")
+    skeleton: dict = {}
+    cand: dict = {}
+    deps: list[str] = []
+    section = None
+    cur_dir = ""
+    last_node: dict | None = None
+    has_candidates = False
+
+    for line in lines:
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("@"):
+            head, sep, rest = line.partition("\t")
+            fields = rest.split("\t") if sep else []
+            last_node = None
+            if head == "@stats":
+                skeleton["stats"] = {}
+                for f in fields:
+                    k, _, v = f.partition("=")
+                    skeleton["stats"][unesc(k)] = json.loads(v)
+            elif head == "@stack":
+                skeleton["stack"] = [unesc(f) for f in fields]
+            elif head == "@deps":
+                deps = [unesc(f) for f in fields]
+            elif head == "@json":
+                key, value = unesc(fields[0]), json.loads("\t".join(fields[1:]))
+                if key.startswith("candidates."):
+                    cand[key[len("candidates."):]] = value
+                    has_candidates = True
+                else:
+                    skeleton[key] = value
+            else:
+                section = head[1:]
+                if section == "todos":
+                    skeleton["todos"] = []
+                else:
+                    cand[section] = []
+                    has_candidates = True
+                cur_dir = ""
+            continue
+        if line.startswith("="):
+            obj = json.loads(line[1:])
+            (skeleton["todos"] if section == "todos" else cand[section]).append(obj)
+            last_node = None
+            continue
+        if line.startswith(">"):
+            cur_dir = unesc(line[1:])
+            continue
+        if line.startswith("\t"):
+            if last_node is None:
+                raise ValueError(f"symbol line without a node row: {line!r}")
+            last_node["symbols"].append(unesc(line[1:]))
+            continue
+
+        fields = line.split("\t")
+        if section == "todos":
+            skeleton["todos"].append({"file": unesc(fields[0]), "line": int(fields[1]),
+                                      "text": unesc(fields[2])})
+        elif section == "directories":
+            cand["directories"].append({"path": unesc(fields[0]),
+                                        "skeleton_doc": unesc(fields[1])})
+        else:
+            fields += [""] * (6 - len(fields))
+            f, name, dep_field, doc, reasons, extra = fields[:6]
+            path = f"{cur_dir}/{unesc(f)}" if cur_dir else unesc(f)
+            node: dict = {
+                "name": unesc(name) if name else default_name(path),
+                "path": path,
+                "depends_on": [deps[int(i)] for i in dep_field.split(",")] if dep_field else [],
+                "skeleton_doc": unesc(doc),
+                "symbols": [],
+            }
+            if reasons:
+                node["is_entry_candidate"] = True
+                node["entry_reasons"] = split_list(reasons)
+            if extra:
+                node.update(json.loads(extra))
+            cand[section].append(node)
+            last_node = node
+
+    if has_candidates:
+        skeleton["candidates"] = cand
+    return skeleton
+
+
+def load_skeleton(path: Path) -> dict:
+    """Read a skeleton in either form (JSON or compact). Raises ValueError /
+    OSError on unreadable input."""
+    text = path.read_text(encoding="utf-8")
+    if text.startswith(HEADER):
+        return decode(text)
+    return json.loads(text)
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 2 or argv[1] not in ("encode", "decode"):
+        print("Usage: skeleton_codec.py encode|decode < input > output", file=sys.stderr)
+        return 1
+    data = sys.stdin.read()
+    try:
+        if argv[1] == "encode":
+            sys.stdout.write(encode(json.loads(data)))
+        else:
+            sys.stdout.write(json.dumps(decode(data), indent=2) + "\n")
+    except ValueError as e:  # JSONDecodeError is a ValueError
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
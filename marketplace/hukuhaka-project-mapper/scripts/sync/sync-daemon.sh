@@ -0,0 +1,14 @@
+#!/usr/bin/env bash
+# sync-daemon.sh — thin wrapper around sync_daemon.py (opt-in warm daemon).
+# scan/skeleton/changed-dirs/bundle use it automatically while it runs.
+# Usage: bash sync-daemon.sh [project_root] start|stop|status   (default root: cwd)
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+if ! command -v python3 >/dev/null 2>&1; then
+    echo "ERROR: python3 not found. map-sync requires python3." >&2
+    exit 1
+fi
+
+python3 "$SCRIPT_DIR/sync_daemon.py" "$@"
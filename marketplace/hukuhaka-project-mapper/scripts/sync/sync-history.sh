@@ -0,0 +1,14 @@
+#!/usr/bin/env bash
+# sync-history.sh — thin wrapper around sync_history.py for map-history.
+# Prints rolling medians, trends and regressions from .claude/.sync/history.jsonl.
+# Usage: bash sync-history.sh [project_root ...] [--window N] [--threshold PCT] [--json]   (default root: cwd)
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+if ! command -v python3 >/dev/null 2>&1; then
+    echo "ERROR: python3 not found. map-history requires python3." >&2
+    exit 1
+fi
+
+python3 "$SCRIPT_DIR/sync_history.py" "$@"
@@ -0,0 +1,14 @@
+#!/usr/bin/env bash
+# sync-pipeline.sh — thin wrapper around sync_pipeline.py (map-sync stages in one process).
+# Chain stages with '+' to share scan.md, the file index and the skeleton between them.
+# Usage: bash sync-pipeline.sh [project_root] STAGE [flags] [+ STAGE [flags] ...]   (default root: cwd)
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+if ! command -v python3 >/dev/null 2>&1; then
+    echo "ERROR: python3 not found. map-sync requires python3." >&2
+    exit 1
+fi
+
+python3 "$SCRIPT_DIR/sync_pipeline.py" "$@"
@@ -3,8 +3,9 @@
 sync_cost.py — PostToolUse hook: report wall + token usage when a map-sync
 pipeline completes.
 
-Fires on every Bash PostToolUse; exits silently unless the command was the
-pipeline's terminal step (record-sync). Then it slices the session
+Fires on every Bash PostToolUse; exits silently (no transcript I/O) unless
+the command was preflight.sh or record-sync, and reports only on the
+pipeline's terminal step (the flagless record-sync). Then it slices the session
 transcript from the most recent preflight.sh invocation (pipeline start)
 to the end, sums token usage across assistant messages in that window
 (main loop + any subagent events present in the file), and injects the
@@ -20,14 +21,38 @@ Tokens are exact (summed from per-message usage). USD is deliberately NOT
 reported — interactive transcripts carry no total_cost_usd and a hardcoded
 price table would rot.
 
+Transcript cursor: long sessions have transcripts of tens of MB, so the
+transcript is never re-read from the start. .claude/.sync/cost-cursor.json
+keeps, per transcript path, the byte offset already consumed plus the running
+window (usage sums, first/last timestamp) since the last preflight. Every
+preflight / record-sync invocation (progress markers included) folds only the
+lines appended since the previous one; a preflight line resets the window. A
+transcript that shrank (rewritten) is re-read from byte 0. Without a .claude/
+dir in the hook cwd nothing is persisted and the whole file is read.
+
+Per-step breakdown: the window is further cut at pipeline step boundaries —
+the step scripts' Bash invocations (changed-dirs, skeleton, bundle, merge,
+record-sync) and the Agent spawns (scatter / describe+synth / writer /
+validator). Every event's usage and timestamp go to the step open at that
+line; a step's wall time runs to the next step's first event. The table is
+appended to additionalContext and written to .claude/.sync/cost.json.
+
+History: each reported run is also appended as one line to
+.claude/.sync/history.jsonl — totals, per-step figures, files scanned (from
+skeleton.json) and the metrics the step scripts noted in run-stats.json
+(scatter targets, bundle bytes, description-cache hits/misses; see
+run_stats.py). sync_history.py reports medians, trends and regressions.
+
 Input:  hook JSON on stdin ({tool_name, tool_input, transcript_path, ...})
 Output: {"hookSpecificOutput": {...additionalContext...}} on stdout, or nothing.
 """
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -39,6 +64,31 @@ RECORD_INVOCATION = re.compile(r"(?:^|[\s;&|/])record[-_]sync\.(?:sh|py)(?:[\s;&
 # anchoring: a command that only mentions "preflight" in prose must not move the
 # window start (it would silently undercount the wall/token totals).
 PREFLIGHT_INVOCATION = re.compile(r"(?:^|[\s;&|/])preflight\.sh(?:[\s;&|>]|$)")
+# record-sync progress markers (--dir / --step / --status) run mid-pipeline;
+# only the flagless final stamp ends the run.
+RECORD_MARKER = re.compile(r"record[-_]sync\.(?:sh|py)\b[^;&|]*\s--(?:dir|step|status)\b")
+
+CURSOR_FILE = "cost-cursor.json"
+CURSOR_VERSION = 2
+COST_FILE = "cost.json"
+HISTORY_FILE = "history.jsonl"
+MAX_CURSORS = 8  # transcripts remembered; least recently seen pruned first
+USAGE_KEYS = ("input_tokens", "output_tokens",
+              "cache_creation_input_tokens", "cache_read_input_tokens")
+
+# Step boundaries, first match wins. skeleton --scatter is Step 1's extractor,
+# so it is matched before the Step 2 skeleton pass.
+STEP_SCRIPTS = [
+    ("scatter", re.compile(r"(?:^|[\s;&|/])changed[-_]dirs\.(?:sh|py)(?:[\s;&|>]|$)")),
+    ("scatter", re.compile(r"(?:^|[\s;&|/])skeleton\.(?:sh|py)\b[^;&|]*\s--scatter\b")),
+    ("skeleton", re.compile(r"(?:^|[\s;&|/])skeleton\.(?:sh|py)(?:[\s;&|>]|$)")),
+    ("bundle", re.compile(r"(?:^|[\s;&|/])bundle\.(?:sh|py)(?:[\s;&|>]|$)")),
+    ("merge", re.compile(r"(?:^|[\s;&|/])merge\.(?:sh|py)(?:[\s;&|>]|$)")),
+    ("validate", re.compile(r"(?:^|[\s;&|/])validate[-_]refs\.(?:sh|py)(?:[\s;&|>]|$)")),
+]
+# Agent spawns by subagent_type suffix (scatter-mode prompts stay in Step 1).
+STEP_AGENTS = {"describe": "describe+synth", "synth": "describe+synth",
+               "writer": "write", "validator": "validate"}
 
 
 def parse_ts(s: str):
@@ -48,6 +98,201 @@ def parse_ts(s: str):
         return None
 
 
+def new_window() -> dict:
+    return {"usage": dict.fromkeys(USAGE_KEYS, 0), "t_first": None, "t_last": None,
+            "steps": [new_step("preflight")]}
+
+
+def new_step(name: str) -> dict:
+    return {"step": name, "usage": dict.fromkeys(USAGE_KEYS, 0),
+            "t_first": None, "t_last": None}
+
+
+def boundary(obj: dict) -> str | None:
+    """Pipeline step opened by this event's tool calls (the last one wins
+    when a message issues several), or None."""
+    found = None
+    for block in ((obj.get("message") or {}).get("content") or []):
+        if not isinstance(block, dict) or block.get("type") != "tool_use":
+            continue
+        inp = block.get("input") or {}
+        if block.get("name") == "Bash":
+            command = str(inp.get("command", ""))
+            if PREFLIGHT_INVOCATION.search(command):
+                found = "preflight"
+            elif RECORD_INVOCATION.search(command) and not RECORD_MARKER.search(command):
+                found = "record"
+            else:
+                found = next((n for n, rx in STEP_SCRIPTS if rx.search(command)), found)
+        elif block.get("name") in ("Agent", "Task"):
+            agent = str(inp.get("subagent_type", "")).rpartition(":")[2]
+            if str(inp.get("prompt", "")).startswith("scatter"):
+                found = "scatter"
+            elif agent in STEP_AGENTS:
+                found = STEP_AGENTS[agent]
+    return found
+
+
+def add_event(target: dict, ts: str | None, u: dict) -> None:
+    if ts:
+        target["t_first"] = target["t_first"] or ts
+        target["t_last"] = ts
+    for k in USAGE_KEYS:
+        v = u.get(k)
+        if isinstance(v, int):
+            target["usage"][k] += v
+
+
+def fold(window: dict, obj: dict, step: str | None) -> None:
+    """Add one transcript event's timestamp and usage to the running window
+    and to the step it belongs to (opening `step` first, if given)."""
+    if step and step != window["steps"][-1]["step"]:
+        window["steps"].append(new_step(step))
+    ts = obj.get("timestamp")
+    ts = ts if isinstance(ts, str) and parse_ts(ts) else None
+    u = (obj.get("message") or {}).get("usage") or obj.get("usage") or {}
+    add_event(window, ts, u)
+    add_event(window["steps"][-1], ts, u)
+
+
+def advance(transcript: Path, cursor: dict) -> dict:
+    """Fold the complete lines appended since cursor["offset"]. A partial last
+    line (still being written) is left for the next call."""
+    size = transcript.stat().st_size
+    if size < cursor.get("offset", 0):
+        cursor = {}
+    offset = cursor.get("offset", 0)
+    window = cursor.get("window") or new_window()
+    with open(transcript, "rb") as f:
+        f.seek(offset)
+        data = f.read(size - offset)
+    end = data.rfind(b"\n") + 1
+    for raw in data[:end].splitlines():
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(obj, dict):
+            continue
+        # Window = from the LAST preflight line onward (= this sync run, not
+        # earlier session work); the preflight line itself is included.
+        step = boundary(obj)
+        if step == "preflight":
+            window = new_window()
+        fold(window, obj, step)
+    return {"offset": offset + end, "window": window}
+
+
+def seconds(t_first: str | None, t_last: str | None) -> float | None:
+    a, b = parse_ts(t_first or ""), parse_ts(t_last or "")
+    return (b - a).total_seconds() if a and b else None
+
+
+def tokens(usage: dict) -> dict:
+    return {**usage, "total": sum(usage.values())}
+
+
+def step_rows(window: dict) -> list[dict]:
+    """Per-step totals in first-seen order (a step entered twice, e.g. a
+    writer retry, is summed). Wall = this segment's first event to the next
+    segment's first event."""
+    segments = window["steps"]
+    rows: dict[str, dict] = {}
+    for i, seg in enumerate(segments):
+        nxt = next((s["t_first"] for s in segments[i + 1:] if s["t_first"]), None)
+        wall = seconds(seg["t_first"], nxt or seg["t_last"])
+        row = rows.setdefault(seg["step"], {"step": seg["step"], "wall_s": None,
+                                            "usage": dict.fromkeys(USAGE_KEYS, 0)})
+        if wall is not None:
+            row["wall_s"] = (row["wall_s"] or 0) + wall
+        for k in USAGE_KEYS:
+            row["usage"][k] += seg["usage"][k]
+    return [{"step": r["step"], "wall_s": r["wall_s"], "tokens": tokens(r["usage"])}
+            for r in rows.values()]
+
+
+def format_table(rows: list[dict]) -> str:
+    lines = [f"  {'step':<15} {'wall':>6} {'tokens':>11} {'out':>9} {'cache':>11}"]
+    for r in rows:
+        t = r["tokens"]
+        wall = f"{r['wall_s']:.0f}s" if r["wall_s"] is not None else "n/a"
+        cache = t["cache_creation_input_tokens"] + t["cache_read_input_tokens"]
+        lines.append(f"  {r['step']:<15} {wall:>6} {t['total']:>11,} "
+                     f"{t['output_tokens']:>9,} {cache:>11,}")
+    return "\n".join(lines)
+
+
+def write_cost(path: Path, report: dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        pass
+
+
+def append_history(sync_dir: Path, report: dict) -> None:
+    from run_stats import take  # only on the final stamp, not every Bash call
+
+    entry = {
+        "finished_at": report["finished_at"], "started_at": report["started_at"],
+        "commit": None, "wall_s": report["wall_s"], "tokens": report["tokens"],
+        "steps": {r["step"]: {"wall_s": r["wall_s"], "tokens": r["tokens"]["total"]}
+                  for r in report["steps"]},
+        "files_scanned": None,
+    }
+    try:
+        state = json.loads((sync_dir.parent / ".map-sync-state").read_text(encoding="utf-8"))
+        entry["commit"] = state.get("last_synced_commit")
+    except (OSError, json.JSONDecodeError, AttributeError):
+        pass
+    try:
+        skeleton = json.loads((sync_dir / "skeleton.json").read_text(encoding="utf-8"))
+        entry["files_scanned"] = skeleton["stats"]["files_scanned"]
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+    entry.update(take(sync_dir))
+    try:
+        with open(sync_dir / HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError:
+        pass
+
+
+def cursor_path(hook: dict) -> Path | None:
+    claude_dir = Path(hook.get("cwd") or os.getcwd()) / ".claude"
+    return claude_dir / ".sync" / CURSOR_FILE if claude_dir.is_dir() else None
+
+
+def load_cursors(path: Path | None) -> dict:
+    if path is None:
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CURSOR_VERSION:
+        return {}
+    cursors = data.get("transcripts")
+    return cursors if isinstance(cursors, dict) else {}
+
+
+def save_cursors(path: Path | None, cursors: dict) -> None:
+    if path is None:
+        return
+    keep = sorted(cursors.items(), key=lambda kv: kv[1].get("seen", 0))[-MAX_CURSORS:]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": CURSOR_VERSION, "transcripts": dict(keep)},
+                                  indent=1) + "\n", encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass  # cursor is an optimisation; the report must still go out
+
+
 def main() -> int:
     try:
         hook = json.load(sys.stdin)
@@ -57,64 +302,47 @@ def main() -> int:
     if hook.get("tool_name") != "Bash":
         return 0
     command = (hook.get("tool_input") or {}).get("command", "")
-    if not RECORD_INVOCATION.search(command):
-        return 0
+    is_record = bool(RECORD_INVOCATION.search(command))
+    if not is_record and not PREFLIGHT_INVOCATION.search(command):
+        return 0  # unrelated Bash call: no transcript I/O at all
 
     transcript = hook.get("transcript_path", "")
     if not transcript or not Path(transcript).is_file():
         return 0
 
-    # Single pass: remember where the LAST preflight Bash call sits, then sum
-    # usage from that line onward (= this sync run, not earlier session work).
-    events: list[dict] = []
-    start_idx = 0
-    with open(transcript, encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            events.append(obj)
-            msg = obj.get("message") or {}
-            for block in (msg.get("content") or []):
-                if not isinstance(block, dict) or block.get("type") != "tool_use":
-                    continue
-                if block.get("name") == "Bash" and PREFLIGHT_INVOCATION.search(
-                        str((block.get("input") or {}).get("command", ""))):
-                    start_idx = len(events) - 1
-
-    window = events[start_idx:]
-    if not window:
+    # Preflight and progress-marker calls only advance the cursor, so the
+    # final stamp folds just the tail appended since the last marker.
+    store = cursor_path(hook)
+    cursors = load_cursors(store)
+    cursor = advance(Path(transcript), cursors.get(transcript) or {})
+    cursor["seen"] = time.time()
+    cursors[transcript] = cursor
+    save_cursors(store, cursors)
+    if not is_record or RECORD_MARKER.search(command):
         return 0
 
-    usage = {"input_tokens": 0, "output_tokens": 0,
-             "cache_creation_input_tokens": 0, "cache_read_input_tokens": 0}
-    t_first = t_last = None
-    for obj in window:
-        ts = parse_ts(obj.get("timestamp", ""))
-        if ts:
-            t_first = t_first or ts
-            t_last = ts
-        u = (obj.get("message") or {}).get("usage") or obj.get("usage") or {}
-        for k in usage:
-            v = u.get(k)
-            if isinstance(v, int):
-                usage[k] += v
-
-    wall = f"{(t_last - t_first).total_seconds():.0f}s" if t_first and t_last else "n/a"
+    window = cursor["window"]
+    usage = window["usage"]
+    wall_s = seconds(window["t_first"], window["t_last"])
+    wall = f"{wall_s:.0f}s" if wall_s is not None else "n/a"
     total = sum(usage.values())
     out = usage["output_tokens"]
     cache = usage["cache_creation_input_tokens"] + usage["cache_read_input_tokens"]
+    rows = step_rows(window)
+    report = {"transcript": transcript, "started_at": window["t_first"],
+              "finished_at": window["t_last"], "wall_s": wall_s,
+              "tokens": tokens(usage), "steps": rows}
+    if store is not None:
+        write_cost(store.with_name(COST_FILE), report)
+        append_history(store.parent, report)
     print(json.dumps({"hookSpecificOutput": {
         "hookEventName": "PostToolUse",
         "additionalContext":
             f"map-sync usage for this run (exact tokens, main-transcript scope): "
             f"wall {wall} | tokens {total:,} total (out {out:,}, cache {cache:,}). "
             f"Render this verbatim as a final 'Usage' block at the end of the "
-            f"Sync complete report (see the map-sync command's Final Report)."}}))
+            f"Sync complete report (see the map-sync command's Final Report), "
+            f"followed by this per-step table verbatim:\n{format_table(rows)}"}}))
     return 0
 
 
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+sync_daemon.py — opt-in warm daemon for map-sync's deterministic scripts.
+
+Every cold run of scan / skeleton / changed_dirs / bundle pays Python
+startup, imports, git enumeration and a full re-extraction of every file.
+The daemon keeps one project's inputs hot in memory and serves those four
+scripts over a Unix socket (daemon_client.py; the scripts use it
+transparently when it is running, and run cold otherwise):
+
+    file index     git ls-files result; re-enumerated only when
+                   `git rev-parse HEAD` + `git status --porcelain -uall`
+                   changes (files added, deleted, renamed, committed)
+    file extracts  per-file skeleton extraction (symbols, imports, docs),
+                   reused while the file's mtime and size are unchanged; the
+                   import graph is re-resolved from them per request
+    dir extracts   scatter extracts (resume fingerprints, --plan sizes,
+                   skeleton --scatter), reused while the dir's entries'
+                   names, mtimes and sizes are unchanged
+    scan rows      scan.md scatter rows, reused while scan.md is unchanged
+
+Requests are served one at a time, in the client's cwd, through the same
+code paths as the cold scripts (sync_pipeline.Pipeline), so output is
+identical. Any daemon-side error makes the client fall back to cold mode.
+The daemon exits after IDLE_SECONDS without a request.
+
+Socket: .claude/.sync/daemon.sock (a /tmp path when that is too long for
+AF_UNIX); log: .claude/.sync/daemon.log.
+
+Usage:
+    python3 sync_daemon.py [project_root] start    spawn in the background
+    python3 sync_daemon.py [project_root] serve    run in the foreground
+    python3 sync_daemon.py [project_root] stop | status
+"""
+from __future__ import annotations
+
+import contextlib
+import copy
+import hashlib
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import changed_dirs
+import skeleton as skeleton_mod
+from daemon_client import REPLY_TIMEOUT, VALUE_FLAGS, project_root, request, socket_path
+from sync_pipeline import Pipeline, run_stage
+
+IDLE_SECONDS = 4 * 3600
+START_WAIT = 10.0
+SERVED = ("scan", "skeleton", "changed-dirs", "bundle")
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class WarmPipeline(Pipeline):
+    """A Pipeline whose inputs survive across requests, each revalidated
+    before reuse (see the module docstring for the rules)."""
+
+    def __init__(self, root: Path):
+        super().__init__(root)
+        self._git_sig: str | None = None
+        self._scan_key: tuple[int, int] | None = None
+        self._file_cache: dict[str, tuple[tuple[int, int], dict | None]] = {}
+        self._dir_cache: dict[str, tuple[tuple, str]] = {}
+        self.hits = self.misses = 0
+
+    def refresh(self) -> None:
+        """Called before each request: drop whatever git or scan.md says moved."""
+        self.timings = {}
+        self._skeleton = None
+        self._skeleton_text = None
+        sig = self._git_signature()
+        if sig is None or sig != self._git_sig:
+            self._files = None
+        self._git_sig = sig
+        key = _stat_key(self.claude_dir / "scan.md")
+        if key != self._scan_key:
+            self._scan_loaded = False
+        self._scan_key = key
+
+    def _git_signature(self) -> str | None:
+        try:
+            head = changed_dirs._git(self.root, "rev-parse", "--verify", "HEAD")
+            status = changed_dirs._git(self.root, "status", "--porcelain", "-uall")
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        if status.returncode != 0:
+            return None  # not a git repo: os.walk fallback, re-enumerate every time
+        return hashlib.sha256((head.stdout + status.stdout).encode("utf-8")).hexdigest()
+
+    def file_info(self, root: Path, rel: str) -> dict | None:
+        key = _stat_key(root / rel)
+        cached = self._file_cache.get(rel)
+        if key is not None and cached is not None and cached[0] == key:
+            self.hits += 1
+        else:
+            self.misses += 1
+            cached = (key, skeleton_mod.extract_path(root, rel))
+            self._file_cache[rel] = cached
+        return copy.deepcopy(cached[1])
+
+    def extract(self, root: Path, rel_dir: str) -> str:
+        key = rel_dir.rstrip("/")
+        d = root / key
+        try:
+            sig = tuple(sorted((e.name, e.stat().st_mtime_ns, e.stat().st_size)
+                               for e in os.scandir(d)))
+        except OSError:
+            sig = ()
+        cached = self._dir_cache.get(key)
+        if cached is None or cached[0] != sig:
+            cached = (sig, skeleton_mod.scatter_extract(root, key))
+            self._dir_cache[key] = cached
+        return cached[1]
+
+
+# ─── request handling ────────────────────────────────────────────────
+
+def stage_flags(args: list[str]) -> list[str]:
+    """args minus the positional project root (same rule as daemon_client)."""
+    out, skip, root_seen = [], False, False
+    for a in args:
+        if skip:
+            out.append(a)
+            skip = False
+        elif a in VALUE_FLAGS:
+            out.append(a)
+            skip = True
+        elif a.startswith("--") or root_seen:
+            out.append(a)
+        else:
+            root_seen = True
+    return out
+
+
+def serve_stage(warm: WarmPipeline, stage: str, flags: list[str]) -> int:
+    if stage == "scan":
+        from scan import main as scan_main  # on sys.path via skeleton.py
+        return scan_main(["scan.py", str(warm.root)])
+    if stage == "skeleton" and "--scatter" in flags:
+        i = flags.index("--scatter")
+        if i + 1 >= len(flags):
+            print("ERROR: --scatter requires a directory argument", file=sys.stderr)
+            return 1
+        print(warm.extract(warm.root, flags[i + 1]))
+        return 0
+    return run_stage(warm, stage, flags)
+
+
+def handle(warm: WarmPipeline, req: dict) -> dict:
+    stage, args, cwd = req.get("stage"), req.get("argv"), req.get("cwd")
+    if stage not in SERVED or not isinstance(args, list) or not isinstance(cwd, str):
+        return {"fallback": True, "error": "malformed request"}
+    prev = os.getcwd()
+    try:
+        os.chdir(cwd)
+        root = project_root(["", *args])
+        if root != warm.root:
+            return {"fallback": True, "error": f"daemon serves {warm.root}, not {root}"}
+        warm.refresh()
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            rc = serve_stage(warm, stage, stage_flags(args))
+        return {"rc": rc, "stdout": out.getvalue(), "stderr": err.getvalue()}
+    except Exception:  # never answer with a half-run stage: the client re-runs cold
+        return {"fallback": True, "error": traceback.format_exc()}
+    finally:
+        os.chdir(prev)
+
+
+def serve(root: Path) -> int:
+    path = socket_path(root)
+    if path.exists():
+        if request(path, {"stage": "ping"}, timeout=2) is not None:
+            print(f"sync_daemon: already serving {root}", file=sys.stderr)
+            return 1
+        path.unlink()  # stale socket from a daemon that died
+    path.parent.mkdir(parents=True, exist_ok=True)
+    warm = WarmPipeline(root)
+    started = time.time()
+    served = 0
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as srv:
+        srv.bind(str(path))
+        os.chmod(path, 0o600)
+        srv.listen(16)
+        srv.settimeout(IDLE_SECONDS)
+        print(f"sync_daemon: serving {root} on {path}", file=sys.stderr, flush=True)
+        try:
+            while True:
+                try:
+                    conn, _ = srv.accept()
+                except socket.timeout:
+                    print("sync_daemon: idle timeout, exiting", file=sys.stderr)
+                    break
+                with conn:
+                    conn.settimeout(REPLY_TIMEOUT)
+                    chunks = []
+                    while chunk := conn.recv(65536):
+                        chunks.append(chunk)
+                    try:
+                        req = json.loads(b"".join(chunks).decode("utf-8"))
+                    except ValueError:
+                        req = {}
+                    stage = req.get("stage") if isinstance(req, dict) else None
+                    if stage == "ping":
+                        reply = {"root": str(root), "pid": os.getpid(), "served": served,
+                                 "uptime_s": round(time.time() - started),
+                                 "file_cache": len(warm._file_cache),
+                                 "hits": warm.hits, "misses": warm.misses}
+                    elif stage == "shutdown":
+                        conn.sendall(json.dumps({"rc": 0}).encode("utf-8"))
+                        break
+                    else:
+                        t0 = time.perf_counter()
+                        reply = handle(warm, req if isinstance(req, dict) else {})
+                        served += 1
+                        print(f"sync_daemon: {stage} -> "
+                              f"{'fallback' if reply.get('fallback') else reply['rc']} "
+                              f"({time.perf_counter() - t0:.2f}s)", file=sys.stderr, flush=True)
+                    try:
+                        conn.sendall(json.dumps(reply).encode("utf-8"))
+                    except OSError:
+                        pass
+        finally:
+            with contextlib.suppress(OSError):
+                path.unlink()
+    return 0
+
+
+def start(root: Path) -> int:
+    path = socket_path(root)
+    if path.exists() and request(path, {"stage": "ping"}, timeout=2) is not None:
+        print(f"sync_daemon: already serving {root}")
+        return 0
+    if not (root / ".claude").is_dir():
+        print(f"ERROR: {root / '.claude'}/ does not exist. "
+              f"Run /hukuhaka-project-mapper:map-init first.", file=sys.stderr)
+        return 1
+    log = root / ".claude" / ".sync" / "daemon.log"
+    log.parent.mkdir(parents=True, exist_ok=True)
+    with open(log, "a", encoding="utf-8") as f:
+        subprocess.Popen([sys.executable, str(Path(__file__).resolve()), str(root), "serve"],
+                         stdin=subprocess.DEVNULL, stdout=f, stderr=f,
+                         start_new_session=True)
+    deadline = time.time() + START_WAIT
+    while time.time() < deadline:
+        if path.exists() and request(path, {"stage": "ping"}, timeout=2) is not None:
+            print(f"sync_daemon: started for {root} ({path})")
+            return 0
+        time.sleep(0.05)
+    print(f"ERROR: daemon did not come up; see {log}", file=sys.stderr)
+    return 1
+
+
+def main(argv: list[str]) -> int:
+    args = argv[1:]
+    cmd = args.pop() if args and args[-1] in ("start", "serve", "stop", "status") else None
+    if cmd is None or len(args) > 1:
+        print("Usage: sync_daemon.py [project_root] start|serve|stop|status", file=sys.stderr)
+        return 1
+    root = Path(args[0] if args else os.getcwd()).resolve()
+    if cmd == "start":
+        return start(root)
+    if cmd == "serve":
+        return serve(root)
+    path = socket_path(root)
+    reply = request(path, {"stage": "ping" if cmd == "status" else "shutdown"}, timeout=5) \
+        if path.exists() else None
+    if reply is None:
+        print(f"sync_daemon: not running for {root}")
+        return 0 if cmd == "stop" else 1
+    print(json.dumps(reply) if cmd == "status" else f"sync_daemon: stopped ({root})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+sync_history.py — report map-sync cost history: rolling medians, trends,
+regressions.
+
+Reads .claude/.sync/history.jsonl (one line per completed map-sync run,
+appended by the sync-cost hook — see sync_cost.py) for each project root
+given and prints, per repo:
+
+    medians   the latest run and the median of the last --window runs, next
+              to the median of the window before it (trend, % change)
+    by mode   median tokens / wall of incremental vs full runs — whether
+              incremental sync is paying off
+    regress.  runs whose tokens or wall exceed the median of the --window
+              runs before them by more than --threshold percent
+
+--json prints the same figures as one JSON object per repo instead.
+
+Usage:
+    python3 sync_history.py [project_root ...] [--window N] [--threshold PCT] [--json]
+    (default root: cwd, window 5, threshold 50)
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from statistics import median
+
+HISTORY = Path(".claude") / ".sync" / "history.jsonl"
+DEFAULT_WINDOW = 5
+DEFAULT_THRESHOLD = 50
+MIN_BASELINE = 3  # runs needed before a run can be called a regression
+
+# (label, path into a history entry). Missing values are skipped, so runs
+# recorded before a metric existed do not skew its median.
+METRICS = [
+    ("wall_s", ("wall_s",)),
+    ("tokens", ("tokens", "total")),
+    ("tokens.out", ("tokens", "output_tokens")),
+    ("tokens.cache_read", ("tokens", "cache_read_input_tokens")),
+    ("tokens.cache_write", ("tokens", "cache_creation_input_tokens")),
+    ("files_scanned", ("files_scanned",)),
+    ("scatter_targets", ("scatter_targets",)),
+    ("bundle_bytes", ("bundle_bytes",)),
+    ("desc_cache_hits", ("desc_cache_hits",)),
+    ("desc_cache_misses", ("desc_cache_misses",)),
+]
+REGRESSION_METRICS = ("wall_s", "tokens")
+
+
+def load_history(root: Path) -> list[dict]:
+    runs: list[dict] = []
+    try:
+        lines = (root / HISTORY).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return runs
+    for line in lines:
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(obj, dict):
+            runs.append(obj)
+    return runs
+
+
+def value(run: dict, path: tuple[str, ...]) -> float | None:
+    v: object = run
+    for key in path:
+        if not isinstance(v, dict):
+            return None
+        v = v.get(key)
+    return v if isinstance(v, (int, float)) and not isinstance(v, bool) else None
+
+
+def med(runs: list[dict], path: tuple[str, ...]) -> float | None:
+    vals = [v for v in (value(r, path) for r in runs) if v is not None]
+    return median(vals) if vals else None
+
+
+def pct(new: float | None, old: float | None) -> float | None:
+    if new is None or old is None or old == 0:
+        return None
+    return (new - old) / old * 100
+
+
+def analyze(runs: list[dict], window: int, threshold: float) -> dict:
+    recent, before = runs[-window:], runs[-2 * window:-window]
+    medians = []
+    for label, path in METRICS:
+        cur, prev = med(recent, path), med(before, path)
+        medians.append({"metric": label, "last": value(runs[-1], path) if runs else None,
+                        "median": cur, "prev_median": prev, "change_pct": pct(cur, prev)})
+
+    by_mode = {}
+    for mode in ("incremental", "full"):
+        subset = [r for r in runs if r.get("mode") == mode]
+        by_mode[mode] = {"runs": len(subset), "tokens": med(subset, ("tokens", "total")),
+                         "wall_s": med(subset, ("wall_s",))}
+    saving = pct(by_mode["incremental"]["tokens"], by_mode["full"]["tokens"])
+
+    regressions = []
+    paths = dict(METRICS)
+    for i, run in enumerate(runs):
+        base = runs[max(0, i - window):i]
+        if len(base) < MIN_BASELINE:
+            continue
+        for label in REGRESSION_METRICS:
+            v, m = value(run, paths[label]), med(base, paths[label])
+            change = pct(v, m)
+            if change is not None and change > threshold:
+                regressions.append({"run": i + 1, "finished_at": run.get("finished_at"),
+                                    "commit": run.get("commit"), "mode": run.get("mode"),
+                                    "metric": label, "value": v, "baseline": m,
+                                    "change_pct": change})
+    return {"runs": len(runs), "window": window, "threshold_pct": threshold,
+            "medians": medians, "by_mode": by_mode,
+            "incremental_vs_full_pct": saving, "regressions": regressions}
+
+
+# ─── text output ─────────────────────────────────────────────────────
+
+def fmt(v: float | None) -> str:
+    if v is None:
+        return "-"
+    return f"{v:,.0f}" if abs(v) >= 10 or v == int(v) else f"{v:.1f}"
+
+
+def fmt_pct(v: float | None) -> str:
+    return "-" if v is None else f"{v:+.0f}%"
+
+
+def render(root: Path, report: dict) -> str:
+    w = report["window"]
+    lines = [f"map-sync history: {root} — {report['runs']} run(s)"]
+    lines.append(f"  {'metric':<19} {'last':>12} {'median(' + str(w) + ')':>12} "
+                 f"{'prev median':>12} {'trend':>7}")
+    for m in report["medians"]:
+        if m["last"] is None and m["median"] is None:
+            continue
+        lines.append(f"  {m['metric']:<19} {fmt(m['last']):>12} {fmt(m['median']):>12} "
+                     f"{fmt(m['prev_median']):>12} {fmt_pct(m['change_pct']):>7}")
+
+    inc, full = report["by_mode"]["incremental"], report["by_mode"]["full"]
+    lines.append(f"  by mode: incremental {fmt(inc['tokens'])} tokens / {fmt(inc['wall_s'])}s "
+                 f"median ({inc['runs']} run(s)), full {fmt(full['tokens'])} tokens / "
+                 f"{fmt(full['wall_s'])}s ({full['runs']} run(s))")
+    saving = report["incremental_vs_full_pct"]
+    if saving is not None:
+        lines.append(f"  incremental vs full: {fmt_pct(saving)} tokens")
+
+    regs = report["regressions"]
+    lines.append(f"  regressions (> +{report['threshold_pct']:g}% over the median of the "
+                 f"previous {w} run(s)): {len(regs) or 'none'}")
+    for r in regs:
+        commit = (r["commit"] or "")[:12] or "n/a"
+        lines.append(f"    run {r['run']} ({r['finished_at'] or 'n/a'}, {commit}, "
+                     f"{r['mode'] or '?'}): {r['metric']} {fmt(r['value'])} vs "
+                     f"{fmt(r['baseline'])} ({fmt_pct(r['change_pct'])})")
+    return "\n".join(lines)
+
+
+def parse_flag(argv: list[str], flag: str, default: float) -> float | None:
+    if flag not in argv:
+        return default
+    i = argv.index(flag)
+    try:
+        v = float(argv[i + 1])
+    except (IndexError, ValueError):
+        return None
+    return v if v > 0 else None
+
+
+def main(argv: list[str]) -> int:
+    window = parse_flag(argv, "--window", DEFAULT_WINDOW)
+    threshold = parse_flag(argv, "--threshold", DEFAULT_THRESHOLD)
+    if window is None or window != int(window):
+        print("ERROR: --window requires a positive integer (runs)", file=sys.stderr)
+        return 1
+    if threshold is None:
+        print("ERROR: --threshold requires a positive number (percent)", file=sys.stderr)
+        return 1
+    values = {argv[argv.index(f) + 1] for f in ("--window", "--threshold") if f in argv}
+    roots = [a for a in argv[1:] if not a.startswith("--") and a not in values]
+    as_json = "--json" in argv[1:]
+
+    out = []
+    for root in [Path(r).resolve() for r in roots or [os.getcwd()]]:
+        runs = load_history(root)
+        if not runs:
+            print(f"# sync_history: no {HISTORY} under {root} (no recorded map-sync runs)",
+                  file=sys.stderr)
+            continue
+        report = analyze(runs, int(window), threshold)
+        out.append(json.dumps({"root": str(root), **report}) if as_json
+                   else render(root, report))
+    if out:
+        print("\n".join(out) if as_json else "\n\n".join(out))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
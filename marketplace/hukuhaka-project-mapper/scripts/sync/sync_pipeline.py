@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+sync_pipeline.py — map-sync's deterministic stages in one process.
+
+The step scripts (changed_dirs.py, skeleton.py, bundle.py, merge.py,
+record_sync.py) each re-parse scan.md, re-run git and re-read skeleton.json
+when run as separate processes. This runner executes one or more stages
+against a single Pipeline object, which loads each input at most once and
+hands it to the next stage:
+
+    scan rows      scan.md scatter rows           changed-dirs, skeleton, bundle
+    file index     git ls-files (skeleton.list_files)   skeleton
+    extracts       memoized scatter extracts      changed-dirs (resume
+                                                  fingerprints + --plan sizes)
+    skeleton       built dict + exact JSON text   bundle, merge
+
+Stages are chained with '+' so consecutive steps share the state, e.g.
+Step 2a+2b: `sync_pipeline.py skeleton + bundle --misses`. Each stage takes
+the same flags as its script and produces the same stdout / files / stderr.
+
+Per-stage wall times go to stderr and into run-stats.json
+("stage_timings"), from where sync_cost.py copies them into history.jsonl.
+
+Library use:
+    p = Pipeline(root)
+    p.changed_dirs(plan=True); p.skeleton(); p.bundle(misses=True)
+    p.timings  ->  {"changed-dirs": 0.41, "skeleton": 1.2, "bundle": 0.03}
+
+Usage:
+    python3 sync_pipeline.py [project_root] STAGE [flags] [+ STAGE [flags] ...]
+      STAGE: changed-dirs [--full] [--plan [--budget N]]
+             skeleton
+             bundle [--budget N | --delta] [--compact] [--misses]
+             merge [--delta]                  (combined agent JSON on stdin)
+             record [--dir D ... | --step NAME | --status]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import bundle as bundle_mod
+import changed_dirs
+import merge as merge_mod
+import record_sync
+import skeleton as skeleton_mod
+from run_stats import note, note_timings
+
+STAGES = ("changed-dirs", "skeleton", "bundle", "merge", "record")
+
+
+class Pipeline:
+    """One project's deterministic map-sync inputs, each loaded at most once."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.claude_dir = root / ".claude"
+        self.timings: dict[str, float] = {}
+        self._scan_rows: list[str] | None = None
+        self._scan_loaded = False
+        self._files: list[str] | None = None
+        self._extracts: dict[str, str] = {}
+        self._skeleton: dict | None = None
+        self._skeleton_text: str | None = None
+
+    # ─── shared inputs ───────────────────────────────────────────────
+
+    def scan_rows(self) -> list[str] | None:
+        """scan.md scatter rows; None without scan.md."""
+        if not self._scan_loaded:
+            scan_md = self.claude_dir / "scan.md"
+            self._scan_rows = (changed_dirs.parse_scatter_rows(scan_md)
+                               if scan_md.is_file() else None)
+            self._scan_loaded = True
+        return self._scan_rows
+
+    def files(self) -> list[str]:
+        if self._files is None:
+            self._files = skeleton_mod.list_files(self.root)
+        return self._files
+
+    def extract(self, root: Path, rel_dir: str) -> str:
+        """Memoized skeleton.scatter_extract (the extract_fn the step
+        modules accept)."""
+        key = rel_dir.rstrip("/")
+        if key not in self._extracts:
+            self._extracts[key] = skeleton_mod.scatter_extract(root, key)
+        return self._extracts[key]
+
+    def file_info(self, root: Path, rel: str) -> dict | None:
+        """Per-file extraction for the skeleton (cold: read + parse)."""
+        return skeleton_mod.extract_path(root, rel)
+
+    def skeleton_text(self) -> str | None:
+        if self._skeleton_text is None:
+            self._skeleton_text = bundle_mod.read_or_none(
+                self.claude_dir / ".sync" / "skeleton.json")
+        return self._skeleton_text
+
+    # ─── stages ──────────────────────────────────────────────────────
+
+    def _timed(self, name: str, fn, *args, **kwargs) -> int:
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - t0
+
+    def changed_dirs(self, full: bool = False, plan: bool = False,
+                     budget: int = changed_dirs.PLAN_BUDGET) -> int:
+        return self._timed("changed-dirs", self._changed_dirs, full, plan, budget)
+
+    def _changed_dirs(self, full: bool, plan: bool, budget: int) -> int:
+        rows = self.scan_rows()
+        if rows is None:
+            print(f"ERROR: {self.claude_dir / 'scan.md'} not found. "
+                  f"Run /hukuhaka-project-mapper:map-scan first.", file=sys.stderr)
+            return 1
+        if not rows:
+            if plan:
+                print(json.dumps(changed_dirs.build_plan(self.root, [], "full", budget), indent=2))
+            return 0
+        mode, targets, skipped = changed_dirs.select_targets(self.root, rows, full, self.extract)
+        note(self.root, mode=mode, scatter_dirs=len(rows), scatter_targets=len(targets),
+             scatter_resumed=len(skipped))
+        if plan:
+            print(json.dumps(changed_dirs.build_plan(self.root, targets, mode, budget,
+                                                     self.extract), indent=2))
+        else:
+            changed_dirs.emit(targets)
+        return 0
+
+    def skeleton(self) -> int:
+        return self._timed("skeleton", self._build_skeleton)
+
+    def _build_skeleton(self) -> int:
+        if not self.claude_dir.is_dir():
+            print(f"ERROR: {self.claude_dir}/ does not exist. "
+                  f"Run /hukuhaka-project-mapper:map-init first.", file=sys.stderr)
+            return 1
+        self._skeleton = skeleton_mod.build_skeleton(self.root, self.files(), self.scan_rows(),
+                                                     self.file_info)
+        self._skeleton_text = skeleton_mod.write_skeleton(self.root, self._skeleton)
+        return 0
+
+    def bundle(self, **flags) -> int:
+        return self._timed("bundle", bundle_mod.run, self.root,
+                           skeleton_text=self.skeleton_text(),
+                           scatter_rows=self.scan_rows(), **flags)
+
+    def merge(self, raw: str, delta: bool = False) -> int:
+        return self._timed("merge", merge_mod.run, self.root, raw, delta, self._skeleton)
+
+    def record(self, flags: list[str]) -> int:
+        return self._timed("record", record_sync.main,
+                           ["record_sync.py", str(self.root), *flags])
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────
+
+def split_stages(args: list[str]) -> list[list[str]]:
+    groups: list[list[str]] = [[]]
+    for a in args:
+        if a == "+":
+            groups.append([])
+        else:
+            groups[-1].append(a)
+    return groups
+
+
+def run_stage(p: Pipeline, stage: str, flags: list[str]) -> int:
+    argv = [stage, *flags]
+    if stage == "changed-dirs":
+        budget = changed_dirs.parse_budget(argv)
+        if budget is None:
+            print("ERROR: --budget requires a positive integer (tokens)", file=sys.stderr)
+            return 1
+        return p.changed_dirs(full="--full" in flags, plan="--plan" in flags, budget=budget)
+    if stage == "skeleton":
+        return p.skeleton()
+    if stage == "bundle":
+        budget, ok = bundle_mod.parse_budget(argv)
+        if not ok:
+            print("ERROR: --budget requires a positive integer (tokens)", file=sys.stderr)
+            return 1
+        delta, compact = "--delta" in flags, "--compact" in flags
+        if delta and (budget is not None or compact):
+            print("ERROR: --delta excludes --budget and --compact", file=sys.stderr)
+            return 1
+        return p.bundle(budget=budget, delta=delta, compact=compact, misses="--misses" in flags)
+    if stage == "merge":
+        return p.merge(sys.stdin.read(), delta="--delta" in flags)
+    return p.record(flags)
+
+
+def main(argv: list[str]) -> int:
+    args = argv[1:]
+    root = os.getcwd()
+    if args and args[0] not in STAGES and not args[0].startswith("--") and args[0] != "+":
+        if not Path(args[0]).is_dir():
+            # neither a stage nor a project root: most likely a mistyped stage
+            print(f"ERROR: unknown stage '{args[0]}' (expected one of: {', '.join(STAGES)})",
+                  file=sys.stderr)
+            return 1
+        root = args.pop(0)
+    groups = split_stages(args)
+    for g in groups:
+        if not g or g[0] not in STAGES:
+            got = f"'{g[0]}'" if g else "nothing"
+            print(f"ERROR: expected a stage ({', '.join(STAGES)}), got {got}", file=sys.stderr)
+            return 1
+
+    p = Pipeline(Path(root).resolve())
+    rc = 0
+    for stage, *flags in groups:
+        rc = run_stage(p, stage, flags)
+        if rc != 0:
+            break
+    if p.timings:
+        print("# sync_pipeline: " + " | ".join(f"{k} {v:.2f}s" for k, v in p.timings.items())
+              + f" (total {sum(p.timings.values()):.2f}s)", file=sys.stderr)
+        if p.claude_dir.is_dir():
+            note_timings(p.root, p.timings)
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
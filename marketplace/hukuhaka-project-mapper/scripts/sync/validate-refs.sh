@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+# validate-refs.sh — thin wrapper around validate_refs.py for map-sync Step 4.
+# Checks every [name](path[:symbol]) reference in .claude/*.md and scattered
+# CLAUDE.md against the file tree and symbol index; prints the validate report.
+# Usage: bash validate-refs.sh [project_root] [--json]   (default root: cwd)
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+if ! command -v python3 >/dev/null 2>&1; then
+    echo "ERROR: python3 not found. map-sync requires python3." >&2
+    exit 1
+fi
+
+python3 "$SCRIPT_DIR/validate_refs.py" "$@"
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+validate_refs.py — deterministic reference check for map-sync Step 4.
+
+Parses every `[name](path)` / `[name](path:symbol)` reference (format-rules.md
+"Reference Style") in .claude/*.md and in the scattered CLAUDE.md of each
+scan.md scatter row, and checks it in one pass against the file tree and a
+symbol index built with skeleton.py's extractors. No LLM, no agents.
+
+Resolution:
+    .claude/*.md       target relative to the project root, else to .claude/
+                       (links between the docs themselves)
+    <dir>/CLAUDE.md    target relative to <dir> (writer scatter mode links bare
+                       file names), else to the project root
+    skipped            http(s)/mailto URLs, pure #anchors, {{...}} placeholders,
+                       anything inside ``` fences
+
+Verdicts:
+    valid       path exists; symbol (if any) is a definition in the file's
+                extracted symbols, or a line number (`path:12`) or line range
+                (`path:12-20`) within the file
+    broken      path missing (with a same-name hint from the file index), or
+                symbol absent from both the symbol index and the file text
+    ambiguous   symbol not extracted as a definition but the file mentions it
+                as a word (re-export, dynamic def, unsupported language) — the
+                only refs left for the validator agent to judge
+
+Output: the validator agent's report on stdout (or the findings JSON with
+--json), findings saved to .claude/.sync/validate.json.
+
+Usage:
+    python3 validate_refs.py [project_root] [--json]   (default root: cwd)
+"""
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from changed_dirs import parse_scatter_rows
+from run_stats import note
+from skeleton import GENERIC_DEF_RE, extract_path, list_files, read_text
+
+FINDINGS_FILE = "validate.json"
+SKIP_PREFIXES = ("http://", "https://", "mailto:", "#")
+# skeleton.MD_LINK_RE stops at the first ')', which cuts `path:fn()` refs
+LINK_RE = re.compile(r"\[[^\]]*\]\(((?:[^()\s]|\([^()]*\))+)\)")
+WORD_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# skeleton symbol strings: "def f(...)", "class C  # doc", "fn f", "key k",
+# "name n", "h2 Heading", "  C.m(...)", "X = Call(...)"
+PREFIXED_RE = re.compile(r"^(?:def|class|fn|key|name|h2) (.+?)(?:\(|  # |$)")
+METHOD_RE = re.compile(r"^\s+([A-Za-z_]\w*)\.([A-Za-z_]\w*)\(")
+ASSIGN_RE = re.compile(r"^([A-Za-z_]\w*) = ")
+LINES_RE = re.compile(r"(\d+)(?:-(\d+))?")  # `path:12` / `path:12-20`
+
+
+# ─── reference parsing ───────────────────────────────────────────────
+
+def doc_files(root: Path) -> list[Path]:
+    """.claude/*.md plus each scatter row's CLAUDE.md that exists."""
+    claude_dir = root / ".claude"
+    docs = sorted(claude_dir.glob("*.md"))
+    scan_md = claude_dir / "scan.md"
+    if scan_md.is_file():
+        for d in parse_scatter_rows(scan_md):
+            md = root / d / "CLAUDE.md"
+            if md.is_file():
+                docs.append(md)
+    return docs
+
+
+def parse_refs(text: str) -> list[tuple[int, str]]:
+    """(line number, raw link target) for every checkable link."""
+    refs: list[tuple[int, str]] = []
+    fenced = False
+    for n, line in enumerate(text.splitlines(), 1):
+        if line.lstrip().startswith("```"):
+            fenced = not fenced
+            continue
+        if fenced:
+            continue
+        for m in LINK_RE.finditer(line):
+            target = m.group(1).strip()
+            if target.startswith(SKIP_PREFIXES) or "{{" in target:
+                continue
+            refs.append((n, target))
+    return refs
+
+
+def split_target(target: str) -> tuple[str, str]:
+    """'src/a.py:Cls.run' -> ('src/a.py', 'Cls.run'); drops #anchors and a
+    trailing '()' on the symbol."""
+    target = target.split("#", 1)[0].split(" ", 1)[0]
+    path, _, symbol = target.partition(":")
+    symbol = symbol.strip()
+    if symbol.endswith("()"):
+        symbol = symbol[:-2]
+    return path, symbol
+
+
+# ─── symbol index ────────────────────────────────────────────────────
+
+def symbol_names(symbol: str) -> set[str]:
+    """Names a reference may use for one extracted symbol string."""
+    m = METHOD_RE.match(symbol)
+    if m:
+        return {f"{m.group(1)}.{m.group(2)}", m.group(2)}
+    m = PREFIXED_RE.match(symbol)
+    if m:
+        return {m.group(1).strip()}
+    m = ASSIGN_RE.match(symbol)
+    if m:
+        return {m.group(1)}
+    if WORD_RE.fullmatch(symbol):
+        return {symbol}
+    # tree-sitter definition line (first source line of the definition)
+    m = GENERIC_DEF_RE.match(symbol)
+    return {m.group(1)} if m else set(WORD_RE.findall(symbol))
+
+
+def python_names(text: str) -> set[str]:
+    """Every module-level and class-level binding of a Python file. The
+    skeleton extractor keeps only the first 10 members of a class and only
+    call-valued assignments — enough to describe a file, too few to check
+    references against."""
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        return set()
+    names: set[str] = set()
+
+    def bind(body, prefix: str) -> None:
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.add(prefix + node.name)
+                if prefix:
+                    names.add(node.name)
+                if isinstance(node, ast.ClassDef) and not prefix:
+                    bind(node.body, node.name + ".")
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for t in targets:
+                    if isinstance(t, ast.Name):
+                        names.add(prefix + t.id)
+
+    bind(tree.body, "")
+    return names
+
+
+class Index:
+    """Lazy file index (basenames, for hints) and per-file symbol index."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._symbols: dict[str, set[str] | None] = {}
+        self._by_name: dict[str, list[str]] | None = None
+
+    def symbols(self, rel: str) -> set[str] | None:
+        """Definition names in `rel`; None when no extractor covers it."""
+        if rel not in self._symbols:
+            info = extract_path(self.root, rel)
+            if info is None:
+                self._symbols[rel] = None
+            else:
+                names: set[str] = set()
+                for s in info.get("symbols", []):
+                    names |= symbol_names(s)
+                if rel.endswith(".py"):
+                    names |= python_names(read_text(self.root / rel) or "")
+                self._symbols[rel] = names
+        return self._symbols[rel]
+
+    def same_name(self, rel: str) -> list[str]:
+        if self._by_name is None:
+            self._by_name = {}
+            for f in list_files(self.root):
+                self._by_name.setdefault(Path(f).name, []).append(f)
+        return self._by_name.get(Path(rel).name, [])
+
+
+# ─── checking ────────────────────────────────────────────────────────
+
+def resolve(root: Path, doc: Path, path: str) -> str | None:
+    """Project-relative posix path the reference points at, or None."""
+    if doc.parent == root / ".claude":
+        bases = (root, doc.parent)
+    else:
+        bases = (doc.parent, root)
+    for base in bases:
+        cand = Path(os.path.normpath(base / path))
+        if cand.exists() and (cand == root or root in cand.parents):
+            return cand.relative_to(root).as_posix() if cand != root else "."
+    return None
+
+
+def check_symbol(root: Path, index: Index, rel: str, symbol: str) -> tuple[str, str]:
+    """(verdict, reason) for a symbol inside an existing file."""
+    if (root / rel).is_dir():
+        return "broken", "symbol on a directory"
+    text = read_text(root / rel) or ""
+    lines = LINES_RE.fullmatch(symbol)
+    if lines:
+        first, last = int(lines[1]), int(lines[2] or lines[1])
+        if not 0 < first <= last:
+            return "broken", f"bad line reference {symbol}"
+        if last <= len(text.splitlines()):
+            return "valid", ""
+        return "broken", f"line {last} past end of file"
+    names = index.symbols(rel)
+    if names is not None and symbol in names:
+        return "valid", ""
+    last = symbol.rpartition(".")[2]
+    if re.search(rf"(?<![\w]){re.escape(last)}(?![\w])", text):
+        why = "no extractor for this file type" if names is None else "not an extracted definition"
+        return "ambiguous", f"'{symbol}' mentioned in file but {why}"
+    return "broken", f"symbol '{symbol}' not found"
+
+
+def validate(root: Path) -> dict:
+    index = Index(root)
+    checked = 0
+    broken: list[dict] = []
+    ambiguous: list[dict] = []
+    for doc in doc_files(root):
+        text = read_text(doc)
+        if text is None:
+            continue
+        source = doc.relative_to(root).as_posix()
+        for line, target in parse_refs(text):
+            path, symbol = split_target(target)
+            if not path:
+                continue
+            checked += 1
+            finding = {"source": source, "line": line, "target": target}
+            rel = resolve(root, doc, path)
+            if rel is None:
+                hints = index.same_name(path)
+                reason = "file not found"
+                if hints:
+                    reason += f" (did you mean {', '.join(hints[:3])}?)"
+                broken.append({**finding, "reason": reason})
+                continue
+            if not symbol:
+                continue
+            verdict, reason = check_symbol(root, index, rel, symbol)
+            if verdict == "broken":
+                broken.append({**finding, "reason": reason})
+            elif verdict == "ambiguous":
+                ambiguous.append({**finding, "reason": reason})
+    return {
+        "checked": checked,
+        "valid": checked - len(broken) - len(ambiguous),
+        "broken": broken,
+        "ambiguous": ambiguous,
+    }
+
+
+# ─── main ────────────────────────────────────────────────────────────
+
+def format_report(findings: dict) -> str:
+    lines = [
+        "Validate complete",
+        f"  Links checked: {findings['checked']}",
+        f"  Valid: {findings['valid']}",
+        f"  Broken: {len(findings['broken'])}",
+        f"  Ambiguous: {len(findings['ambiguous'])}",
+    ]
+    for kind in ("broken", "ambiguous"):
+        if findings[kind]:
+            lines.append("")
+            lines.append(f"{kind.capitalize()}:")
+            lines.extend(f"  {f['source']}:{f['line']} -> {f['target']} ({f['reason']})"
+                         for f in findings[kind])
+    return "\n".join(lines)
+
+
+def main(argv: list[str]) -> int:
+    args = [a for a in argv[1:] if not a.startswith("--")]
+    as_json = "--json" in argv[1:]
+    root = Path(args[0] if args else os.getcwd()).resolve()
+    claude_dir = root / ".claude"
+    if not claude_dir.is_dir():
+        print(f"ERROR: {claude_dir} does not exist", file=sys.stderr)
+        return 1
+
+    findings = validate(root)
+    sync_dir = claude_dir / ".sync"
+    sync_dir.mkdir(exist_ok=True)
+    (sync_dir / FINDINGS_FILE).write_text(json.dumps(findings, indent=2) + "\n", encoding="utf-8")
+    note(root, refs_checked=findings["checked"], refs_broken=len(findings["broken"]),
+         refs_ambiguous=len(findings["ambiguous"]))
+    print(f"# validate_refs: {findings['checked']} refs, {len(findings['broken'])} broken, "
+          f"{len(findings['ambiguous'])} ambiguous -> .claude/.sync/{FINDINGS_FILE}",
+          file=sys.stderr)
+    print(json.dumps(findings, indent=2) if as_json else format_report(findings))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Compute the file scope of an incremental audit.
+
+Compares the worktree against the commit of the last merged audit (git diff
++ untracked files, as map-sync's changed_dirs.py does) and drops files whose
+content hash still matches the findings store. Falls back to every
+auditable file when there is no previous audit, no git history, or --full.
+Writes the scope to `.claude/.sync/audit-scope.json` for
+`format-findings.py --merge`, and prints it as JSON for the analyzer prompt.
+
+The audit's --focus is recorded with the scope, so the merge only resolves
+findings of that category.
+
+Usage:
+    python3 audit-scope.py [project_root] [--full] [--focus CATEGORY|all]
+                                                   (default root: cwd)
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+from findings_store import CATEGORIES, compute_scope, load_store, save_scope
+
+
+def main() -> int:
+    argv = sys.argv[1:]
+    focus = "all"
+    if "--focus" in argv:
+        idx = argv.index("--focus")
+        focus = argv[idx + 1].lower() if idx + 1 < len(argv) else ""
+        if focus not in (*CATEGORIES, "all"):
+            print(f"ERROR: --focus expects one of: {', '.join(CATEGORIES)}, all",
+                  file=sys.stderr)
+            return 1
+        del argv[idx:idx + 2]
+    args = [a for a in argv if not a.startswith("--")]
+    root = Path(args[0] if args else os.getcwd()).resolve()
+    if not root.is_dir():
+        print(f"ERROR: {root} is not a directory", file=sys.stderr)
+        return 1
+
+    store = load_store(root)
+    scope = compute_scope(root, store, "--full" in argv, focus)
+    save_scope(root, scope)
+    cached = len(store["findings"])
+    focused = f" (focus: {focus})" if focus != "all" else ""
+    if scope["mode"] == "full":
+        print(f"audit-scope: full — {len(scope['files'])} file(s){focused}", file=sys.stderr)
+    else:
+        print(f"audit-scope: incremental since {scope['base'][:12]} — "
+              f"{len(scope['files'])} changed, {len(scope['deleted'])} deleted, "
+              f"{cached} cached finding(s){focused}", file=sys.stderr)
+    print(json.dumps({**scope, "cached_findings": cached}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
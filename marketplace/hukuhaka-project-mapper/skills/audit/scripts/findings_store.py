@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Audit findings store — incremental audit scope and cross-run merge.
+
+A finding is identified by its fingerprint: sha256 over (files, category,
+title), so the same issue re-reported by a later audit matches its earlier
+self. The store keeps every open finding with the content hash of each file
+it names, plus the commit the last audit ran at.
+
+    audit-scope.py       files changed since the last audit (the same git diff
+                         machinery as map-sync's changed_dirs.py), written to
+                         the scope file for the analyzer and the merge
+    format-findings.py   --merge folds one run's findings into the store:
+                         new = fingerprint not stored; persisting = stored and
+                         re-found, or stored and none of its files in scope (or
+                         its category outside the run's focus); resolved =
+                         stored, in scope and focus, not re-found
+
+A focused run (`--focus <category>`) only sees its own category, so it
+resolves nothing outside it and leaves audited_commit and the file hashes
+alone: the next all-category audit still diffs from the last one that
+looked at everything.
+
+Files (machine-local, under .claude/.sync/):
+    audit-findings.json  {"version": 1, "audited_commit": sha|null,
+                          "audited_at": iso, "files": {path: sha256},
+                          "focus": category|"all" (last merged run),
+                          "findings": {fingerprint: finding + "first_seen"}}
+    audit-scope.json     {"mode": "incremental"|"full", "base": sha|null,
+                          "focus": category|"all", "files": [...],
+                          "deleted": [...]}
+
+Library module — no CLI.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+# Reuse map-sync's git helpers and file enumeration (same plugin).
+_SYNC_DIR = Path(__file__).resolve().parents[3] / "scripts" / "sync"
+sys.path.insert(0, str(_SYNC_DIR))
+from changed_dirs import _git, changed_files, commit_valid, head_exists  # noqa: E402
+from skeleton import list_files  # noqa: E402
+
+STORE_FILE = "audit-findings.json"
+SCOPE_FILE = "audit-scope.json"
+STORE_VERSION = 1
+CATEGORIES = ("large-files", "dead-code", "duplicates", "refactoring", "health")
+
+
+def sync_dir(root: Path) -> Path:
+    return root / ".claude" / ".sync"
+
+
+def finding_files(f: dict) -> list[str]:
+    files = f.get("files_affected") or f.get("file") or []
+    if isinstance(files, str):
+        files = [files]
+    # "src/a.py:120-140" and "src/a.py" name the same file
+    return sorted({str(x).split(":", 1)[0] for x in files if x})
+
+
+def fingerprint(f: dict) -> str:
+    key = [finding_files(f), str(f.get("category") or "").lower(),
+           " ".join(str(f.get("title") or "").lower().split())]
+    return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()[:16]
+
+
+def file_hash(root: Path, rel: str) -> str | None:
+    try:
+        return hashlib.sha256((root / rel).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def head_sha(root: Path) -> str | None:
+    if not head_exists(root):
+        return None
+    r = _git(root, "rev-parse", "HEAD")
+    if r.returncode != 0:
+        return None
+    return r.stdout.strip() or None
+
+
+# ─── store / scope files ─────────────────────────────────────────────
+
+def _read(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def load_store(root: Path) -> dict:
+    """The store; an empty one when missing, unreadable, or another version."""
+    data = _read(sync_dir(root) / STORE_FILE)
+    if data.get("version") != STORE_VERSION:
+        data = {}
+    return {
+        "version": STORE_VERSION,
+        "audited_commit": data.get("audited_commit"),
+        "audited_at": data.get("audited_at"),
+        "files": data.get("files") if isinstance(data.get("files"), dict) else {},
+        "focus": data.get("focus") or "all",
+        "findings": data.get("findings") if isinstance(data.get("findings"), dict) else {},
+    }
+
+
+def save_store(root: Path, store: dict) -> None:
+    _write(sync_dir(root) / STORE_FILE, store)
+
+
+def load_scope(root: Path) -> dict | None:
+    data = _read(sync_dir(root) / SCOPE_FILE)
+    return data if data.get("mode") in ("incremental", "full") else None
+
+
+def save_scope(root: Path, scope: dict) -> None:
+    _write(sync_dir(root) / SCOPE_FILE, scope)
+
+
+# ─── scope ───────────────────────────────────────────────────────────
+
+def compute_scope(root: Path, store: dict, full: bool, focus: str = "all") -> dict:
+    """Files the analyzer must look at this run.
+
+    Full (every auditable file) when --full, no store yet, not a git repo, or
+    the last audited commit is gone (history rewrite). Otherwise the git
+    diff since that commit, minus files whose content hash still matches
+    the store (touched and reverted)."""
+    auditable = list_files(root)
+    base = store.get("audited_commit")
+    if full or not store.get("audited_at") or not head_exists(root) \
+            or not base or not commit_valid(root, base):
+        return {"mode": "full", "base": None, "focus": focus, "files": auditable, "deleted": []}
+
+    present = set(auditable)
+    known = store["files"]
+    files: list[str] = []
+    deleted: list[str] = []
+    for rel in changed_files(root, base):
+        if rel in present:
+            if known.get(rel) != file_hash(root, rel):
+                files.append(rel)
+        elif not (root / rel).exists():
+            deleted.append(rel)
+    return {"mode": "incremental", "base": base, "focus": focus, "files": files,
+            "deleted": deleted}
+
+
+# ─── merge ───────────────────────────────────────────────────────────
+
+def merge(root: Path, store: dict, scope: dict, findings: list[dict],
+          now: str) -> tuple[list[dict], list[dict], list[dict]]:
+    """Fold one run's findings into `store` (in place).
+    Returns (new, persisting, resolved) finding lists."""
+    touched = set(scope.get("files", [])) | set(scope.get("deleted", []))
+    full = scope.get("mode") == "full"
+    focus = scope.get("focus") or "all"
+
+    def in_focus(f: dict) -> bool:
+        return focus == "all" or str(f.get("category") or "").lower() == focus
+
+    incoming: dict[str, dict] = {}
+    for f in findings:
+        if isinstance(f, dict):
+            incoming.setdefault(fingerprint(f), f)
+
+    new: list[dict] = []
+    persisting: list[dict] = []
+    resolved: list[dict] = []
+    kept: dict[str, dict] = {}
+    for fp, old in store["findings"].items():
+        if fp in incoming:
+            kept[fp] = {**incoming.pop(fp), "first_seen": old.get("first_seen", now)}
+            persisting.append(kept[fp])
+        elif in_focus(old) and (full or touched.intersection(finding_files(old))):
+            resolved.append(old)
+        else:
+            kept[fp] = old
+            persisting.append(old)
+    for fp, f in incoming.items():
+        kept[fp] = {**f, "first_seen": now}
+        new.append(kept[fp])
+
+    if focus != "all":
+        # the files were only looked at for one category: their hashes (and
+        # the audited commit) must still send them to the next full audit
+        store.update(findings=kept, focus=focus)
+        return new, persisting, resolved
+    hashed = set(scope.get("files", [])) | {p for f in kept.values() for p in finding_files(f)}
+    files = {} if full else {p: h for p, h in store["files"].items()
+                             if p not in touched}
+    for rel in sorted(hashed):
+        h = file_hash(root, rel)
+        if h is not None:
+            files[rel] = h
+    store.update(findings=kept, files=files, focus=focus, audited_commit=head_sha(root),
+                 audited_at=now)
+    return new, persisting, resolved
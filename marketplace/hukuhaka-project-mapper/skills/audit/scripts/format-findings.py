@@ -4,12 +4,23 @@
 Reads analyzer-improve-mode JSON from stdin.
 Writes the priority-grouped audit report to stdout.
 
+With --merge, the run's findings are folded into the findings store
+(.claude/.sync/audit-findings.json, see findings_store.py) against the scope
+audit-scope.py recorded, and the report shows the merged view: every open
+finding tagged [new] or [persisting], then the resolved ones.
+
 Usage:
     cat findings.json | python3 format-findings.py
     echo '{...}' | python3 format-findings.py
+    cat findings.json | python3 format-findings.py --merge [project_root]
 """
+from __future__ import annotations
+
 import json
+import os
 import sys
+from datetime import datetime
+from pathlib import Path
 
 
 PRIORITY_ORDER = [
@@ -19,7 +30,47 @@ PRIORITY_ORDER = [
 ]
 
 
+def finding_line(f: dict, tag: str = "") -> str:
+    files_field = f.get("files_affected") or f.get("file") or []
+    if isinstance(files_field, list):
+        files = ", ".join(files_field) if files_field else "?"
+    else:
+        files = str(files_field)
+    title = f.get("title") or "(untitled)"
+    confidence = f.get("confidence") or "?"
+    effort = f.get("effort") or "?"
+    suggestion = f.get("suggestion") or ""
+    prefix = f"[{tag}] " if tag else ""
+    return f"- {prefix}`{files}` {title} [{confidence}] effort:{effort} — {suggestion}"
+
+
+def merge_findings(argv: list[str], findings: list) -> tuple[list, dict, str, list] | None:
+    """Fold findings into the store; returns (open findings, {id(finding):
+    tag}, delta line, resolved findings), or None after printing an error."""
+    from findings_store import load_scope, load_store, merge, save_store
+
+    args = [a for a in argv if not a.startswith("--")]
+    root = Path(args[0] if args else os.getcwd()).resolve()
+    scope = load_scope(root)
+    if scope is None:
+        print("ERROR: no audit scope recorded — run audit-scope.py before the analyzer",
+              file=sys.stderr)
+        return None
+    store = load_store(root)
+    new, persisting, resolved = merge(root, store, scope, findings,
+                                      datetime.now().isoformat(timespec="seconds"))
+    save_store(root, store)
+    tags = {id(f): "new" for f in new}
+    tags.update({id(f): "persisting" for f in persisting})
+    focus = scope.get("focus") or "all"
+    focused = f", focus: {focus}" if focus != "all" else ""
+    delta = (f"Delta: {len(new)} new, {len(persisting)} persisting, {len(resolved)} resolved "
+             f"({scope['mode']} audit, {len(scope.get('files', []))} file(s) analysed{focused})")
+    return new + persisting, tags, delta, resolved
+
+
 def main() -> int:
+    merging = "--merge" in sys.argv[1:]
     raw = sys.stdin.read().strip()
     if not raw:
         print("ERROR: no JSON on stdin", file=sys.stderr)
@@ -33,6 +84,15 @@ def main() -> int:
     stats = data.get("stats", {}) or {}
     findings = data.get("findings", []) or []
 
+    tags: dict[int, str] = {}
+    resolved: list = []
+    delta = ""
+    if merging:
+        merged = merge_findings(sys.argv[1:], findings)
+        if merged is None:
+            return 1
+        findings, tags, delta, resolved = merged
+
     by_pri: dict[str, list] = {"high": [], "medium": [], "low": []}
     for f in findings:
         p = (f.get("priority") or "low").lower()
@@ -48,16 +108,12 @@ def main() -> int:
             continue
         print(f"### {label} ({len(items)} items)")
         for f in items:
-            files_field = f.get("files_affected") or f.get("file") or []
-            if isinstance(files_field, list):
-                files = ", ".join(files_field) if files_field else "?"
-            else:
-                files = str(files_field)
-            title = f.get("title") or "(untitled)"
-            confidence = f.get("confidence") or "?"
-            effort = f.get("effort") or "?"
-            suggestion = f.get("suggestion") or ""
-            print(f"- `{files}` {title} [{confidence}] effort:{effort} — {suggestion}")
+            print(finding_line(f, tags.get(id(f), "")))
+        print()
+    if resolved:
+        print(f"### Resolved ({len(resolved)} items)")
+        for f in resolved:
+            print(finding_line(f))
         print()
 
     files_scanned = stats.get("files_scanned", "?")
@@ -72,6 +128,8 @@ def main() -> int:
         f"Stats: {files_scanned} files scanned, {cats_checked} categories checked, "
         f"{total} total findings ({high_c} high-confidence, {med_c} medium, {low_c} low)"
     )
+    if delta:
+        print(delta)
     return 0
 
 
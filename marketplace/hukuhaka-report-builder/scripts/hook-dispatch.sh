@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+# hook-dispatch.sh — single entry point for this plugin's per-tool-call hooks.
+# Wired by hooks/hooks.json as `hook-dispatch.sh <route>`.
+#
+# Per-tool-call hooks run on every agent action, so the dispatcher reads the
+# event JSON with a shell builtin and rejects payloads that cannot match with
+# a glob — no Python start, no subprocess. Only a possible match is handed on
+# (stdin = the same event JSON) to the real handler, which re-checks exactly.
+#
+# Routes:
+#   pre-write   PreToolUse Write|Edit → hook-validate-spec.sh, only when the
+#               payload mentions a .claude…reports path (the spec-lock scope;
+#               the glob also covers JSON-escaped slashes).
+#
+# Always exits 0 on a filtered-out payload (= allow); otherwise the handler's
+# exit code (also always 0 — see hook-validate-spec.sh).
+set -u
+
+IFS= read -r -d '' IN || true
+case "${BASH_SOURCE[0]}" in  # parameter expansion, not $(dirname): no fork
+    */*) HERE="${BASH_SOURCE[0]%/*}" ;;
+    *) HERE=. ;;
+esac
+
+case "${1:-}" in
+    pre-write)
+        case "$IN" in
+            *.claude*reports*) ;;
+            *) exit 0 ;;
+        esac
+        exec bash "$HERE/hook-validate-spec.sh" <<<"$IN"
+        ;;
+esac
+
+exit 0
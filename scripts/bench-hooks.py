@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Per-tool-call hook latency benchmark. Pure Python stdlib.
+
+Every Bash / Write / Edit tool call pays for the plugins' PreToolUse and
+PostToolUse hooks before the agent can move on. This runs each hook the way
+Claude Code does — a fresh process, event JSON on stdin — and prints p50/p99
+wall latency per tool call for:
+
+  before  the handler the hook used to invoke directly (python3
+          sync_cost.py, hook-validate-spec.sh, overwrite-nudge.sh,
+          append-entry-nudge.sh)
+  after   the plugin's hook-dispatch.sh route, which filters out payloads
+          that cannot match without starting Python or any subprocess
+
+Each hook is measured on a typical non-matching payload (the common case:
+an ordinary command or source edit) and on a matching one (the dispatcher
+then adds one exec on top of the handler).
+
+Usage:
+  scripts/bench-hooks.py [--runs N]     (default 100 runs per case)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+MARKET = REPO_DIR / "marketplace"
+
+
+def bash_event(command, **extra):
+    return {"tool_name": "Bash", "tool_input": {"command": command}, **extra}
+
+
+def write_event(file_path, content="x\n"):
+    return {"tool_name": "Write", "tool_input": {"file_path": file_path, "content": content}}
+
+
+def cases(work):
+    """(hook, payload label, plugin, before argv, dispatch route, event)."""
+    mapper, ltm, report = "hukuhaka-project-mapper", "hukuhaka-ltm", "hukuhaka-report-builder"
+    transcript = work / "transcript.jsonl"
+    ctx = {"cwd": str(work), "transcript_path": str(transcript)}
+    sync_cost = ["python3", str(MARKET / mapper / "scripts/sync/sync_cost.py")]
+    spec = ["bash", str(MARKET / report / "scripts/hook-validate-spec.sh")]
+    nudge = ["bash", str(MARKET / ltm / "scripts/overwrite-nudge.sh")]
+    append = ["bash", str(MARKET / ltm / "scripts/append-entry-nudge.sh")]
+    return [
+        ("sync_cost (PostToolUse Bash)", "ordinary command", mapper, sync_cost, "post-bash",
+         bash_event("git status --short", **ctx)),
+        ("sync_cost (PostToolUse Bash)", "record-sync marker", mapper, sync_cost, "post-bash",
+         bash_event("bash record-sync.sh --step write", **ctx)),
+        ("validate-spec (PreToolUse Write)", "source file", report, spec, "pre-write",
+         write_event(str(work / "src/app.py"))),
+        ("validate-spec (PreToolUse Write)", "report artifact", report, spec, "pre-write",
+         write_event(str(work / ".claude/reports/r/report.html"))),
+        ("overwrite-nudge (PreToolUse Write)", "source file", ltm, nudge, "pre-edit",
+         write_event(str(work / "src/app.py"))),
+        ("overwrite-nudge (PreToolUse Write)", "ltm index card", ltm, nudge, "pre-edit",
+         write_event(str(work / ".claude/ltm/index/topic.md"))),
+        ("append-entry-nudge (PreToolUse Bash)", "ordinary command", ltm, append, "pre-bash",
+         bash_event("git status --short")),
+        ("append-entry-nudge (PreToolUse Bash)", "append-entry.py", ltm, append, "pre-bash",
+         bash_event("python3 scripts/append-entry.py --topic x")),
+    ]
+
+
+def measure(argv, payload, env, cwd, runs):
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(argv, input=payload, env=env, cwd=cwd,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def main():
+    runs = 100
+    if "--runs" in sys.argv:
+        try:
+            runs = int(sys.argv[sys.argv.index("--runs") + 1])
+        except (IndexError, ValueError):
+            runs = 0
+        if runs <= 0:
+            print("ERROR: --runs requires a positive integer", file=sys.stderr)
+            return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        (work / ".claude").mkdir()
+        (work / "transcript.jsonl").write_text("", encoding="utf-8")
+        print(f"hook latency per tool call, {runs} runs each (ms)")
+        print(f"  {'hook':<37} {'payload':<19} {'before p50/p99':>15} {'after p50/p99':>15}")
+        for hook, label, plugin, before, route, event in cases(work):
+            env = dict(os.environ, CLAUDE_PLUGIN_ROOT=str(MARKET / plugin))
+            payload = json.dumps(event).encode("utf-8")
+            after = [str(MARKET / plugin / "scripts/hook-dispatch.sh"), route]
+            b50, b99 = measure(before, payload, env, tmp, runs)
+            a50, a99 = measure(after, payload, env, tmp, runs)
+            print(f"  {hook:<37} {label:<19} {b50:>7.1f}/{b99:<7.1f} {a50:>7.1f}/{a99:<7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
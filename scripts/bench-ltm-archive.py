@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+LTM cold archive benchmark. Pure Python stdlib.
+
+Builds a synthetic month-sharded store (20,000 entries by default, spread
+evenly over the last 24 months, bodies of 1-8 KB, every entry cited by a
+card) and times the scans that walk log/ before and after
+`distill.py archive` moves entries older than 180 days into
+archive/YYYY-MM.l3.gz:
+
+  reproject --full       re-reads every card and every entry in log/
+  metadata index build   ltm_index.refresh() with no index on disk
+
+then the cost of reaching an archived entry by id: distill.find_entry()
+reads archive/index.json, seeks to one gzip member and inflates it.
+Bytes are what the process asked the kernel for (rchar in /proc/self/io;
+n/a where that file does not exist).
+
+Usage:
+  scripts/bench-ltm-archive.py [--entries N]     (default 20000)
+"""
+
+import datetime as dt
+import io
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR / "marketplace" / "hukuhaka-ltm" / "scripts"))
+
+import distill  # noqa: E402
+import ltm_index  # noqa: E402
+
+KINDS = ["decision", "finding", "anti-pattern", "rule-evolution"]
+WORDS = ("hook session budget cache transcript distill card entry index shard "
+         "reproject recall pinned evidence summary context").split()
+DAYS = 730
+
+
+def rchar():
+    try:
+        for line in Path("/proc/self/io").read_text().splitlines():
+            if line.startswith("rchar:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def make_tree(root, n):
+    rng = random.Random(5)
+    log = root / "log"
+    index = root / "index"
+    log.mkdir(parents=True)
+    index.mkdir()
+    today = dt.date.today()
+    ids = []
+    for i in range(n):
+        day = today - dt.timedelta(days=DAYS * (n - i) // n)
+        eid = f"entry-{i}-{i * 2654435761 % 16**6:06x}"
+        ids.append(eid)
+        body = " ".join(rng.choice(WORDS) for _ in range(rng.randint(150, 1300)))
+        path = distill.entry_path(log, f"{day.isoformat()}-entry-{i}.md")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            f"---\nid: {eid}\ntimestamp: {day.isoformat()}T00:00:00Z\n"
+            f"kind: {rng.choice(KINDS)}\ntier: l3\n---\n\n# Entry {i}\n\n{body}\n",
+            encoding="utf-8",
+        )
+    for c in range(0, n, 20):
+        evidence = ", ".join(ids[c:c + 20])
+        (index / f"card-{c // 20}.md").write_text(
+            f"---\ntopic: card {c // 20}\nsummary: s\ncontext: c\nevidence: [{evidence}]\n"
+            f"last-updated: {today.isoformat()}\n---\n\n# Card {c // 20}\n\nbody\n",
+            encoding="utf-8",
+        )
+    return ids
+
+
+def timed(label, fn):
+    before = rchar()
+    t0 = time.perf_counter()
+    fn()
+    ms = (time.perf_counter() - t0) * 1000
+    after = rchar()
+    read = f"{(after - before) / 2**20:>9.1f} MB" if before is not None else "      n/a"
+    print(f"  {label:<28} {read} {ms:>9.0f} ms")
+
+
+def scans(root):
+    timed("reproject --full", lambda: distill._reproject_internal(root, full=True))
+    (root / ltm_index.INDEX_FILE).unlink(missing_ok=True)
+    timed("metadata index build", lambda: ltm_index.refresh(root))
+
+
+def main():
+    n = 20000
+    if "--entries" in sys.argv:
+        try:
+            n = int(sys.argv[sys.argv.index("--entries") + 1])
+        except (IndexError, ValueError):
+            n = 0
+        if n <= 0:
+            print("ERROR: --entries requires a positive integer", file=sys.stderr)
+            return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        ids = make_tree(root, n)
+        # the first reproject writes distilled-into on every entry and
+        # builds the recall indexes
+        distill._reproject_internal(root)
+        print(f"{n} entries over {DAYS} days, all cited")
+        print(f"  {'before archive':<28} {'bytes read':>12} {'wall':>12}")
+        scans(root)
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            distill.cmd_archive(root, distill.ARCHIVE_AFTER_DAYS)
+        hot = len(distill.log_files(distill.find_log_dir(root)))
+        packed = sum(p.stat().st_size
+                     for p in distill.find_archive_dir(root).glob("*" + distill.ARCHIVE_SUFFIX))
+        print()
+        print(f"archived {n - hot} entries into {packed / 2**20:.1f} MB; {hot} left in log/")
+        print(f"  {'after archive':<28} {'bytes read':>12} {'wall':>12}")
+        scans(root)
+
+        print()
+        rng = random.Random(9)
+        sample = rng.sample(ids[: n - hot], min(200, n - hot))
+        samples = []
+        for eid in sample:
+            t0 = time.perf_counter()
+            where, text = distill.find_entry(root, eid)
+            samples.append((time.perf_counter() - t0) * 1000)
+            assert f"id: {eid}" in text, where
+        samples.sort()
+        print(f"cold lookup by id, {len(samples)} ids: "
+              f"p50 {samples[len(samples) // 2]:.2f} ms, p99 "
+              f"{samples[min(len(samples) - 1, int(len(samples) * 0.99))]:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
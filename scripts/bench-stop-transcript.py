@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+LTM Stop-hook transcript read benchmark. Pure Python stdlib.
+
+The hukuhaka-ltm Stop hook runs at the end of every turn and needs only the
+last assistant text message of the session transcript. This builds
+synthetic transcripts of growing size (a realistic mix of user prompts,
+assistant text, tool calls and large tool results, ending mid-turn on a
+few tool records) and times, per size:
+
+  readlines   the previous reader — whole file read, walked backwards
+  tail seek   stop-autonomous-append.find_last_assistant_text() — blocks
+              read backwards from EOF until the last assistant text
+
+The tail-seek column should stay flat as the transcript grows.
+
+Usage:
+  scripts/bench-stop-transcript.py [--runs N]     (default 20 runs per size)
+"""
+
+import importlib.util
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+HOOK = REPO_DIR / "marketplace" / "hukuhaka-ltm" / "scripts" / "stop-autonomous-append.py"
+SIZES_MB = [1, 10, 50, 100]
+
+
+def load_hook():
+    spec = importlib.util.spec_from_file_location("stop_autonomous_append", HOOK)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def readlines_reader(transcript_path):
+    """The hook's reader before tail seeking, kept for comparison."""
+    with open(transcript_path, encoding="utf-8", errors="ignore") as f:
+        lines = f.readlines()
+    for line in reversed(lines):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except Exception:
+            continue
+        if obj.get("type") != "assistant":
+            continue
+        content = obj.get("message", {}).get("content", [])
+        parts = [p.get("text", "") for p in content
+                 if isinstance(p, dict) and p.get("type") == "text"] if isinstance(content, list) else [content]
+        if parts:
+            return "\n".join(parts), obj.get("uuid", "")
+    return None, ""
+
+
+def record(rng, i):
+    r = rng.random()
+    if r < 0.15:
+        return {"type": "user", "uuid": f"u{i}", "message": {"content": "please " * rng.randint(5, 60)}}
+    if r < 0.35:
+        return {"type": "assistant", "uuid": f"a{i}",
+                "message": {"content": [{"type": "text", "text": "reply " * rng.randint(20, 400)}]}}
+    if r < 0.65:
+        return {"type": "assistant", "uuid": f"a{i}",
+                "message": {"content": [{"type": "tool_use", "name": "Bash",
+                                         "input": {"command": "ls -la"}}]}}
+    return {"type": "user", "uuid": f"u{i}",
+            "message": {"content": [{"type": "tool_result",
+                                     "content": "out " * rng.randint(50, 6000)}]}}
+
+
+def make_transcript(path, size_mb, rng):
+    target = size_mb * 2**20
+    written = 0
+    i = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            line = json.dumps(record(rng, i)) + "\n"
+            f.write(line)
+            written += len(line)
+            i += 1
+        # end of turn: last text, then a few tool records after it
+        f.write(json.dumps({"type": "assistant", "uuid": "last", "message": {"content": [
+            {"type": "text", "text": '<ltm-record kind="decision" title="t">b</ltm-record>'}]}}) + "\n")
+        for j in range(4):
+            f.write(json.dumps({"type": "user", "uuid": f"r{j}", "message": {"content": [
+                {"type": "tool_result", "content": "out " * 2000}]}}) + "\n")
+
+
+def measure(fn, path, runs):
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        text, uuid = fn(str(path))
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert uuid == "last", uuid
+    samples.sort()
+    return samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def main():
+    runs = 20
+    if "--runs" in sys.argv:
+        try:
+            runs = int(sys.argv[sys.argv.index("--runs") + 1])
+        except (IndexError, ValueError):
+            runs = 0
+        if runs <= 0:
+            print("ERROR: --runs requires a positive integer", file=sys.stderr)
+            return 1
+
+    hook = load_hook()
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"last assistant text lookup, {runs} runs each (ms)")
+        print(f"  {'transcript':>10} {'readlines p50/p99':>19} {'tail seek p50/p99':>19}")
+        for size in SIZES_MB:
+            path = Path(tmp) / f"t{size}.jsonl"
+            make_transcript(path, size, rng)
+            b50, b99 = measure(readlines_reader, path, runs)
+            a50, a99 = measure(hook.find_last_assistant_text, path, runs)
+            print(f"  {size:>7} MB {b50:>9.1f}/{b99:<9.1f} {a50:>9.2f}/{a99:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())